@@ -0,0 +1,143 @@
+"""
+Columnar wire format for ``/api/models``.
+
+The row format repeats every key in every ``allocationHistory`` and
+``profitHistory`` entry and sends each allocation twice (``allocations`` and
+``allocations_array``). The columnar variant sends each history as parallel
+arrays. Allocations become a dense weight matrix per model whose columns index
+into one symbol dictionary shared by all models. Per-symbol metadata (url,
+question) is sent once, next to that dictionary.
+
+``since`` keeps only history points strictly newer than the given timestamp,
+so a polling client can fetch just the points it has not seen yet. Symbol
+indices are assigned over the full data, so they agree between a full fetch
+and any delta of the same data version.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for ?format=msgpack
+    msgpack = None
+
+COLUMNAR_VERSION = 1
+
+# Keys turned into columns; everything else on a model is passed through
+_HISTORY_KEYS = ("allocationHistory", "profitHistory")
+_LLM_KEYS = ("llm_input", "llm_output")
+
+
+def normalize_since(since: Optional[str]) -> Optional[str]:
+    """``since`` as a naive ISO timestamp comparable with the stored ones.
+
+    Raises ``ValueError`` for anything ``datetime.fromisoformat`` rejects.
+    """
+    if not since:
+        return None
+    return datetime.fromisoformat(since).replace(tzinfo=None).isoformat()
+
+
+class SymbolTable:
+    def __init__(self) -> None:
+        self.symbols: List[str] = []
+        self.meta: List[Optional[Dict[str, Any]]] = []
+        self._index: Dict[str, int] = {}
+
+    def index(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        if idx is None:
+            idx = self._index[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.meta.append(None)
+        return idx
+
+    def describe(self, symbol: str, info: Dict[str, Any]) -> None:
+        extra = {k: v for k, v in info.items() if k not in ("name", "allocation")}
+        if extra:
+            idx = self.index(symbol)
+            self.meta[idx] = {**(self.meta[idx] or {}), **extra}
+
+
+def _allocation_columns(
+    history: List[Dict[str, Any]], table: SymbolTable
+) -> Dict[str, Any]:
+    columns: List[int] = []
+    position: Dict[int, int] = {}
+    for snapshot in history:
+        for symbol in snapshot.get("allocations") or {}:
+            idx = table.index(symbol)
+            if idx not in position:
+                position[idx] = len(columns)
+                columns.append(idx)
+
+    weights = []
+    for snapshot in history:
+        row = [0.0] * len(columns)
+        for symbol, weight in (snapshot.get("allocations") or {}).items():
+            row[position[table.index(symbol)]] = weight
+        weights.append(row)
+
+    result = {
+        "timestamps": [s.get("timestamp") for s in history],
+        "total_value": [s.get("total_value") for s in history],
+        "profit": [s.get("profit") for s in history],
+        "performance": [s.get("performance") for s in history],
+        "columns": columns,
+        "weights": weights,
+    }
+    # the compact view keeps the LLM transcript of the last snapshot only
+    if history and any(history[-1].get(key) is not None for key in _LLM_KEYS):
+        result["last_llm"] = {key: history[-1].get(key) for key in _LLM_KEYS}
+    return result
+
+
+def _profit_columns(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "timestamps": [p.get("timestamp") for p in history],
+        "profit": [p.get("profit") for p in history],
+        "totalValue": [p.get("totalValue") for p in history],
+    }
+
+
+def _newer(history: List[Dict[str, Any]], since: Optional[str]) -> List:
+    if since is None:
+        return history
+    return [entry for entry in history if (entry.get("timestamp") or "") > since]
+
+
+def to_columnar(models: List[Dict[str, Any]], since: Optional[str] = None) -> Dict:
+    """Columnar payload for ``models``; ``since`` must be normalized."""
+    # index every symbol of the full data so indices are the same for any since
+    table = SymbolTable()
+    for model in models:
+        for snapshot in model.get("allocationHistory") or []:
+            for symbol in snapshot.get("allocations") or {}:
+                table.index(symbol)
+            for info in snapshot.get("allocations_array") or []:
+                table.describe(info["name"], info)
+
+    out = []
+    for model in models:
+        columnar = {k: v for k, v in model.items() if k not in _HISTORY_KEYS}
+        columnar["allocationHistory"] = _allocation_columns(
+            _newer(model.get("allocationHistory") or [], since), table
+        )
+        columnar["profitHistory"] = _profit_columns(
+            _newer(model.get("profitHistory") or [], since)
+        )
+        out.append(columnar)
+    return {
+        "version": COLUMNAR_VERSION,
+        "since": since,
+        "symbols": table.symbols,
+        "symbol_meta": table.meta,
+        "models": out,
+    }
+
+
+def encode_msgpack(data: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(data, use_bin_type=True)
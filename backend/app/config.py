@@ -20,6 +20,9 @@ FRONTEND_BUILD = os.path.join(FRONTEND_ROOT, "build")
 MODELS_DATA_FILE = os.path.join(BACKEND_ROOT, "models_data.json")
 MODELS_DATA_HIST_FILE = os.path.join(BACKEND_ROOT, "models_data_hist.json")
 MODELS_DATA_INIT_FILE = os.path.join(BACKEND_ROOT, "models_data_init.json")
+MODELS_HISTORY_DIR = os.path.join(BACKEND_ROOT, "models_history")
+TRANSCRIPTS_DIR = os.path.join(BACKEND_ROOT, "transcripts")
+PRICE_TICKS_FILE = os.path.join(MODELS_HISTORY_DIR, "price_ticks.jsonl")
 BACKTEST_RESULTS_FILE = os.path.join(BACKEND_ROOT, "backtest_results.json")
 NEWS_DATA_FILE = os.path.join(BACKEND_ROOT, "news_data.json")
 SOCIAL_DATA_FILE = os.path.join(BACKEND_ROOT, "social_data.json")
@@ -59,6 +62,7 @@ UPDATE_FREQUENCY = {
     "trading_cycle": "daily_before_close",
     "realtime_prices": 600,  # Stock prices: 10 minutes
     "polymarket_prices": 1800,  # Polymarket prices: 30 minutes by default
+    "models_checkpoint": 3600,  # Rewrite models_data.json from price ticks hourly
 }
 
 TRADING_CONFIG = {
@@ -77,6 +81,9 @@ MARKET_HOURS = {
     "run_before_close_minutes": 60,
 }
 
+# Serve cached data immediately and build the trading systems in the background
+LAZY_STARTUP = os.environ.get("LTB_LAZY_STARTUP", "").lower() in ("1", "true", "yes")
+
 SERVER_CONFIG = {
     "default_port": 5001,
     "workers": 1,
@@ -115,10 +122,30 @@ def get_data_file_path(file_type: str) -> str:
     return mapping[file_type]
 
 
+def stock_calendar():
+    """The NYSE calendar with the session hours and days of ``MARKET_HOURS``.
+
+    Holidays and early closes still come from the exchange rules.
+    """
+    from live_trade_bench.utils.market_calendar import MarketCalendar
+
+    weekmask = "".join(
+        "1" if day in MARKET_HOURS["trading_days"] else "0" for day in range(7)
+    )
+    return MarketCalendar(
+        "NYSE",
+        tz="US/Eastern",
+        weekmask=weekmask,
+        open_time=datetime.strptime(MARKET_HOURS["stock_open"], "%H:%M").time(),
+        close_time=datetime.strptime(MARKET_HOURS["stock_close"], "%H:%M").time(),
+        holidays=True,
+    )
+
+
 def is_trading_day() -> bool:
     utc_now = datetime.now(pytz.UTC)
     est_now = utc_now.astimezone(pytz.timezone("US/Eastern"))
-    return est_now.weekday() in MARKET_HOURS["trading_days"]
+    return stock_calendar().is_session(est_now.date())
 
 
 def should_run_trading_cycle() -> bool:
@@ -126,18 +153,7 @@ def should_run_trading_cycle() -> bool:
 
 
 def is_market_hours() -> bool:
-    if not is_trading_day():
-        return False
-
-    utc_now = datetime.now(pytz.UTC)
-    est_now = utc_now.astimezone(pytz.timezone("US/Eastern"))
-
-    stock_open = datetime.strptime(MARKET_HOURS["stock_open"], "%H:%M").time()
-    stock_close = datetime.strptime(MARKET_HOURS["stock_close"], "%H:%M").time()
-
-    current_time = est_now.time()
-
-    return stock_open <= current_time <= stock_close
+    return stock_calendar().is_open(datetime.now(pytz.UTC))
 
 
 class MockMode(str, Enum):
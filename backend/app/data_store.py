@@ -0,0 +1,173 @@
+"""
+In-process cache for the JSON files served by the API.
+
+Each file is parsed once and kept together with its pre-encoded response body
+and an ETag. Entries are reloaded when the file's mtime/size changes, and the
+backend writers go through ``write_json`` so the cache is refreshed without a
+re-read. Handlers therefore return cached bytes instead of parsing megabytes
+of JSON on every dashboard poll.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# derived views kept per entry (e.g. one per distinct query string)
+MAX_DERIVED_VIEWS = 128
+
+
+def encode_json(data: Any) -> bytes:
+    # Same compact encoding as FastAPI's JSONResponse
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def atomic_write_bytes(path: str, body: bytes) -> None:
+    """Write via a temp file in the same directory and ``os.replace`` it in.
+
+    Readers see either the old or the new file, never a partial one.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 4) -> None:
+    atomic_write_bytes(path, json.dumps(data, indent=indent).encode("utf-8"))
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class CachedJSON:
+    """One parsed file plus its encoded body; treat ``data`` as read-only."""
+
+    __slots__ = ("data", "body", "etag", "_stat", "_derived", "_lock")
+
+    def __init__(
+        self,
+        data: Any,
+        stat: Optional[Tuple[int, int]] = None,
+        body: Optional[bytes] = None,
+    ) -> None:
+        self.data = data
+        self.body = encode_json(data) if body is None else body
+        self.etag = make_etag(self.body)
+        self._stat = stat
+        self._derived: Dict[Hashable, Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def derived(
+        self,
+        key: Hashable,
+        build: Callable[[Any], Any],
+        encode: Callable[[Any], bytes] = encode_json,
+    ) -> Tuple[bytes, str]:
+        """Encoded body and ETag of ``build(data)``, memoized per ``key``."""
+        with self._lock:
+            cached = self._derived.get(key)
+        if cached is None:
+            body = encode(build(self.data))
+            cached = (body, make_etag(body))
+            with self._lock:
+                if len(self._derived) >= MAX_DERIVED_VIEWS:
+                    # drop the oldest view
+                    self._derived.pop(next(iter(self._derived)))
+                self._derived[key] = cached
+        return cached
+
+
+def _file_stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class JSONDataStore:
+    def __init__(self) -> None:
+        self._entries: Dict[str, CachedJSON] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[CachedJSON]:
+        """Cached entry for ``path``, reloading it if the file changed.
+
+        Returns ``None`` when the file does not exist. If the file cannot be
+        parsed (e.g. caught mid-write) the previous entry is served; with no
+        previous entry the ``ValueError`` propagates.
+        """
+        stat = _file_stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        if stat is None:
+            return None
+        if entry is not None and entry._stat == stat:
+            return entry
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except ValueError:
+            if entry is not None:
+                logger.warning(f"Serving previous copy of unreadable {path}")
+                return entry
+            raise
+        fresh = CachedJSON(data, stat)
+        with self._lock:
+            self._entries[path] = fresh
+        return fresh
+
+    def write_json(self, path: str, data: Any) -> None:
+        """Write ``data`` to ``path`` and refresh the cached entry in place.
+
+        The body is encoded before anything is written, so data the API could
+        not serve (e.g. NaN) raises and leaves the previous file in place.
+        """
+        body = encode_json(data)
+        atomic_write_bytes(path, body)
+        entry = CachedJSON(data, _file_stat(path), body)
+        with self._lock:
+            self._entries[path] = entry
+
+    def publish(self, path: str, data: Any, base: CachedJSON) -> CachedJSON:
+        """Serve ``data`` for ``path`` without writing the file.
+
+        The entry keeps ``base``'s file stat, so it is replaced by a fresh read
+        as soon as the file on disk changes.
+        """
+        entry = CachedJSON(data, base._stat)
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+data_store = JSONDataStore()
@@ -0,0 +1,256 @@
+"""
+Scheduler job isolation, shared-state locks and per-job metrics.
+
+Jobs run on separate executors per job class, so a slow news scrape cannot
+hold the threads the price updaters need. Every job is wrapped by
+``JobMonitor.wrap``. The wrapper takes the named locks for the system state
+and files the job touches, then records its scheduling lag (actual start
+minus scheduled run time), how long it waited for its locks and its duration
+once it held them. ``/api/schedule/jobs`` reports the numbers. The scheduled
+time comes from the executor, which records it before handing the job to a
+worker thread.
+
+Jobs that spend most of their time on the network (news and social scraping)
+take no locks through the wrapper. They hold a system's lock only while they
+read from it, so the trading cycle never waits on a scrape.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, JobEvent
+from apscheduler.executors.pool import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Shared state guarded by the lock manager
+STOCK_SYSTEM = "stock_system"
+POLYMARKET_SYSTEM = "polymarket_system"
+BITMEX_SYSTEM = "bitmex_system"
+ALL_SYSTEMS = (STOCK_SYSTEM, POLYMARKET_SYSTEM, BITMEX_SYSTEM)
+MODELS_DATA = "models_data"
+
+# Worker threads per job class
+EXECUTOR_WORKERS = {
+    "trading": 1,
+    "prices": 3,
+    "content": 2,
+    "default": 1,
+}
+
+JOB_DEFAULTS = {
+    # run a backlog of missed runs once, never stack instances of one job
+    "coalesce": True,
+    "max_instances": 1,
+    "misfire_grace_time": 300,
+}
+
+
+class MonitoredThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool that tells the monitor when each submission was due.
+
+    ``EVENT_JOB_SUBMITTED`` is dispatched only after the job is in the pool,
+    so an idle worker can start it first; recording here cannot be late.
+    """
+
+    def __init__(self, monitor: "JobMonitor", max_workers: int = 10) -> None:
+        super().__init__(max_workers=max_workers)
+        self._monitor = monitor
+
+    def _do_submit_job(self, job: Any, run_times: Sequence[Any]) -> None:
+        if run_times:
+            # coalesced runs start once, late by the newest miss
+            self._monitor.submitted(job.id, run_times[-1].timestamp())
+        super()._do_submit_job(job, run_times)
+
+
+def build_executors(
+    monitor: Optional["JobMonitor"] = None,
+) -> Dict[str, ThreadPoolExecutor]:
+    monitor = monitor or job_monitor
+    return {
+        name: MonitoredThreadPoolExecutor(monitor, max_workers=workers)
+        for name, workers in EXECUTOR_WORKERS.items()
+    }
+
+
+class LockManager:
+    def __init__(self) -> None:
+        self._locks: Dict[str, threading.RLock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> threading.RLock:
+        with self._lock:
+            lock = self._locks.get(name)
+            if lock is None:
+                lock = self._locks[name] = threading.RLock()
+            return lock
+
+    @contextmanager
+    def hold(self, *names: str, blocking: bool = True) -> Iterator[bool]:
+        """Acquire the named locks in sorted order; yields whether it got them.
+
+        With ``blocking=False`` nothing is held (and ``False`` is yielded) if
+        any of the locks is busy.
+        """
+        acquired = []
+        try:
+            for name in sorted(set(names)):
+                lock = self.get(name)
+                if not lock.acquire(blocking=blocking):
+                    break
+                acquired.append(lock)
+            else:
+                yield True
+                return
+            yield False
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+
+class JobStats:
+    __slots__ = (
+        "runs",
+        "failures",
+        "skipped_busy",
+        "missed",
+        "max_instances_reached",
+        "running",
+        "last_started",
+        "last_duration",
+        "total_duration",
+        "max_duration",
+        "last_lag",
+        "max_lag",
+        "last_lock_wait",
+        "max_lock_wait",
+        "last_error",
+    )
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.failures = 0
+        self.skipped_busy = 0
+        self.missed = 0
+        self.max_instances_reached = 0
+        self.running = 0
+        self.last_started: Optional[float] = None
+        self.last_duration: Optional[float] = None
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_lag: Optional[float] = None
+        self.max_lag = 0.0
+        self.last_lock_wait: Optional[float] = None
+        self.max_lock_wait = 0.0
+        self.last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["avg_duration"] = (
+            round(self.total_duration / self.runs, 3) if self.runs else None
+        )
+        return data
+
+
+class JobMonitor:
+    def __init__(
+        self,
+        locks: Optional[LockManager] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.locks = locks or LockManager()
+        self._clock = clock
+        self._stats: Dict[str, JobStats] = {}
+        # scheduled run time of the submission each job is about to start
+        self._scheduled: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _job(self, job_id: str) -> JobStats:
+        stats = self._stats.get(job_id)
+        if stats is None:
+            stats = self._stats[job_id] = JobStats()
+        return stats
+
+    def wrap(
+        self,
+        job_id: str,
+        func: Callable[[], Any],
+        locks: Sequence[str] = (),
+        wait: bool = True,
+    ) -> Callable[[], None]:
+        """``func`` holding ``locks`` and recording metrics under ``job_id``.
+
+        With ``wait=False`` the run is skipped (and counted) while another job
+        holds one of the locks, instead of queueing behind it.
+        """
+
+        def run() -> None:
+            started = self._clock()
+            with self._lock:
+                stats = self._job(job_id)
+                scheduled = self._scheduled.pop(job_id, None)
+                if scheduled is not None:
+                    stats.last_lag = round(max(0.0, started - scheduled), 3)
+                    stats.max_lag = max(stats.max_lag, stats.last_lag)
+            with self.locks.hold(*locks, blocking=wait) as acquired:
+                if not acquired:
+                    with self._lock:
+                        stats.skipped_busy += 1
+                    logger.info(f"⏭️ Skipping {job_id}: shared state is busy")
+                    return
+                locked = self._clock()
+                with self._lock:
+                    stats.running += 1
+                    stats.last_started = started
+                    stats.last_lock_wait = round(locked - started, 3)
+                    stats.max_lock_wait = max(stats.max_lock_wait, stats.last_lock_wait)
+                error: Optional[BaseException] = None
+                try:
+                    func()
+                except BaseException as exc:
+                    error = exc
+                    raise
+                finally:
+                    duration = round(self._clock() - locked, 3)
+                    with self._lock:
+                        stats.running -= 1
+                        stats.runs += 1
+                        stats.last_duration = duration
+                        stats.total_duration += duration
+                        stats.max_duration = max(stats.max_duration, duration)
+                        if error is not None:
+                            stats.failures += 1
+                            stats.last_error = str(error)
+
+        run.__name__ = getattr(func, "__name__", job_id)
+        return run
+
+    def submitted(self, job_id: str, scheduled: float) -> None:
+        """Record the scheduled run time of the submission about to start."""
+        with self._lock:
+            self._scheduled[job_id] = scheduled
+
+    def listener(self, event: JobEvent) -> None:
+        with self._lock:
+            stats = self._job(event.job_id)
+            if event.code == EVENT_JOB_MISSED:
+                stats.missed += 1
+            elif event.code == EVENT_JOB_MAX_INSTANCES:
+                stats.max_instances_reached += 1
+
+    def attach(self, scheduler: Any) -> None:
+        scheduler.add_listener(
+            self.listener, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+        )
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {job_id: stats.to_dict() for job_id, stats in self._stats.items()}
+
+
+lock_manager = LockManager()
+job_monitor = JobMonitor(lock_manager)
@@ -1,19 +1,19 @@
 import json
 import logging
 import os
-import shutil
+import threading
 from datetime import datetime
 
-from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from live_trade_bench.accounts import configure_transcript_store
 from live_trade_bench.mock.mock_system import (
     MockAgentFetcherPolymarketSystem,
     MockAgentFetcherStockSystem,
@@ -31,31 +31,43 @@ from live_trade_bench.systems import (
 from .config import (
     ALLOWED_ORIGINS,
     BITMEX_MOCK_MODE,
+    LAZY_STARTUP,
     MODELS_DATA_FILE,
-    MODELS_DATA_HIST_FILE,
     MODELS_DATA_INIT_FILE,
     POLYMARKET_MOCK_MODE,
     STOCK_MOCK_MODE,
+    TRANSCRIPTS_DIR,
     UPDATE_FREQUENCY,
     MockMode,
     get_base_model_configs,
     should_run_trading_cycle,
 )
+from .jobs import (
+    ALL_SYSTEMS,
+    BITMEX_SYSTEM,
+    JOB_DEFAULTS,
+    MODELS_DATA,
+    build_executors,
+    job_monitor,
+    lock_manager,
+)
 from .models_data import generate_models_data, load_historical_data_to_accounts
 from .news_data import update_news_data
 from .price_data import (
     get_next_price_update_time,
+    models_state,
     update_bitmex_prices_and_values,
     update_polymarket_prices_and_values,
     update_stock_prices_and_values,
 )
 from .routers import models, news, social, system
 from .social_data import update_social_data
+from .startup import startup_state
 from .system_data import update_system_status
 
 load_dotenv()
 
-# Global system instances - Initialize immediately
+# Global system instances - built by initialize_systems()
 stock_system = None
 polymarket_system = None
 bitmex_system = None
@@ -81,32 +93,47 @@ BITMEX_SYSTEMS = {
     MockMode.NONE: BitMEXPortfolioSystem,
 }
 
-# Initialize systems immediately when module loads
-stock_system = STOCK_SYSTEMS[STOCK_MOCK_MODE].get_instance()
-polymarket_system = POLYMARKET_SYSTEMS[POLYMARKET_MOCK_MODE].get_instance()
-bitmex_system = BITMEX_SYSTEMS[BITMEX_MOCK_MODE].get_instance()
+# Keep LLM transcripts on disk next to the model history
+configure_transcript_store(TRANSCRIPTS_DIR)
+
+
+def initialize_systems():
+    """Build the trading systems, restore account history and go live."""
+    global stock_system, polymarket_system, bitmex_system
 
-# Add agents for real systems
-if STOCK_MOCK_MODE == MockMode.NONE:
-    for display_name, model_id in get_base_model_configs():
-        stock_system.add_agent(display_name, 1000.0, model_id)
+    with startup_state.phase_timer("construct_systems"):
+        stock = STOCK_SYSTEMS[STOCK_MOCK_MODE].get_instance()
+        polymarket = POLYMARKET_SYSTEMS[POLYMARKET_MOCK_MODE].get_instance()
+        bitmex = BITMEX_SYSTEMS[BITMEX_MOCK_MODE].get_instance()
 
-if POLYMARKET_MOCK_MODE == MockMode.NONE:
-    for display_name, model_id in get_base_model_configs():
-        polymarket_system.add_agent(display_name, 500.0, model_id)
+    with startup_state.phase_timer("add_agents"):
+        # Add agents for real systems
+        if STOCK_MOCK_MODE == MockMode.NONE:
+            for display_name, model_id in get_base_model_configs():
+                stock.add_agent(display_name, 1000.0, model_id)
 
-# Add BitMEX agents (paper trading with $1,000 each)
-for display_name, model_id in get_base_model_configs():
-    bitmex_system.add_agent(display_name, 1000.0, model_id)
+        if POLYMARKET_MOCK_MODE == MockMode.NONE:
+            for display_name, model_id in get_base_model_configs():
+                polymarket.add_agent(display_name, 500.0, model_id)
 
-# 🆕 加载历史数据到Account内存中
-print("🔄 Loading historical data to account memory...")
-load_historical_data_to_accounts(stock_system, polymarket_system, bitmex_system)
-print("✅ Historical data loading completed")
+        # Add BitMEX agents (paper trading with $1,000 each)
+        for display_name, model_id in get_base_model_configs():
+            bitmex.add_agent(display_name, 1000.0, model_id)
 
-stock_system.initialize_for_live()
-polymarket_system.initialize_for_live()
-bitmex_system.initialize_for_live()
+    # 🆕 加载历史数据到Account内存中
+    with startup_state.phase_timer("load_history"):
+        print("🔄 Loading historical data to account memory...")
+        load_historical_data_to_accounts(stock, polymarket, bitmex)
+        print("✅ Historical data loading completed")
+
+    with startup_state.phase_timer("initialize_stock"):
+        stock.initialize_for_live()
+    with startup_state.phase_timer("initialize_polymarket"):
+        polymarket.initialize_for_live()
+    with startup_state.phase_timer("initialize_bitmex"):
+        bitmex.initialize_for_live()
+
+    stock_system, polymarket_system, bitmex_system = stock, polymarket, bitmex
 
 
 def get_stock_system():
@@ -130,6 +157,12 @@ def get_bitmex_system():
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if not LAZY_STARTUP:
+    # Initialize systems immediately when module loads
+    initialize_systems()
+    startup_state.mark_ready()
+
+
 app = FastAPI(
     title="Live Trade Bench API",
     description="API for the Live Trade Bench platform",
@@ -190,27 +223,46 @@ def get_next_price_update():
     return response
 
 
+@app.get("/api/schedule/jobs")
+def get_job_metrics():
+    """Per-job run counts, durations and scheduling lag (seconds)."""
+    next_runs = {}
+    if scheduler is not None:
+        for job in scheduler.get_jobs():
+            next_runs[job.id] = {
+                "executor": job.executor,
+                "next_run_time": (
+                    job.next_run_time.isoformat() if job.next_run_time else None
+                ),
+            }
+    metrics = job_monitor.report()
+    return {
+        job_id: {**next_runs.get(job_id, {}), **metrics.get(job_id, {})}
+        for job_id in sorted(set(next_runs) | set(metrics))
+    }
+
+
 def load_backtest_as_initial_data():
     """Load backtest data as initial trading data if no live data exists."""
     if not os.path.exists(MODELS_DATA_FILE) and os.path.exists(MODELS_DATA_INIT_FILE):
         try:
-            # Import helper functions from models_data
-            from .models_data import _create_compact_model_data
+            # Import helpers from models_data
+            from .models_data import (
+                externalize_model_transcripts,
+                history_log,
+                write_models_view,
+            )
 
             # Read init file
             with open(MODELS_DATA_INIT_FILE, "r") as f:
                 init_data = json.load(f)
 
-            # Copy full data to hist file
-            shutil.copy(MODELS_DATA_INIT_FILE, MODELS_DATA_HIST_FILE)
-            os.chmod(MODELS_DATA_HIST_FILE, 0o644)
-            logger.info("📚 Created complete historical data file")
+            # Seed the history log with the full data, transcripts by reference
+            history_log.save(externalize_model_transcripts(init_data))
+            logger.info("📚 Seeded model history log")
 
-            # Create compact version for frontend
-            compact_data = [_create_compact_model_data(model) for model in init_data]
-            with open(MODELS_DATA_FILE, "w") as f:
-                json.dump(compact_data, f, indent=4)
-            os.chmod(MODELS_DATA_FILE, 0o644)
+            # Materialize the compact version for the frontend
+            write_models_view(init_data)
 
             logger.info(
                 "📊 Loaded backtest data as initial trading data (compact frontend + full hist)"
@@ -231,7 +283,8 @@ def safe_generate_bitmex_cycle():
     """Run BitMEX trading cycle (24/7 crypto markets)."""
     logger.info("🔄 Running BitMEX trading cycle...")
     try:
-        bitmex_system.run_cycle()
+        with lock_manager.hold(BITMEX_SYSTEM, MODELS_DATA):
+            bitmex_system.run_cycle()
         logger.info("✅ BitMEX cycle completed")
     except Exception as e:
         logger.error(f"❌ BitMEX cycle failed: {e}")
@@ -254,7 +307,11 @@ def schedule_background_tasks(scheduler: BackgroundScheduler):
         schedule_desc = "3:00 PM EST"
 
     scheduler.add_job(
-        safe_generate_models_data,
+        job_monitor.wrap(
+            "generate_models_data",
+            safe_generate_models_data,
+            locks=(*ALL_SYSTEMS, MODELS_DATA),
+        ),
         "cron",
         day_of_week="mon-fri",
         hour=schedule_hour,
@@ -262,6 +319,9 @@ def schedule_background_tasks(scheduler: BackgroundScheduler):
         timezone="UTC",
         id="generate_models_data",
         replace_existing=True,
+        executor="trading",
+        # a late trading cycle is still worth running
+        misfire_grace_time=3600,
     )
     logger.info(f"📅 Scheduled trading job for UTC {schedule_hour}:00 ({schedule_desc})")
 
@@ -269,12 +329,19 @@ def schedule_background_tasks(scheduler: BackgroundScheduler):
     logger.info(
         f"📈 Scheduled stock price update job for every {price_interval} seconds ({price_interval//60} minutes)"
     )
+    # Price ticks are skipped while the trading cycle rewrites models_data
     scheduler.add_job(
-        update_stock_prices_and_values,
+        job_monitor.wrap(
+            "update_stock_prices",
+            update_stock_prices_and_values,
+            locks=(MODELS_DATA,),
+            wait=False,
+        ),
         "interval",
         seconds=price_interval,
         id="update_stock_prices",
         replace_existing=True,
+        executor="prices",
     )
 
     polymarket_interval = UPDATE_FREQUENCY["polymarket_prices"]
@@ -282,11 +349,17 @@ def schedule_background_tasks(scheduler: BackgroundScheduler):
         f"📊 Scheduled polymarket price update job for every {polymarket_interval} seconds ({polymarket_interval//60} minutes)"
     )
     scheduler.add_job(
-        update_polymarket_prices_and_values,
+        job_monitor.wrap(
+            "update_polymarket_prices",
+            update_polymarket_prices_and_values,
+            locks=(MODELS_DATA,),
+            wait=False,
+        ),
         "interval",
         seconds=polymarket_interval,
         id="update_polymarket_prices",
         replace_existing=True,
+        executor="prices",
     )
 
     # BitMEX price updates (every 10 minutes, 24/7)
@@ -295,30 +368,42 @@ def schedule_background_tasks(scheduler: BackgroundScheduler):
         f"📈 Scheduled BitMEX price update job for every {bitmex_interval} seconds ({bitmex_interval//60} minutes)"
     )
     scheduler.add_job(
-        update_bitmex_prices_and_values,
+        job_monitor.wrap(
+            "update_bitmex_prices",
+            update_bitmex_prices_and_values,
+            locks=(MODELS_DATA,),
+            wait=False,
+        ),
         "interval",
         seconds=bitmex_interval,
         id="update_bitmex_prices",
         replace_existing=True,
+        executor="prices",
     )
+    # News and social lock each system only while reading it, not while
+    # scraping
     scheduler.add_job(
-        update_news_data,
+        job_monitor.wrap("update_news_data", update_news_data),
         "interval",
         seconds=UPDATE_FREQUENCY["news_social"],
         id="update_news_data",
         replace_existing=True,
+        executor="content",
         next_run_time=datetime.now(),  # run immediately once
     )
     scheduler.add_job(
-        update_social_data,
+        job_monitor.wrap("update_social_data", update_social_data),
         "interval",
         seconds=UPDATE_FREQUENCY["news_social"],
         id="update_social_data",
         replace_existing=True,
+        executor="content",
         next_run_time=datetime.now(),  # run immediately once
     )
     scheduler.add_job(
-        update_system_status,
+        job_monitor.wrap(
+            "update_system_status", update_system_status, locks=ALL_SYSTEMS
+        ),
         "interval",
         seconds=UPDATE_FREQUENCY["system_status"],
         id="update_system_status",
@@ -332,33 +417,65 @@ def startup_event():
     logger.info("🚀 FastAPI app starting up...")
 
     # Ensure initial data exists before any scheduled jobs run
-    load_backtest_as_initial_data()
+    with startup_state.phase_timer("seed_initial_data"):
+        load_backtest_as_initial_data()
+
+    if LAZY_STARTUP:
+        # Serve the cached models_data.json now; systems come up in the background
+        threading.Thread(
+            target=_initialize_in_background, name="system-init", daemon=True
+        ).start()
+        logger.info("🚀 FastAPI app startup completed - systems initializing lazily")
+        return
+
+    start_scheduler()
+    logger.info("🚀 FastAPI app startup completed - data loading in background")
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # Fold pending price ticks into models_data.json, like the scheduled writers
+    with lock_manager.hold(MODELS_DATA):
+        models_state.checkpoint()
 
-    # Start background scheduler
+
+def start_scheduler():
     global scheduler
-    # Allow background jobs to run concurrently so a slow price update doesn't block
-    executors = {"default": ThreadPoolExecutor(max_workers=4)}
-    scheduler = BackgroundScheduler(executors=executors)
+    # One executor per job class so slow scrapes can't starve price updates
+    scheduler = BackgroundScheduler(
+        executors=build_executors(), job_defaults=JOB_DEFAULTS
+    )
+    job_monitor.attach(scheduler)
     schedule_background_tasks(scheduler)
     scheduler.start()
 
     logger.info("✅ Background scheduler started.")
 
-    # Run all initial data generation in background threads - don't block startup
-    # threading.Thread(
-    #     target=lambda: generate_models_data(stock_system, polymarket_system),
-    #     daemon=True,
-    # ).start()
-
-    # threading.Thread(target=update_news_data, daemon=True).start()
-    # threading.Thread(target=update_social_data, daemon=True).start()
 
-    logger.info("🚀 FastAPI app startup completed - data loading in background")
+def _initialize_in_background():
+    try:
+        initialize_systems()
+        # Scheduled jobs need the systems, so they start once those are built
+        with startup_state.phase_timer("start_scheduler"):
+            start_scheduler()
+    except Exception as e:
+        startup_state.mark_failed(e)
+        return
+    startup_state.mark_ready()
 
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    return {"status": "ok", "ready": startup_state.ready}
+
+
+@app.get("/ready")
+def readiness_check():
+    """503 until the trading systems are initialized; reports startup timings."""
+    report = startup_state.report()
+    if not startup_state.ready:
+        return JSONResponse(report, status_code=503)
+    return report
 
 
 static_files_path = os.path.join(
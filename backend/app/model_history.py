@@ -0,0 +1,191 @@
+"""
+Append-only per-model history log.
+
+Layout under the log directory:
+
+- ``<model_id>.jsonl``: one allocation snapshot per line, appended as new
+  snapshots arrive.
+- ``<model_id>.profit.jsonl``: a benchmark's ``profitHistory`` points, one
+  per line. Agent models rebuild theirs from their snapshots instead.
+- ``models.json``: the latest record of every model without its histories,
+  rewritten atomically on every save. Models missing from a save keep their
+  previous record.
+
+A save therefore costs O(new points) plus the small header file instead of
+re-dumping the whole history. ``models_data.json`` is a view built from these
+records (see ``models_data.generate_models_data``).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .data_store import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+HEADER_FILE = "models.json"
+PROFIT_SUFFIX = ".profit"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def profit_history_from(
+    allocation_history: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "timestamp": snapshot["timestamp"],
+            "profit": snapshot["profit"],
+            "totalValue": snapshot["total_value"],
+            "performance": snapshot.get("performance", 0),
+        }
+        for snapshot in allocation_history
+    ]
+
+
+def _derives_profit_history(model: Dict[str, Any]) -> bool:
+    # Agent models rebuild profitHistory from their snapshots; benchmarks
+    # carry their own.
+    return model.get("category") != "benchmark"
+
+
+class ModelHistoryLog:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        # lines persisted per segment path
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _segment_path(self, model_id: str, suffix: str = "") -> str:
+        name = _UNSAFE_CHARS.sub("_", model_id) + suffix + ".jsonl"
+        return os.path.join(self.root, name)
+
+    def exists(self) -> bool:
+        return os.path.exists(os.path.join(self.root, HEADER_FILE))
+
+    # -- reading -------------------------------------------------------------
+
+    def _read_segment(self, path: str) -> List[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return []
+        snapshots = []
+        with open(path, "r") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break  # torn final line from an interrupted append
+                snapshots.append(json.loads(line))
+        self._counts[path] = len(snapshots)
+        return snapshots
+
+    def _read_headers(self) -> List[Dict[str, Any]]:
+        path = os.path.join(self.root, HEADER_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def load(self, model_ids: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Full model records (with history), optionally limited to ``model_ids``."""
+        wanted = set(model_ids) if model_ids is not None else None
+        models = []
+        with self._lock:
+            for header in self._read_headers():
+                model_id = header["id"]
+                if wanted is not None and model_id not in wanted:
+                    continue
+                history = self._read_segment(self._segment_path(model_id))
+                model = dict(header)
+                model["allocationHistory"] = history
+                if _derives_profit_history(model):
+                    model["profitHistory"] = profit_history_from(history)
+                else:
+                    path = self._segment_path(model_id, PROFIT_SUFFIX)
+                    if os.path.exists(path):
+                        # headers written before the segment carry it inline
+                        model["profitHistory"] = self._read_segment(path)
+                models.append(model)
+        return models
+
+    # -- writing -------------------------------------------------------------
+
+    def _persisted_count(self, path: str) -> int:
+        count = self._counts.get(path)
+        if count is None:
+            count = self._repair_segment(path)
+        return count
+
+    def _repair_segment(self, path: str) -> int:
+        """Drop a torn trailing line and return the number of whole lines."""
+        if not os.path.exists(path):
+            return 0
+        count = 0
+        good_bytes = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                count += 1
+                good_bytes += len(line)
+        if good_bytes != os.path.getsize(path):
+            logger.warning(f"Truncating torn snapshot line in {path}")
+            with open(path, "r+b") as f:
+                f.truncate(good_bytes)
+        return count
+
+    def _write_segment(self, path: str, items: List[Dict[str, Any]]) -> int:
+        """Append the unseen tail of ``items``; a shorter list replaces the file."""
+        persisted = self._persisted_count(path)
+        written = 0
+        if len(items) < persisted:
+            lines = "".join(json.dumps(item) + "\n" for item in items)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            written = len(items)
+        elif len(items) > persisted:
+            with open(path, "a") as f:
+                for item in items[persisted:]:
+                    f.write(json.dumps(item) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            written = len(items) - persisted
+        self._counts[path] = len(items)
+        return written
+
+    def save(self, models: List[Dict[str, Any]]) -> int:
+        """Append each model's unseen history lines and rewrite the header file.
+
+        Returns the number of lines written. A history that shrank (e.g. an
+        account reset) replaces that model's segment. Headers are merged by
+        id, so saving a subset of the models keeps the others.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        written = 0
+        with self._lock:
+            headers = {header["id"]: header for header in self._read_headers()}
+            for model in models:
+                model_id = model["id"]
+                written += self._write_segment(
+                    self._segment_path(model_id), model.get("allocationHistory", [])
+                )
+                if not _derives_profit_history(model) and "profitHistory" in model:
+                    written += self._write_segment(
+                        self._segment_path(model_id, PROFIT_SUFFIX),
+                        model["profitHistory"],
+                    )
+                headers[model_id] = {
+                    k: v
+                    for k, v in model.items()
+                    if k not in ("allocationHistory", "profitHistory")
+                }
+            atomic_write_json(
+                os.path.join(self.root, HEADER_FILE), list(headers.values())
+            )
+        return written
@@ -3,9 +3,21 @@ import os
 from dataclasses import asdict
 from datetime import datetime, timedelta
 
+from live_trade_bench.accounts import get_transcript_store, load_transcript
 from live_trade_bench.accounts.base_account import Position
 
-from .config import MODELS_DATA_FILE, MODELS_DATA_HIST_FILE, MODELS_DATA_INIT_FILE
+from .config import (
+    MODELS_DATA_FILE,
+    MODELS_DATA_HIST_FILE,
+    MODELS_DATA_INIT_FILE,
+    MODELS_HISTORY_DIR,
+)
+from .data_store import data_store
+from .model_history import ModelHistoryLog, profit_history_from
+
+BENCHMARK_MODEL_IDS = ["qqq-benchmark", "voo-benchmark"]
+
+history_log = ModelHistoryLog(MODELS_HISTORY_DIR)
 
 
 def _filter_recent_days(allocation_history, days=30):
@@ -35,22 +47,50 @@ def _filter_recent_days(allocation_history, days=30):
 
 
 def _strip_llm_data_except_last(allocation_history):
-    """Remove llm_input and llm_output from all snapshots except the last one."""
+    """Drop inline LLM data except on the last snapshot, which gets its transcript.
+
+    Snapshots reference their transcript by ``transcript_id``, so only legacy
+    snapshots with inline ``llm_input``/``llm_output`` need copying here.
+    """
     if not allocation_history:
         return []
 
     result = []
+    last = len(allocation_history) - 1
     for i, snapshot in enumerate(allocation_history):
-        snapshot_copy = snapshot.copy()
-        # Keep LLM data only in the last snapshot
-        if i < len(allocation_history) - 1:
-            snapshot_copy.pop("llm_input", None)
-            snapshot_copy.pop("llm_output", None)
-        result.append(snapshot_copy)
+        if i == last:
+            snapshot = {**snapshot, **load_transcript(snapshot)}
+        elif "llm_input" in snapshot or "llm_output" in snapshot:
+            snapshot = {
+                k: v
+                for k, v in snapshot.items()
+                if k not in ("llm_input", "llm_output")
+            }
+        result.append(snapshot)
 
     return result
 
 
+def _externalize_transcripts(allocation_history):
+    """Move inline LLM data of legacy snapshots into the transcript store."""
+    store = get_transcript_store()
+    for snapshot in allocation_history:
+        if "llm_input" in snapshot or "llm_output" in snapshot:
+            llm_input = snapshot.pop("llm_input", None)
+            llm_output = snapshot.pop("llm_output", None)
+            snapshot["transcript_id"] = None
+            if llm_input is not None or llm_output is not None:
+                snapshot["transcript_id"] = store.put(llm_input, llm_output)
+    return allocation_history
+
+
+def externalize_model_transcripts(models):
+    """``_externalize_transcripts`` over every model's ``allocationHistory``."""
+    for model in models:
+        _externalize_transcripts(model.get("allocationHistory") or [])
+    return models
+
+
 def _create_compact_model_data(model_data):
     """Create a compact version of model data for frontend (30 days + last LLM only)."""
     compact = model_data.copy()
@@ -99,15 +139,7 @@ def _create_model_data(agent, account, market_type):
         "trades": len(allocation_history),
         "asset_allocation": asset_allocation,
         "portfolio": portfolio,
-        "profitHistory": [
-            {
-                "timestamp": snapshot["timestamp"],
-                "profit": snapshot["profit"],
-                "totalValue": snapshot["total_value"],
-                "performance": snapshot.get("performance", 0),
-            }
-            for snapshot in allocation_history
-        ],
+        "profitHistory": profit_history_from(allocation_history),
         "allocationHistory": allocation_history,
     }
     return model
@@ -130,9 +162,11 @@ def load_historical_data_to_accounts(stock_system, polymarket_system, bitmex_sys
     models_data.json exists. The existence of models_data.json is only checked to
     decide whether to run load_backtest_as_initial_data() in main.py.
     """
-    # Try to load from hist file first (contains full data), fallback to init file
+    # Prefer the snapshot log; fall back to the legacy hist file, then the init file
     source_file = None
-    if os.path.exists(MODELS_DATA_HIST_FILE):
+    if history_log.exists():
+        print("📚 Loading from model history log (complete data)...")
+    elif os.path.exists(MODELS_DATA_HIST_FILE):
         source_file = MODELS_DATA_HIST_FILE
         print("📚 Loading from historical data file (complete data)...")
     elif os.path.exists(MODELS_DATA_INIT_FILE):
@@ -145,8 +179,15 @@ def load_historical_data_to_accounts(stock_system, polymarket_system, bitmex_sys
     print("🔄 Loading historical data to account memory...")
 
     try:
-        with open(source_file, "r") as f:
-            historical_data = json.load(f)
+        if source_file is None:
+            historical_data = history_log.load()
+        else:
+            with open(source_file, "r") as f:
+                historical_data = json.load(f)
+            if source_file == MODELS_DATA_HIST_FILE:
+                # One-off migration of the legacy single-file history; the log
+                # only keeps transcript ids
+                history_log.save(externalize_model_transcripts(historical_data))
 
         print(f"📊 Loading historical data for {len(historical_data)} models...")
 
@@ -202,7 +243,9 @@ def restore_account_from_historical_data(account, historical_model_data):
 
     account.target_allocations = portfolio.get("target_allocations", {})
 
-    account.allocation_history = historical_model_data.get("allocationHistory", [])
+    account.allocation_history = _externalize_transcripts(
+        historical_model_data.get("allocationHistory", [])
+    )
 
     account.total_fees = historical_model_data.get("total_fees", 0.0)
 
@@ -238,16 +281,11 @@ def generate_models_data(stock_system, polymarket_system, bitmex_system=None) ->
         # 添加保留的benchmark模型
         all_market_data.extend(existing_benchmarks)
 
-        # Write full historical data (for backend reload)
-        with open(MODELS_DATA_HIST_FILE, "w") as f:
-            json.dump(all_market_data, f, indent=4)
-        print(f"💾 Saved complete historical data to {MODELS_DATA_HIST_FILE}")
+        # Append new snapshots to the history log (for backend reload)
+        written = history_log.save(all_market_data)
+        print(f"💾 Appended {written} snapshots to {MODELS_HISTORY_DIR}")
 
-        # Create compact data for frontend (30 days + last LLM only)
-        compact_data = [_create_compact_model_data(model) for model in all_market_data]
-        with open(MODELS_DATA_FILE, "w") as f:
-            json.dump(compact_data, f, indent=4)
-        print(f"💾 Saved compact frontend data to {MODELS_DATA_FILE}")
+        write_models_view(all_market_data)
 
         total_models = len(all_market_data)
         benchmark_count = len(existing_benchmarks)
@@ -260,27 +298,34 @@ def generate_models_data(stock_system, polymarket_system, bitmex_system=None) ->
         raise
 
 
+def write_models_view(models):
+    """Materialize models_data.json (30 days + last LLM only) for the frontend."""
+    compact_data = [_create_compact_model_data(model) for model in models]
+    data_store.write_json(MODELS_DATA_FILE, compact_data)
+    print(f"💾 Saved compact frontend data to {MODELS_DATA_FILE}")
+
+
 def _preserve_existing_benchmarks():
     """保留现有的benchmark模型，避免被trading cycle覆盖"""
     try:
-        # Try to read from hist file first (contains full data)
-        source_file = (
-            MODELS_DATA_HIST_FILE
-            if os.path.exists(MODELS_DATA_HIST_FILE)
-            else MODELS_DATA_FILE
-        )
+        if history_log.exists():
+            existing_data = history_log.load(BENCHMARK_MODEL_IDS)
+        else:
+            source_file = (
+                MODELS_DATA_HIST_FILE
+                if os.path.exists(MODELS_DATA_HIST_FILE)
+                else MODELS_DATA_FILE
+            )
 
-        if not os.path.exists(source_file):
-            return []
+            if not os.path.exists(source_file):
+                return []
 
-        with open(source_file, "r") as f:
-            existing_data = json.load(f)
+            with open(source_file, "r") as f:
+                existing_data = json.load(f)
 
         # 筛选出benchmark模型 (QQQ/VOO)
         benchmarks = [
-            model
-            for model in existing_data
-            if model.get("id") in ["qqq-benchmark", "voo-benchmark"]
+            model for model in existing_data if model.get("id") in BENCHMARK_MODEL_IDS
         ]
 
         if benchmarks:
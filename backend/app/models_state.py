@@ -0,0 +1,244 @@
+"""
+In-memory models view for the realtime price updaters.
+
+The price jobs used to parse ``models_data.json``, change a few numbers and
+write the whole file back every few minutes. ``ModelsState`` keeps the parsed
+view in memory instead: each price update is a small record that is applied
+to the in-memory models, appended to a JSONL tick log and published to the
+API cache. The full file is only rewritten at checkpoints.
+
+Every tick carries the ETag of the checkpoint it applies to, so after a
+restart the ticks are replayed on top of the file they were recorded against,
+and ticks are dropped as soon as something else (the trading cycle) rewrites
+``models_data.json``. Applied records never mutate the models they replace,
+so published lists can be served while the next update is being built.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .data_store import CachedJSON, JSONDataStore, data_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_INTERVAL = 60 * 60
+# checkpoint early once this many ticks piled up in the log
+MAX_PENDING_TICKS = 5000
+
+Model = Dict[str, Any]
+
+
+def profit_point(
+    total_value: float, profit: float, timestamp: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "profit": profit,
+        "totalValue": total_value,
+    }
+
+
+def mark_model(
+    model: Model,
+    prices: Dict[str, float],
+    initial_cash: float,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Tick record re-pricing ``model``'s positions with ``prices``."""
+    portfolio = model.get("portfolio", {}) or {}
+    positions = portfolio.get("positions", {}) or {}
+    total_value = float(portfolio.get("cash", 0.0))
+    updated: Dict[str, float] = {}
+    for symbol, position in positions.items():
+        price = prices.get(symbol)
+        if price is not None:
+            updated[symbol] = price
+        else:
+            price = float(position.get("current_price", 0.0))
+        total_value += float(position.get("quantity", 0.0)) * price
+
+    profit = total_value - initial_cash
+    return {
+        "op": "mark",
+        "id": model.get("id"),
+        "prices": updated,
+        "total_value": total_value,
+        "profit": profit,
+        "performance": (profit / initial_cash) * 100 if initial_cash else 0.0,
+        "point": profit_point(total_value, profit, timestamp),
+    }
+
+
+def replace_category(category: str, models: List[Model]) -> Dict[str, Any]:
+    """Tick record swapping every model of ``category`` for ``models``."""
+    return {"op": "category", "category": category, "models": models}
+
+
+def _append_point(history: List[Dict[str, Any]], point: Dict[str, Any]) -> List:
+    # one point per day: the latest update of the day replaces the previous one
+    history = list(history)
+    if history and history[-1].get("timestamp", "")[:10] == point["timestamp"][:10]:
+        history[-1] = point
+    else:
+        history.append(point)
+    return history
+
+
+def _apply_mark(model: Model, record: Dict[str, Any]) -> Model:
+    portfolio = dict(model.get("portfolio", {}) or {})
+    positions = dict(portfolio.get("positions", {}) or {})
+    for symbol, price in record["prices"].items():
+        if symbol in positions:
+            positions[symbol] = dict(positions[symbol], current_price=price)
+    portfolio["positions"] = positions
+    portfolio["total_value"] = record["total_value"]
+
+    model = dict(model)
+    model["portfolio"] = portfolio
+    model["profit"] = record["profit"]
+    model["performance"] = record["performance"]
+    model["profitHistory"] = _append_point(
+        model.get("profitHistory", []), record["point"]
+    )
+    return model
+
+
+def apply_record(models: List[Model], record: Dict[str, Any]) -> List[Model]:
+    """New models list with ``record`` applied; ``models`` is left untouched."""
+    op = record.get("op")
+    if op == "mark":
+        return [
+            _apply_mark(m, record) if m.get("id") == record["id"] else m
+            for m in models
+        ]
+    if op == "category":
+        kept = [m for m in models if m.get("category") != record["category"]]
+        return kept + list(record["models"])
+    logger.warning(f"Ignoring unknown models tick {op!r}")
+    return models
+
+
+class ModelsState:
+    def __init__(
+        self,
+        path: str,
+        tick_log: str,
+        store: Optional[JSONDataStore] = None,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.tick_log = tick_log
+        self.store = store or data_store
+        self.checkpoint_interval = checkpoint_interval
+        self._clock = clock
+        self._models: Optional[List[Model]] = None
+        # the cache entry our models were published as / loaded from
+        self._entry: Optional[CachedJSON] = None
+        # ETag of the file contents the pending ticks apply to
+        self._base: Optional[str] = None
+        self._pending = 0
+        self._checkpointed_at = clock()
+        self._lock = threading.RLock()
+
+    def _read_ticks(self) -> List[Dict[str, Any]]:
+        records = []
+        try:
+            with open(self.tick_log, "r") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # torn line from a crash mid-append
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _truncate_ticks(self) -> None:
+        try:
+            os.remove(self.tick_log)
+        except FileNotFoundError:
+            pass
+        self._pending = 0
+
+    def _rebase(self, entry: CachedJSON) -> None:
+        models = entry.data if isinstance(entry.data, list) else []
+        replayed = 0
+        for tick in self._read_ticks():
+            if tick.get("base") == entry.etag:
+                models = apply_record(models, tick["record"])
+                replayed += 1
+        self._base = entry.etag
+        self._models = models
+        self._entry = entry
+        if replayed:
+            logger.info(f"Replayed {replayed} price ticks onto {self.path}")
+            self._pending = replayed
+            self._publish()
+        else:
+            # stale ticks belong to an older checkpoint
+            self._truncate_ticks()
+
+    def _publish(self) -> None:
+        self._entry = self.store.publish(self.path, self._models, self._entry)
+
+    def models(self) -> Optional[List[Model]]:
+        """Current models; treat the returned list and its dicts as read-only."""
+        with self._lock:
+            try:
+                entry = self.store.get(self.path)
+            except ValueError as exc:
+                logger.error(f"Failed to load models data: {exc}")
+                return None
+            if entry is None:
+                return None
+            if entry is not self._entry:
+                self._rebase(entry)
+            return self._models
+
+    def has_model(self, model_ids: Iterable[str]) -> bool:
+        wanted = set(model_ids)
+        return any(m.get("id") in wanted for m in self.models() or [])
+
+    def commit(self, records: List[Dict[str, Any]]) -> None:
+        """Apply, log and publish ``records``; checkpoint when one is due."""
+        if not records:
+            return
+        with self._lock:
+            models = self.models()
+            if models is None:
+                return
+            for record in records:
+                models = apply_record(models, record)
+            os.makedirs(os.path.dirname(self.tick_log) or ".", exist_ok=True)
+            with open(self.tick_log, "a") as f:
+                for record in records:
+                    f.write(json.dumps({"base": self._base, "record": record}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending += len(records)
+            self._models = models
+            self._publish()
+            due = self._clock() - self._checkpointed_at >= self.checkpoint_interval
+            if due or self._pending >= MAX_PENDING_TICKS:
+                self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Rewrite ``models_data.json`` from memory and drop the tick log."""
+        with self._lock:
+            self._checkpointed_at = self._clock()
+            if self._models is None or not self._pending:
+                return
+            if self.store.get(self.path) is not self._entry:
+                # the file was rewritten meanwhile; the next read rebases on it
+                return
+            self.store.write_json(self.path, self._models)
+            self._entry = self.store.get(self.path)
+            self._base = self._entry.etag if self._entry is not None else None
+            self._truncate_ticks()
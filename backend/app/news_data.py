@@ -1,6 +1,17 @@
-import json
+import copy
+from typing import Any, Dict, Tuple
 
 from .config import NEWS_DATA_FILE
+from .data_store import data_store
+from .jobs import BITMEX_SYSTEM, POLYMARKET_SYSTEM, STOCK_SYSTEM, lock_manager
+
+
+def _read_system(lock_name: str, system: Any) -> Tuple[Dict[str, Any], Any]:
+    """Current market data and a shallow copy of ``system``, under its lock."""
+    with lock_manager.hold(lock_name):
+        if not system.universe:
+            system.initialize_for_live()
+        return system._fetch_market_data(for_date=None), copy.copy(system)
 
 
 def update_news_data() -> None:
@@ -19,25 +30,20 @@ def update_news_data() -> None:
             print("❌ Failed to get system instances")
             return
 
-        # Initialize systems if not already done
-        if not stock_system.universe:
-            stock_system.initialize_for_live()
-        if not polymarket_system.universe:
-            polymarket_system.initialize_for_live()
-        if not bitmex_system.universe:
-            bitmex_system.initialize_for_live()
-
-        # Fetch market data
-        stock_market_data = stock_system._fetch_market_data(for_date=None)
-        polymarket_market_data = polymarket_system._fetch_market_data(for_date=None)
-        bitmex_market_data = bitmex_system._fetch_market_data(for_date=None)
+        # Read each system under its lock, then scrape with a detached copy
+        # so the trading cycle does not wait on the news requests
+        stock_market_data, stock_view = _read_system(STOCK_SYSTEM, stock_system)
+        polymarket_market_data, polymarket_view = _read_system(
+            POLYMARKET_SYSTEM, polymarket_system
+        )
+        bitmex_market_data, bitmex_view = _read_system(BITMEX_SYSTEM, bitmex_system)
 
         # Fetch news data
-        stock_news = stock_system._fetch_news_data(stock_market_data, for_date=None)
-        polymarket_news = polymarket_system._fetch_news_data(
+        stock_news = stock_view._fetch_news_data(stock_market_data, for_date=None)
+        polymarket_news = polymarket_view._fetch_news_data(
             polymarket_market_data, for_date=None
         )
-        bitmex_news = bitmex_system._fetch_news_data(bitmex_market_data, for_date=None)
+        bitmex_news = bitmex_view._fetch_news_data(bitmex_market_data, for_date=None)
 
         all_news_data["stock"] = [
             item for sublist in stock_news.values() for item in sublist
@@ -49,8 +55,7 @@ def update_news_data() -> None:
             item for sublist in bitmex_news.values() for item in sublist
         ]
 
-        with open(NEWS_DATA_FILE, "w") as f:
-            json.dump(all_news_data, f, indent=4)
+        data_store.write_json(NEWS_DATA_FILE, all_news_data)
         print(f"✅ News data updated and saved to {NEWS_DATA_FILE}")
 
     except Exception as e:
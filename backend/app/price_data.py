@@ -1,24 +1,41 @@
-import json
 import logging
-import os
-from datetime import datetime, time, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import pytz
 
+from live_trade_bench.fetchers.async_fetcher import (
+    AsyncBitMEXFetcher,
+    AsyncPolymarketFetcher,
+    gather_bounded,
+    run_coroutine_sync,
+)
 from live_trade_bench.fetchers.stock_fetcher import StockFetcher
 
 from .config import (
-    MARKET_HOURS,
     MODELS_DATA_FILE,
+    PRICE_TICKS_FILE,
     TRADING_CONFIG,
     UPDATE_FREQUENCY,
     is_market_hours,
     is_trading_day,
+    stock_calendar,
 )
+from .models_state import ModelsState, mark_model, replace_category
 
 logger = logging.getLogger(__name__)
 
+# Spot quotes only need one small request per symbol
+QUOTE_CONCURRENCY = 8
+
+# Price updates are appended as ticks; models_data.json is rewritten hourly
+models_state = ModelsState(
+    MODELS_DATA_FILE,
+    PRICE_TICKS_FILE,
+    checkpoint_interval=UPDATE_FREQUENCY["models_checkpoint"],
+)
+
 _NEXT_UPDATE_TIMES: Dict[str, Optional[datetime]] = {
     "stock": None,
     "polymarket": None,
@@ -48,83 +65,57 @@ def _compute_next_price_update_time(market: str, now_utc: datetime) -> datetime:
         interval = timedelta(seconds=UPDATE_FREQUENCY["polymarket_prices"])
         return (now_utc + interval).astimezone(pytz.UTC)
 
-    # Default to stock market schedule
-    tz = pytz.timezone("US/Eastern")
-    est_now = now_utc.astimezone(tz)
-
-    interval = timedelta(seconds=UPDATE_FREQUENCY["realtime_prices"])
-    candidate = est_now + interval
-
-    open_hour, open_minute = map(int, MARKET_HOURS["stock_open"].split(":"))
-    close_hour, close_minute = map(int, MARKET_HOURS["stock_close"].split(":"))
-
-    close_today = est_now.replace(
-        hour=close_hour, minute=close_minute, second=0, microsecond=0
-    )
-
-    if candidate <= close_today:
-        open_today = est_now.replace(
-            hour=open_hour, minute=open_minute, second=0, microsecond=0
-        )
-        if candidate < open_today:
-            candidate = open_today
-        return candidate.astimezone(pytz.UTC)
-
-    trading_days = set(MARKET_HOURS["trading_days"])
-    next_day = est_now.date()
-
-    while True:
-        next_day += timedelta(days=1)
-        if next_day.weekday() in trading_days:
-            break
-
-    next_open_est = tz.localize(
-        datetime.combine(next_day, time(open_hour, open_minute))
-    )
-    return next_open_est.astimezone(pytz.UTC)
+    # Default to stock market schedule: holidays and early closes are skipped
+    candidate = now_utc + timedelta(seconds=UPDATE_FREQUENCY["realtime_prices"])
+    calendar = stock_calendar()
+    today = now_utc.astimezone(calendar.tz).date()
+    bounds = calendar.session_bounds(today)
+    if bounds is not None and candidate <= bounds[1]:
+        return max(candidate, bounds[0]).astimezone(pytz.UTC)
+    next_open, _ = calendar.session_bounds(calendar.next_session(today))
+    return next_open.astimezone(pytz.UTC)
 
 
 def _load_models_data() -> Optional[List[Dict]]:
-    try:
-        with open(MODELS_DATA_FILE, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
+    models_data = models_state.models()
+    if models_data is None:
         logger.warning(f"Models data file not found: {MODELS_DATA_FILE}")
-        return None
-    except Exception as exc:
-        logger.error(f"Failed to load models data: {exc}")
-        return None
-
+    return models_data
 
-def _save_models_data(models_data: List[Dict]) -> None:
-    with open(MODELS_DATA_FILE, "w") as fh:
-        json.dump(models_data, fh, indent=4)
 
+def _held_symbols(models_data: List[Dict], category: str) -> set:
+    symbols = set()
+    for model in models_data:
+        if model.get("category") == category:
+            positions = (model.get("portfolio", {}) or {}).get("positions", {}) or {}
+            symbols.update(positions.keys())
+    return symbols
 
-def _update_profit_history(model: Dict, total_value: float, profit: float) -> None:
-    try:
-        history = model.setdefault("profitHistory", [])
-        current_timestamp = datetime.now().isoformat()
-        current_date = current_timestamp[:10]
-        new_entry = {
-            "timestamp": current_timestamp,
-            "profit": profit,
-            "totalValue": total_value,
-        }
 
-        if history:
-            last_entry = history[-1]
-            last_date = last_entry.get("timestamp", "")[:10]
-            if last_date == current_date:
-                history[-1] = new_entry
-            else:
-                history.append(new_entry)
+def _fetch_quotes(
+    factories: Dict[str, Callable[[], Awaitable[Optional[float]]]],
+) -> Dict[str, float]:
+    """Run one spot-quote request per key concurrently; keep positive prices."""
+    keys = list(factories)
+    results = run_coroutine_sync(
+        gather_bounded([factories[key] for key in keys], QUOTE_CONCURRENCY)
+    )
+    quotes: Dict[str, float] = {}
+    for key, price in zip(keys, results):
+        if isinstance(price, BaseException):
+            logger.error(f"❌ Error fetching price for {key}: {price}")
+            continue
+        try:
+            price = float(price)
+        except (TypeError, ValueError):
+            logger.warning(f"⚠️ Failed to get price for {key}")
+            continue
+        if price > 0:
+            quotes[key] = price
+            logger.debug(f"✅ {key}: ${price:.2f}")
         else:
-            history.append(new_entry)
-    except Exception as exc:
-        logger.error(
-            f"Failed to update profit history for {model.get('name', 'Unknown')}: {exc}"
-        )
+            logger.warning(f"⚠️ Failed to get price for {key}")
+    return quotes
 
 
 class RealtimePriceUpdater:
@@ -134,22 +125,9 @@ class RealtimePriceUpdater:
     def _is_first_startup(self) -> bool:
         """检查是否需要初始化benchmark模型（没有benchmark模型）"""
         try:
-            # 文件不存在时肯定需要初始化
-            if not os.path.exists(MODELS_DATA_FILE):
-                return True
-
-            with open(MODELS_DATA_FILE, "r") as f:
-                data = json.load(f)
-
-            # 检查是否存在benchmark模型 (QQQ/VOO)
-            benchmark_models = [
-                m for m in data if m.get("id") in ["qqq-benchmark", "voo-benchmark"]
-            ]
-            has_benchmarks = len(benchmark_models) > 0
-
-            logger.debug(
-                f"Found {len(benchmark_models)} benchmark models, needs initialization: {not has_benchmarks}"
-            )
+            # 检查内存中的模型是否包含benchmark模型 (QQQ/VOO)
+            has_benchmarks = models_state.has_model(["qqq-benchmark", "voo-benchmark"])
+            logger.debug(f"Benchmark models needs initialization: {not has_benchmarks}")
             return not has_benchmarks
 
         except Exception as e:
@@ -202,17 +180,21 @@ class RealtimePriceUpdater:
             price_cache = self._fetch_prices_batch(symbols)
 
             # 更新所有stock模型的实时数据
-            updated_count = 0
+            records = []
             for model in models_data:
                 if model.get("category") == "stock":
-                    if self._update_single_model_realtime_data(model, price_cache):
-                        updated_count += 1
+                    record = self._update_single_model_realtime_data(model, price_cache)
+                    if record is not None:
+                        records.append(record)
+            updated_count = len(records)
 
             # 添加/更新QQQ和VOO benchmark模型
-            self._update_benchmark_models(models_data, price_cache)
+            benchmark_record = self._update_benchmark_models(models_data, price_cache)
+            if benchmark_record is not None:
+                records.append(benchmark_record)
 
-            # 保存更新后的数据
-            _save_models_data(models_data)
+            # 追加写入价格tick（定期整体保存）
+            models_state.commit(records)
 
             logger.info(
                 f"✅ Successfully updated {updated_count} stock models + benchmarks"
@@ -228,14 +210,8 @@ class RealtimePriceUpdater:
 
     def _collect_all_symbols(self, models_data: List[Dict]) -> List[str]:
         """收集所有需要更新价格的股票symbols"""
-        symbols = set()
-
         # 从stock模型中收集symbols
-        for model in models_data:
-            if model.get("category") == "stock":
-                portfolio = model.get("portfolio", {})
-                positions = portfolio.get("positions", {})
-                symbols.update(positions.keys())
+        symbols = _held_symbols(models_data, "stock")
 
         # 添加QQQ和VOO
         symbols.add("QQQ")
@@ -244,87 +220,57 @@ class RealtimePriceUpdater:
         return list(symbols)
 
     def _fetch_prices_batch(self, symbols: List[str]) -> Dict[str, float]:
-        """批量获取股票实时价格"""
-        price_cache = {}
-
+        """一次批量请求获取所有股票的最新价（共享短期报价缓存）"""
+        try:
+            price_cache = self.stock_fetcher.get_current_prices(symbols)
+        except Exception as e:
+            logger.error(f"❌ Error fetching stock quotes: {e}")
+            return {}
         for symbol in symbols:
-            try:
-                price = self.stock_fetcher.get_current_price(symbol)
-                if price is not None and price > 0:
-                    price_cache[symbol] = price
-                    logger.debug(f"✅ {symbol}: ${price:.2f}")
-                else:
-                    logger.warning(f"⚠️ Failed to get price for {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Error fetching price for {symbol}: {e}")
-
+            if symbol not in price_cache:
+                logger.warning(f"⚠️ Failed to get price for {symbol}")
         return price_cache
 
     def _update_single_model_realtime_data(
         self, model: Dict, price_cache: Dict[str, float]
-    ) -> bool:
-        """更新单个stock模型的实时数据"""
+    ) -> Optional[Dict[str, Any]]:
+        """计算单个stock模型的实时数据，返回价格tick"""
         try:
-            portfolio = model.get("portfolio", {})
-            positions = portfolio.get("positions", {})
-            cash = portfolio.get("cash", 0.0)
-
-            # 更新每个position的current_price并计算新的total_value
-            total_value = cash
-
-            for symbol, position in positions.items():
-                if symbol in price_cache:
-                    new_price = price_cache[symbol]
-                    position["current_price"] = new_price
-                    total_value += position["quantity"] * new_price
-                else:
-                    # 如果没有获取到新价格，使用现有价格
-                    current_price = position.get("current_price", 0.0)
-                    total_value += position["quantity"] * current_price
-
-            # 更新portfolio的total_value
-            portfolio["total_value"] = total_value
-
             # 更新模型级别的profit和performance（基于stock初始资金1000）
-            initial_cash = TRADING_CONFIG["initial_cash_stock"]
-            model["profit"] = total_value - initial_cash
-            model["performance"] = model["profit"] / initial_cash * 100
-
-            # 更新profit history - 添加新的数据点
-            _update_profit_history(model, total_value, model["profit"])
-
+            record = mark_model(
+                model, price_cache, TRADING_CONFIG["initial_cash_stock"]
+            )
             logger.debug(
-                f"Updated {model['name']}: total_value=${total_value:.2f}, profit=${model['profit']:.2f}, performance={model['performance']:.4f}"
+                f"Updated {model['name']}: total_value=${record['total_value']:.2f}, profit=${record['profit']:.2f}, performance={record['performance']:.4f}"
             )
-            return True
+            return record
 
         except Exception as e:
             logger.error(f"Failed to update model {model.get('name', 'Unknown')}: {e}")
-            return False
+            return None
 
     def _update_benchmark_models(
         self, models_data: List[Dict], price_cache: Dict[str, float]
-    ) -> None:
-        """添加或更新QQQ和VOO benchmark模型"""
+    ) -> Optional[Dict[str, Any]]:
+        """生成替换QQQ和VOO benchmark模型的tick"""
 
         # 找到stock模型中最早的allocation history日期
         earliest_date = self._find_earliest_allocation_date(models_data)
         if not earliest_date:
             logger.warning("⚠️ No allocation history found, skipping benchmark update")
-            return
-
-        # 移除现有的benchmark模型
-        models_data[:] = [m for m in models_data if m.get("category") != "benchmark"]
+            return None
 
-        # 为QQQ和VOO创建benchmark模型
+        # 为QQQ和VOO创建benchmark模型（替换现有的benchmark模型）
+        benchmarks = []
         for symbol in ["QQQ", "VOO"]:
             if symbol in price_cache:
                 benchmark_model = self._create_benchmark_model(
                     symbol, earliest_date, price_cache[symbol]
                 )
                 if benchmark_model:
-                    models_data.append(benchmark_model)
+                    benchmarks.append(benchmark_model)
                     logger.info(f"📈 Added benchmark model for {symbol}")
+        return replace_category("benchmark", benchmarks)
 
     def _find_earliest_allocation_date(self, models_data: List[Dict]) -> Optional[str]:
         """找到所有stock模型中最早的allocation历史日期"""
@@ -413,19 +359,21 @@ class PolymarketPriceUpdater:
                 logger.warning("⚠️ No models data found, skipping polymarket update")
                 return
 
-            price_cache = self._build_price_cache()
+            price_cache = self._build_price_cache(models_data)
             if not price_cache:
                 logger.warning("⚠️ No polymarket price data available, skipping update")
                 return
 
-            updated_count = 0
+            records = []
             for model in models_data:
                 if model.get("category") != "polymarket":
                     continue
-                if self._update_single_model(model, price_cache):
-                    updated_count += 1
+                record = self._update_single_model(model, price_cache)
+                if record is not None:
+                    records.append(record)
+            updated_count = len(records)
 
-            _save_models_data(models_data)
+            models_state.commit(records)
             logger.info(f"✅ Successfully updated {updated_count} polymarket models")
 
         except Exception as exc:
@@ -440,27 +388,26 @@ class PolymarketPriceUpdater:
                 f"🕒 Next polymarket price update target: {next_time.isoformat()}"
             )
 
-    def _build_price_cache(self) -> Dict[str, float]:
+    def _build_price_cache(self, models_data: List[Dict]) -> Dict[str, float]:
+        """Spot prices for the outcome tokens the polymarket models hold."""
         system = self._get_polymarket_system()
         if system is None:
             return {}
 
-        try:
-            market_data = system._fetch_market_data()
-        except Exception as exc:
-            logger.error(f"❌ Failed to fetch polymarket market data: {exc}")
-            return {}
-
-        price_cache: Dict[str, float] = {}
-        for symbol, payload in market_data.items():
-            price = payload.get("price")
-            if price is None:
-                continue
-            try:
-                price_cache[symbol] = float(price)
-            except (TypeError, ValueError):
-                continue
-        return price_cache
+        held = _held_symbols(models_data, "polymarket")
+        fetcher = AsyncPolymarketFetcher()
+        factories = {}
+        for market_id in list(system.universe):
+            market_info = system.market_info.get(market_id, {})
+            question = market_info.get("question")
+            outcomes = market_info.get("outcomes") or []
+            token_ids = market_info.get("token_ids") or []
+            for outcome, token_id in zip(outcomes, token_ids):
+                # positions are keyed like the system's market data
+                symbol = f"{question}_{outcome}"
+                if token_id and symbol in held:
+                    factories[symbol] = partial(fetcher.get_current_price, token_id)
+        return _fetch_quotes(factories)
 
     def _get_polymarket_system(self):
         try:
@@ -482,50 +429,33 @@ class PolymarketPriceUpdater:
 
     def _update_single_model(
         self, model: Dict[str, Any], price_cache: Dict[str, float]
-    ) -> bool:
+    ) -> Optional[Dict[str, Any]]:
         try:
-            portfolio = model.get("portfolio", {})
-            positions = portfolio.get("positions", {}) or {}
-            cash = float(portfolio.get("cash", 0.0))
-            total_value = cash
-
-            for symbol, position in positions.items():
-                price = price_cache.get(symbol)
-                if price is not None:
-                    position["current_price"] = price
-                else:
-                    price = float(position.get("current_price", 0.0))
-
-                quantity = float(position.get("quantity", 0.0))
-                total_value += quantity * price
-
-            portfolio["total_value"] = total_value
-
-            profit = total_value - self.initial_cash
-            model["profit"] = profit
-            model["performance"] = (
-                (profit / self.initial_cash) * 100 if self.initial_cash else 0.0
-            )
-
-            _update_profit_history(model, total_value, profit)
-
+            record = mark_model(model, price_cache, self.initial_cash)
             logger.debug(
-                f"Updated polymarket model {model.get('name', 'Unknown')}: total_value=${total_value:.2f}, profit=${profit:.2f}"
+                f"Updated polymarket model {model.get('name', 'Unknown')}: total_value=${record['total_value']:.2f}, profit=${record['profit']:.2f}"
             )
-            return True
+            return record
 
         except Exception as exc:
             logger.error(
                 f"❌ Failed to update polymarket model {model.get('name', 'Unknown')}: {exc}"
             )
-            return False
+            return None
 
 
 class BitMEXPriceUpdater:
     """Price updater for BitMEX perpetual contracts."""
 
+    BENCHMARKS = [
+        ("XBTUSD", "BTC-HOLD (Bitcoin Buy & Hold)"),
+        ("ETHUSD", "ETH-HOLD (Ethereum Buy & Hold)"),
+    ]
+
     def __init__(self) -> None:
         self.initial_cash = 1000.0  # BitMEX initial cash
+        # (symbol, date) -> close; the benchmark baseline never changes
+        self._earliest_prices: Dict[tuple, float] = {}
 
     def update_realtime_prices_and_values(self) -> None:
         """Update BitMEX contract prices and account values (24/7 trading)."""
@@ -537,144 +467,85 @@ class BitMEXPriceUpdater:
                 logger.warning("⚠️ No models data found, skipping BitMEX update")
                 return
 
-            price_cache = self._build_price_cache()
+            price_cache = self._build_price_cache(models_data)
             if not price_cache:
                 logger.warning("⚠️ No BitMEX price data available, skipping update")
                 return
 
-            updated_count = 0
+            records = []
             for model in models_data:
                 if model.get("category") != "bitmex":
                     continue
-                if self._update_single_model(model, price_cache):
-                    updated_count += 1
+                record = self._update_single_model(model, price_cache)
+                if record is not None:
+                    records.append(record)
+            updated_count = len(records)
 
             # Add/update crypto benchmarks (BTC-HOLD, ETH-HOLD)
-            self._update_crypto_benchmark_models(models_data, price_cache)
+            benchmark_record = self._update_crypto_benchmark_models(
+                models_data, price_cache
+            )
+            if benchmark_record is not None:
+                records.append(benchmark_record)
 
-            _save_models_data(models_data)
+            models_state.commit(records)
             logger.info(f"✅ Successfully updated {updated_count} BitMEX models + benchmarks")
 
         except Exception as exc:
             logger.error(f"❌ Failed to update BitMEX prices: {exc}")
             raise
 
-    def _build_price_cache(self) -> Dict[str, float]:
-        """Fetch current prices for all BitMEX contracts."""
-        system = self._get_bitmex_system()
-        if system is None:
-            return {}
-
-        try:
-            # Fetch market data including current prices
-            market_data = system._fetch_market_data()
-        except Exception as exc:
-            logger.error(f"❌ Failed to fetch BitMEX market data: {exc}")
-            return {}
-
-        price_cache: Dict[str, float] = {}
-        for symbol, payload in market_data.items():
-            price = payload.get("current_price")
-            if price is None:
-                continue
-            try:
-                price_cache[symbol] = float(price)
-            except (TypeError, ValueError):
-                continue
-
+    def _build_price_cache(self, models_data: List[Dict]) -> Dict[str, float]:
+        """Fetch mark prices for held contracts and the benchmark symbols."""
+        symbols = _held_symbols(models_data, "bitmex")
+        symbols.update(symbol for symbol, _ in self.BENCHMARKS)
+        fetcher = AsyncBitMEXFetcher()
+        price_cache = _fetch_quotes(
+            {
+                symbol: partial(fetcher.get_price, symbol, "mark")
+                for symbol in sorted(symbols)
+            }
+        )
         logger.debug(f"📊 Fetched prices for {len(price_cache)} BitMEX contracts")
         return price_cache
 
-    def _get_bitmex_system(self):
-        """Get BitMEX system instance."""
-        try:
-            from .main import get_bitmex_system
-
-            system = get_bitmex_system()
-            if system is not None:
-                return system
-        except Exception:
-            pass
-
-        try:
-            from live_trade_bench.systems import BitMEXPortfolioSystem
-
-            return BitMEXPortfolioSystem.get_instance()
-        except Exception as exc:
-            logger.error(f"❌ Unable to access BitMEX system: {exc}")
-            return None
-
     def _update_single_model(
         self, model: Dict[str, Any], price_cache: Dict[str, float]
-    ) -> bool:
-        """Update a single BitMEX model with new prices."""
+    ) -> Optional[Dict[str, Any]]:
+        """Price tick for a single BitMEX model."""
         try:
-            portfolio = model.get("portfolio", {})
-            positions = portfolio.get("positions", {}) or {}
-            cash = float(portfolio.get("cash", 0.0))
-            total_value = cash
-
-            for symbol, position in positions.items():
-                price = price_cache.get(symbol)
-                if price is not None:
-                    position["current_price"] = price
-                else:
-                    price = float(position.get("current_price", 0.0))
-
-                quantity = float(position.get("quantity", 0.0))
-                total_value += quantity * price
-
-            portfolio["total_value"] = total_value
-
-            profit = total_value - self.initial_cash
-            model["profit"] = profit
-            model["performance"] = (
-                (profit / self.initial_cash) * 100 if self.initial_cash else 0.0
-            )
-
-            _update_profit_history(model, total_value, profit)
-
+            record = mark_model(model, price_cache, self.initial_cash)
             logger.debug(
-                f"Updated BitMEX model {model.get('name', 'Unknown')}: total_value=${total_value:.2f}, profit=${profit:.2f}"
+                f"Updated BitMEX model {model.get('name', 'Unknown')}: total_value=${record['total_value']:.2f}, profit=${record['profit']:.2f}"
             )
-            return True
+            return record
 
         except Exception as exc:
             logger.error(
                 f"❌ Failed to update BitMEX model {model.get('name', 'Unknown')}: {exc}"
             )
-            return False
+            return None
 
     def _update_crypto_benchmark_models(
         self, models_data: List[Dict], price_cache: Dict[str, float]
-    ) -> None:
-        """Add or update BTC-HOLD and ETH-HOLD benchmark models."""
+    ) -> Optional[Dict[str, Any]]:
+        """Tick replacing the BTC-HOLD and ETH-HOLD benchmark models."""
         # Find earliest allocation date from BitMEX models
         earliest_date = self._find_earliest_bitmex_date(models_data)
         if not earliest_date:
             logger.warning("⚠️ No BitMEX allocation history found, skipping crypto benchmarks")
-            return
-
-        # Remove existing bitmex benchmark models
-        models_data[:] = [
-            m for m in models_data
-            if m.get("category") != "bitmex-benchmark"
-        ]
-
-        # Create benchmarks for BTC and ETH
-        benchmarks = [
-            ("XBTUSD", "BTC-HOLD (Bitcoin Buy & Hold)"),
-            ("ETHUSD", "ETH-HOLD (Ethereum Buy & Hold)"),
-        ]
+            return None
 
-        for symbol, name in benchmarks:
+        benchmarks = []
+        for symbol, name in self.BENCHMARKS:
             if symbol in price_cache:
                 benchmark_model = self._create_crypto_benchmark(
                     symbol, name, earliest_date, price_cache[symbol]
                 )
                 if benchmark_model:
-                    models_data.append(benchmark_model)
+                    benchmarks.append(benchmark_model)
                     logger.info(f"📈 Added crypto benchmark: {name}")
+        return replace_category("bitmex-benchmark", benchmarks)
 
     def _find_earliest_bitmex_date(self, models_data: List[Dict]) -> Optional[str]:
         """Find the earliest allocation date from all BitMEX models."""
@@ -692,31 +563,35 @@ class BitMEXPriceUpdater:
 
         return earliest_date
 
+    def _fetch_earliest_price(self, symbol: str, earliest_date: str) -> Optional[float]:
+        from live_trade_bench.fetchers.bitmex_fetcher import BitMEXFetcher
+
+        fetcher = BitMEXFetcher()
+
+        # Get historical price for earliest date
+        earliest_dt = datetime.strptime(earliest_date, "%Y-%m-%d")
+        start_dt = earliest_dt - timedelta(days=1)
+        end_dt = earliest_dt + timedelta(days=1)
+
+        try:
+            history = fetcher.get_price_history(symbol, start_dt, end_dt, "1d")
+            if history and len(history) > 0:
+                return float(history[0].get("close", 0))
+            logger.warning(f"⚠️ No historical price for {symbol} on {earliest_date}")
+        except Exception as e:
+            logger.error(f"Failed to fetch historical price for {symbol}: {e}")
+        return None
+
     def _create_crypto_benchmark(
         self, symbol: str, name: str, earliest_date: str, current_price: float
     ) -> Optional[Dict]:
         """Create a crypto buy-and-hold benchmark model."""
         try:
-            from live_trade_bench.fetchers.bitmex_fetcher import BitMEXFetcher
-
-            fetcher = BitMEXFetcher()
-
-            # Get historical price for earliest date
-            from datetime import datetime, timedelta
-            earliest_dt = datetime.strptime(earliest_date, "%Y-%m-%d")
-            start_dt = earliest_dt - timedelta(days=1)
-            end_dt = earliest_dt + timedelta(days=1)
-
-            try:
-                history = fetcher.get_price_history(symbol, start_dt, end_dt, "1d")
-                if history and len(history) > 0:
-                    earliest_price = float(history[0].get("close", 0))
-                else:
-                    logger.warning(f"⚠️ No historical price for {symbol} on {earliest_date}")
-                    return None
-            except Exception as e:
-                logger.error(f"Failed to fetch historical price for {symbol}: {e}")
-                return None
+            earliest_price = self._earliest_prices.get((symbol, earliest_date))
+            if earliest_price is None:
+                earliest_price = self._fetch_earliest_price(symbol, earliest_date)
+                if earliest_price is not None and earliest_price > 0:
+                    self._earliest_prices[(symbol, earliest_date)] = earliest_price
 
             if earliest_price is None or earliest_price <= 0:
                 logger.warning(f"⚠️ Invalid earliest price for {symbol}")
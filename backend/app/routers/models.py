@@ -1,17 +1,75 @@
+import gzip
 import logging
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 
+from ..columnar import encode_msgpack, msgpack, normalize_since, to_columnar
 from ..config import MODELS_DATA_FILE
-from .router_utils import read_json_or_404
+from ..data_store import encode_json
+from .router_utils import (
+    accepts_gzip,
+    cached_json_or_404,
+    cached_json_response,
+    json_body_response,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+COLUMNAR_MEDIA_TYPES = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+}
+
 
 @router.get("/models", response_model=List[Dict[str, Any]], include_in_schema=False)
 @router.get("/models/", response_model=List[Dict[str, Any]])
-def get_models():
-    return read_json_or_404(MODELS_DATA_FILE)
+def get_models(request: Request):
+    return cached_json_response(request, MODELS_DATA_FILE)
+
+
+@router.get("/models/columnar")
+def get_models_columnar(
+    request: Request, since: Optional[str] = None, format: str = "json"
+):
+    """``/models`` as column arrays; ``since`` returns only newer history points.
+
+    ``format`` is ``json`` or ``msgpack``; the body is gzip-compressed when the
+    client accepts it.
+    """
+    try:
+        since = normalize_since(since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since must be an ISO timestamp.")
+    if format not in COLUMNAR_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be json or msgpack.")
+    if format == "msgpack" and msgpack is None:
+        raise HTTPException(status_code=406, detail="msgpack is not available.")
+
+    serialize = encode_msgpack if format == "msgpack" else encode_json
+    compress = accepts_gzip(request)
+
+    def encode(data: Any) -> bytes:
+        body = serialize(data)
+        # fixed mtime keeps the ETag stable across rebuilds
+        return gzip.compress(body, compresslevel=6, mtime=0) if compress else body
+
+    entry = cached_json_or_404(MODELS_DATA_FILE)
+    body, etag = entry.derived(
+        ("columnar", since, format, compress),
+        partial(to_columnar, since=since),
+        encode,
+    )
+    headers = {"Vary": "Accept-Encoding"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return json_body_response(
+        request,
+        body,
+        etag,
+        media_type=COLUMNAR_MEDIA_TYPES[format],
+        headers=headers,
+    )
@@ -1,20 +1,61 @@
-import json
-import os
-from typing import Any, Dict, List, Sequence, TypeVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, TypeVar
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
+
+from ..data_store import CachedJSON, data_store
 
 T = TypeVar("T")
 
 
-def read_json_or_404(file_path: str) -> Dict[str, Any]:
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="Data not ready yet.")
+def cached_json_or_404(file_path: str) -> CachedJSON:
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        entry = data_store.get(file_path)
+    except ValueError:
         raise HTTPException(status_code=500, detail="Error reading data file.")
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Data not ready yet.")
+    return entry
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates
+    )
+
+
+def json_body_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    media_type: str = "application/json",
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def cached_json_response(
+    request: Request,
+    file_path: str,
+    key: Optional[Hashable] = None,
+    build: Optional[Callable[[Any], Any]] = None,
+) -> Response:
+    """Serve ``file_path`` (or ``build(data)`` memoized under ``key``) from cache."""
+    entry = cached_json_or_404(file_path)
+    if build is None:
+        return json_body_response(request, entry.body, entry.etag)
+    body, etag = entry.derived(key, build)
+    return json_body_response(request, body, etag)
 
 
 def slice_limit(
@@ -1,18 +1,18 @@
 from typing import Any, Dict
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from ..config import SYSTEM_DATA_FILE
 from ..counter_data import get_visit_count, increment_visit_count
-from .router_utils import read_json_or_404
+from .router_utils import cached_json_response
 
 router = APIRouter()
 
 
 @router.get("/system", response_model=Dict[str, Any], include_in_schema=False)
 @router.get("/system/", response_model=Dict[str, Any])
-def get_system_status():
-    return read_json_or_404(SYSTEM_DATA_FILE)
+def get_system_status(request: Request):
+    return cached_json_response(request, SYSTEM_DATA_FILE)
 
 
 @router.get("/views")
@@ -1,7 +1,17 @@
-import json
-from typing import Dict, List
+import copy
+from typing import Any, Dict, List
 
 from .config import SOCIAL_DATA_FILE
+from .data_store import data_store
+from .jobs import BITMEX_SYSTEM, POLYMARKET_SYSTEM, STOCK_SYSTEM, lock_manager
+
+
+def _detach(lock_name: str, system: Any) -> Any:
+    """Shallow copy of ``system`` to scrape with, taken under its lock."""
+    with lock_manager.hold(lock_name):
+        if not system.universe:
+            system.initialize_for_live()
+        return copy.copy(system)
 
 
 def update_social_data() -> None:
@@ -24,33 +34,36 @@ def update_social_data() -> None:
             print("❌ Failed to get system instances")
             return
 
-        # Initialize systems if not already done
-        if not stock_system.universe:
-            stock_system.initialize_for_live()
-        if not polymarket_system.universe:
-            polymarket_system.initialize_for_live()
-        if not bitmex_system.universe:
-            bitmex_system.initialize_for_live()
+        # Scrape with detached copies so the trading cycle does not wait on
+        # the Reddit requests
+        stock_view = _detach(STOCK_SYSTEM, stock_system)
+        polymarket_view = _detach(POLYMARKET_SYSTEM, polymarket_system)
+        bitmex_view = _detach(BITMEX_SYSTEM, bitmex_system)
 
         # Fetch social data using system methods
         print("  - Fetching stock social media data...")
-        stock_social = stock_system._fetch_social_data()
+        stock_social = stock_view._fetch_social_data()
         print(
             f"  - Fetched {len([item for sublist in stock_social.values() for item in sublist])} stock social media posts."
         )
 
         print("  - Fetching polymarket social media data...")
-        polymarket_social = polymarket_system._fetch_social_data()
+        polymarket_social = polymarket_view._fetch_social_data()
         print(
             f"  - Fetched {len([item for sublist in polymarket_social.values() for item in sublist])} polymarket social media posts."
         )
 
         print("  - Fetching bitmex social media data...")
-        bitmex_social = bitmex_system._fetch_social_data()
+        bitmex_social = bitmex_view._fetch_social_data()
         print(
             f"  - Fetched {len([item for sublist in bitmex_social.values() for item in sublist])} bitmex social media posts."
         )
 
+        if stock_view.universe is not stock_system.universe:
+            # the stock scrape refreshes the trending universe
+            with lock_manager.hold(STOCK_SYSTEM):
+                stock_system.universe = stock_view.universe
+
         all_social_data["stock"] = [
             item for sublist in stock_social.values() for item in sublist
         ]
@@ -67,8 +80,7 @@ def update_social_data() -> None:
 
         traceback.print_exc()
 
-    with open(SOCIAL_DATA_FILE, "w") as f:
-        json.dump(all_social_data, f, indent=4)
+    data_store.write_json(SOCIAL_DATA_FILE, all_social_data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+Startup phase timing and readiness reporting.
+
+``startup_state`` records how long each startup phase took and whether the
+trading systems are initialized yet. With lazy startup the API comes up
+first (serving the cached ``models_data.json``) and ``/ready`` reports
+progress until the background initialization finishes.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+INITIALIZING = "initializing"
+READY = "ready"
+FAILED = "failed"
+
+
+class StartupState:
+    def __init__(self) -> None:
+        self.status = PENDING
+        self.phase: Optional[str] = None
+        self.error: Optional[str] = None
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase_timer(self, name: str) -> Iterator[None]:
+        with self._lock:
+            self.phase = name
+            if self.status == PENDING:
+                self.status = INITIALIZING
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.timings[name] = round(elapsed, 3)
+            logger.info(f"⏱️ Startup phase '{name}' took {elapsed:.2f}s")
+
+    def mark_ready(self) -> None:
+        with self._lock:
+            self.status = READY
+            self.phase = None
+            self.timings["total"] = round(time.perf_counter() - self._started, 3)
+        self._ready.set()
+        logger.info(f"✅ Systems ready after {self.timings['total']:.2f}s")
+
+    def mark_failed(self, exc: BaseException) -> None:
+        with self._lock:
+            self.status = FAILED
+            self.error = str(exc)
+        self._ready.set()
+        logger.error(f"❌ Startup failed during '{self.phase}': {exc}")
+
+    @property
+    def ready(self) -> bool:
+        return self.status == READY
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until initialization finished (successfully or not)."""
+        return self._ready.wait(timeout) and self.ready
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": self.status,
+                "phase": self.phase,
+                "error": self.error,
+                "timings": dict(self.timings),
+            }
+
+
+startup_state = StartupState()
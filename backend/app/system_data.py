@@ -1,4 +1,3 @@
-import json
 import os
 import sys
 from datetime import datetime
@@ -10,6 +9,7 @@ from live_trade_bench.systems import (
 )
 
 from .config import SYSTEM_DATA_FILE, TRADING_CONFIG, get_base_model_configs
+from .data_store import data_store
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if project_root not in sys.path:
@@ -65,8 +65,7 @@ def update_system_status() -> None:
             "combined_total_value": total_value_stock + total_value_poly + total_value_bitmex,
         }
 
-        with open(SYSTEM_DATA_FILE, "w") as f:
-            json.dump(status, f, indent=4)
+        data_store.write_json(SYSTEM_DATA_FILE, status)
         print(f"✅ System status updated and saved to {SYSTEM_DATA_FILE}")
 
     except Exception as e:
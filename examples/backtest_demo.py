@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
+from live_trade_bench.accounts import load_transcript
 from live_trade_bench.systems.bitmex_system import BitMEXPortfolioSystem
 from live_trade_bench.systems.polymarket_system import PolymarketPortfolioSystem
 from live_trade_bench.systems.stock_system import StockPortfolioSystem
@@ -300,6 +301,15 @@ def save_models_data(
                     continue
                 agent = system.agents[acc_agent_name]
                 model_data = _create_model_data(agent, account, market_type)
+                # the transcript store of this process goes away with it, so
+                # the init file carries the transcripts inline
+                model_data["allocationHistory"] = [
+                    {
+                        **{k: v for k, v in s.items() if k != "transcript_id"},
+                        **load_transcript(s),
+                    }
+                    for s in model_data["allocationHistory"]
+                ]
                 all_models_data.append(_serialize_positions(model_data))
     with open(out_path, "w") as f:
         json.dump(all_models_data, f, indent=4)
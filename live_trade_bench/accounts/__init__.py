@@ -4,19 +4,35 @@ Account management system for portfolio management
 
 from __future__ import annotations
 
-from .base_account import BaseAccount, Position, Transaction
+from .base_account import BaseAccount, Position, Transaction, apply_allocations
 from .bitmex_account import BitMEXAccount, create_bitmex_account
+from .market_snapshot import MarketSnapshot
 from .polymarket_account import PolymarketAccount, create_polymarket_account
+from .portfolio_engine import PortfolioEngine, PositionBook
 from .stock_account import StockAccount, create_stock_account
+from .transcript_store import (
+    TranscriptStore,
+    configure_transcript_store,
+    get_transcript_store,
+    load_transcript,
+)
 
 __all__ = [
     "BaseAccount",
     "Position",
     "Transaction",
+    "apply_allocations",
+    "MarketSnapshot",
+    "PortfolioEngine",
+    "PositionBook",
     "StockAccount",
     "create_stock_account",
     "PolymarketAccount",
     "create_polymarket_account",
     "BitMEXAccount",
     "create_bitmex_account",
+    "TranscriptStore",
+    "get_transcript_store",
+    "configure_transcript_store",
+    "load_transcript",
 ]
@@ -2,14 +2,62 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from .market_snapshot import MarketSnapshot
+from .portfolio_engine import (
+    MIN_POSITION_QUANTITY,
+    PortfolioEngine,
+    PositionBook,
+    PositionRef,
+    PositionsView,
+)
+from .transcript_store import get_transcript_store
 
 PositionType = TypeVar("PositionType")
 TransactionType = TypeVar("TransactionType")
 
 
+def _slotted(cls: type) -> type:
+    """Rebuild a dataclass with ``__slots__`` (``dataclass(slots=True)`` is 3.10+).
+
+    Field defaults already live in the generated ``__init__``, so the class
+    attributes can be dropped to make room for the slot descriptors.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+
+    # frozen classes block __setattr__, so restore slot state directly
+    def __getstate__(self: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self: Any, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class Position:
     symbol: str
@@ -27,7 +75,8 @@ class Position:
         return self.quantity * (self.current_price - self.average_price)
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class Transaction:
     transaction_id: uuid.UUID
     ticker: str
@@ -38,13 +87,32 @@ class Transaction:
 
 
 @dataclass
-class BaseAccount(ABC, Generic[PositionType, TransactionType]):
+class _AccountInit:
     initial_cash: float = 0.0
-    cash_balance: float = 0.0
+    # constructor-only: the balance lives in the account's engine row
+    cash_balance: InitVar[float] = 0.0
+
+
+@dataclass
+class BaseAccount(_AccountInit, ABC, Generic[PositionType, TransactionType]):
     target_allocations: Dict[str, float] = field(default_factory=dict)
     allocation_history: List[Dict[str, Any]] = field(default_factory=list)
     last_rebalance: Optional[str] = None
 
+    def __post_init__(self, cash_balance: float) -> None:
+        engine, row = self._book()
+        engine._cash[row] = cash_balance
+
+    @property
+    def cash_balance(self) -> float:
+        engine, row = self._book()
+        return float(engine._cash[row])
+
+    @cash_balance.setter
+    def cash_balance(self, value: float) -> None:
+        engine, row = self._book()
+        engine._cash[row] = value
+
     def record_allocation(
         self,
         metadata_map: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -82,28 +150,131 @@ class BaseAccount(ABC, Generic[PositionType, TransactionType]):
             "performance": performance,
             "allocations": self.target_allocations,
             "allocations_array": allocations_array,
-            "llm_input": llm_input,
-            "llm_output": llm_output,
+            "transcript_id": None,
         }
+        if llm_input is not None or llm_output is not None:
+            # prompts are kilobytes each; keep only a reference in the history
+            store = get_transcript_store()
+            snapshot["transcript_id"] = store.put(llm_input, llm_output)
         self.allocation_history.append(snapshot)
 
+    # -- engine row --------------------------------------------------------
+
+    def _book(self) -> Tuple[PortfolioEngine, int]:
+        book = self.__dict__.get("_engine_row")
+        if book is None:
+            # standalone account: a private one-row engine until attached
+            engine = PortfolioEngine(row_capacity=1)
+            book = self.__dict__["_engine_row"] = (engine, engine.add_row())
+        return book
+
+    @property
+    def engine(self) -> PortfolioEngine:
+        return self._book()[0]
+
+    def attach(self, engine: PortfolioEngine, row: Optional[int] = None) -> None:
+        """Move this account's cash and positions into a row of ``engine``.
+
+        ``row`` reuses an existing row, whose contents are replaced; by
+        default a new row is added.
+        """
+        old_engine, old_row = self._book()
+        if old_engine is engine:
+            return
+        cash = float(old_engine.cash[old_row])
+        if row is None:
+            row = engine.add_row(cash)
+        else:
+            engine.clear_row(row)
+            engine.cash[row] = cash
+        for col in old_engine.held_columns(old_row):
+            engine.set_position(
+                row,
+                old_engine.symbols[col],
+                old_engine._quantity[old_row, col],
+                old_engine._average_price[old_row, col],
+                old_engine._current_price[old_row, col],
+                old_engine.urls.get((old_row, col)),
+            )
+        old_engine.clear_row(old_row)
+        self.__dict__["_engine_row"] = (engine, row)
+
+    @property
+    def positions(self) -> PositionsView:
+        engine, row = self._book()
+        return PositionsView(engine, row)
+
+    # -- valuation -----------------------------------------------------------
+
     def get_total_value(self) -> float:
         return self.cash_balance + self.get_positions_value()
 
     def get_positions_value(self) -> float:
-        return sum(self._get_position_value(ticker) for ticker in self.get_positions())
+        return self.position_book(MIN_POSITION_QUANTITY).total_value()
+
+    def get_positions(self) -> Dict[str, Any]:
+        engine, row = self._book()
+        return {
+            engine.symbols[col]: PositionRef(engine, row, col)
+            for col in engine.held_columns(row, MIN_POSITION_QUANTITY)
+        }
+
+    def get_position(self, symbol: str) -> Optional[PositionRef]:
+        return self.positions.get(symbol)
+
+    def _get_position_value(self, symbol: str) -> float:
+        position = self.positions.get(symbol)
+        return position.market_value if position else 0.0
+
+    def update_position_price(self, symbol: str, current_price: float) -> None:
+        position = self.positions.get(symbol)
+        if position is not None:
+            position.current_price = current_price
+
+    def value_at(self, snapshot: MarketSnapshot) -> float:
+        """Total value at ``snapshot`` prices without touching the positions."""
+        engine, row = self._book()
+        return engine.value_at(row, snapshot)
+
+    def mark_to_market(self, snapshot: MarketSnapshot) -> None:
+        engine, row = self._book()
+        engine.mark_to_market(snapshot, [row])
 
     def get_allocations(self) -> Dict[str, float]:
-        total_value = self.get_total_value()
+        book = self.position_book(MIN_POSITION_QUANTITY)
+        values = book.market_values()
+        total_value = self.cash_balance + float(values.sum())
         if total_value == 0:
             return {}
-        allocations = {
-            ticker: self._get_position_value(ticker) / total_value
-            for ticker in self.get_positions()
-        }
+        allocations = dict(
+            zip(
+                [book.symbols[i] for i in book.symbol_ids],
+                (values / total_value).tolist(),
+            )
+        )
         allocations["CASH"] = self.cash_balance / total_value
         return allocations
 
+    def apply_allocation(
+        self,
+        target_allocations: Dict[str, float],
+        price_map: Optional[Mapping[str, float]] = None,
+        metadata_map: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Liquidate at ``price_map`` and rebuild positions to the target weights."""
+        if not price_map:
+            price_map = {
+                symbol: pos.current_price for symbol, pos in self.positions.items()
+            }
+        apply_allocations([self], [target_allocations], price_map, metadata_map)
+
+    def position_book(self, min_quantity: Optional[float] = None) -> PositionBook:
+        engine, row = self._book()
+        return engine.position_book(row, min_quantity)
+
+    def serialize_positions(self) -> Dict[str, Any]:
+        return self.position_book().to_dict()
+
     def get_breakdown(self) -> Dict[str, Any]:
         return {
             "total_value": self.get_total_value(),
@@ -137,29 +308,33 @@ class BaseAccount(ABC, Generic[PositionType, TransactionType]):
         base_data.update(self.get_additional_account_data())
         return base_data
 
-    @abstractmethod
-    def apply_allocation(
-        self,
-        target_allocations: Dict[str, float],
-        price_map: Optional[Dict[str, float]] = None,
-    ):
-        ...
-
-    @abstractmethod
-    def _get_position_value(self, ticker: str) -> float:
-        ...
-
-    @abstractmethod
-    def get_positions(self) -> Dict[str, Any]:
-        ...
-
     @abstractmethod
     def get_market_type(self) -> str:
         ...
 
-    @abstractmethod
-    def serialize_positions(self) -> Dict[str, Any]:
-        ...
-
     def get_additional_account_data(self) -> Dict[str, Any]:
         return {}
+
+
+def apply_allocations(
+    accounts: Sequence[BaseAccount],
+    target_allocations: Sequence[Dict[str, float]],
+    price_map: Mapping[str, float],
+    metadata_map: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
+    """Rebalance ``accounts`` to their targets with one engine call per engine.
+
+    The accounts of a system share its engine, so a whole cycle's
+    rebalancing is a single pass over the book.
+    """
+    books: Dict[int, Tuple[PortfolioEngine, List[int], List[Dict[str, float]]]] = {}
+    for account, targets in zip(accounts, target_allocations):
+        engine, row = account._book()
+        _, rows, row_targets = books.setdefault(id(engine), (engine, [], []))
+        rows.append(row)
+        row_targets.append(targets)
+    for engine, rows, row_targets in books.values():
+        engine.rebalance(rows, row_targets, price_map, metadata_map)
+    now = datetime.now().isoformat()
+    for account in accounts:
+        account.last_rebalance = now
@@ -0,0 +1,78 @@
+"""
+Immutable per-cycle price snapshot shared by every account.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+
+class MarketSnapshot(Mapping[str, float]):
+    """Symbols plus a read-only NumPy price vector, built once per cycle.
+
+    It is a ``Mapping`` so it can be passed anywhere a ``price_map`` dict was
+    accepted before.
+    """
+
+    __slots__ = ("symbols", "prices", "_index")
+
+    def __init__(self, symbols: Sequence[str], prices: Iterable[float]) -> None:
+        self.symbols = tuple(symbols)
+        self.prices = np.asarray(list(prices), dtype=float)
+        if len(self.symbols) != len(self.prices):
+            raise ValueError("symbols and prices must have the same length")
+        self.prices.setflags(write=False)
+        self._index: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+
+    @classmethod
+    def from_price_map(cls, price_map: Mapping[str, Optional[float]]) -> "MarketSnapshot":
+        items = [(s, p) for s, p in price_map.items() if p is not None]
+        return cls([s for s, _ in items], [p for _, p in items])
+
+    @classmethod
+    def from_market_data(
+        cls, market_data: Mapping[str, Mapping[str, Any]], price_key: str = "current_price"
+    ) -> "MarketSnapshot":
+        return cls.from_price_map(
+            {symbol: data.get(price_key) for symbol, data in market_data.items()}
+        )
+
+    def __getitem__(self, symbol: str) -> float:
+        return float(self.prices[self._index[symbol]])
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def prices_for(
+        self, symbols: Sequence[str], fallback: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Prices for ``symbols``; missing ones take ``fallback`` (else NaN)."""
+        idx = np.fromiter(
+            (self._index.get(s, -1) for s in symbols), dtype=np.intp, count=len(symbols)
+        )
+        found = idx >= 0
+        out = (
+            np.array(fallback, dtype=float)
+            if fallback is not None
+            else np.full(len(symbols), np.nan)
+        )
+        out[found] = self.prices[idx[found]]
+        return out
+
+    def value_of(
+        self,
+        symbols: Sequence[str],
+        quantities: np.ndarray,
+        fallback: Optional[np.ndarray] = None,
+    ) -> float:
+        if not len(symbols):
+            return 0.0
+        return float(np.dot(quantities, self.prices_for(symbols, fallback)))
@@ -0,0 +1,477 @@
+"""
+Dense holdings matrix shared by all accounts of one market.
+
+Each account is a row and each symbol a column of ``quantity``,
+``average_price`` and ``current_price`` matrices, with one ``cash`` entry per
+row. Mark-to-market, valuation, allocations and rebalancing run as NumPy
+operations over the whole book; the account classes are views onto a row.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from .market_snapshot import MarketSnapshot
+
+# Positions at or below this quantity are treated as closed
+MIN_POSITION_QUANTITY = 0.01
+
+
+class PortfolioEngine:
+    def __init__(self, row_capacity: int = 4, col_capacity: int = 16) -> None:
+        self.symbols: List[str] = []
+        self._cols: Dict[str, int] = {}
+        self.n_rows = 0
+        self._cash = np.zeros(max(1, row_capacity))
+        shape = (max(1, row_capacity), max(1, col_capacity))
+        self._quantity = np.zeros(shape)
+        self._average_price = np.zeros(shape)
+        self._current_price = np.zeros(shape)
+        self._held = np.zeros(shape, dtype=bool)
+        self.urls: Dict[Tuple[int, int], str] = {}
+
+    # -- storage -----------------------------------------------------------
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def cash(self) -> np.ndarray:
+        return self._cash[: self.n_rows]
+
+    @property
+    def quantity(self) -> np.ndarray:
+        return self._quantity[: self.n_rows, : self.n_cols]
+
+    @property
+    def average_price(self) -> np.ndarray:
+        return self._average_price[: self.n_rows, : self.n_cols]
+
+    @property
+    def current_price(self) -> np.ndarray:
+        return self._current_price[: self.n_rows, : self.n_cols]
+
+    @property
+    def held(self) -> np.ndarray:
+        return self._held[: self.n_rows, : self.n_cols]
+
+    def _reserve(self, rows: int, cols: int) -> None:
+        cap_rows, cap_cols = self._quantity.shape
+        if rows <= cap_rows and cols <= cap_cols:
+            return
+        new_rows = max(cap_rows, 1)
+        while new_rows < rows:
+            new_rows *= 2
+        new_cols = max(cap_cols, 1)
+        while new_cols < cols:
+            new_cols *= 2
+        pad = ((0, new_rows - cap_rows), (0, new_cols - cap_cols))
+        self._quantity = np.pad(self._quantity, pad)
+        self._average_price = np.pad(self._average_price, pad)
+        self._current_price = np.pad(self._current_price, pad)
+        self._held = np.pad(self._held, pad)
+        self._cash = np.pad(self._cash, (0, new_rows - cap_rows))
+
+    def add_row(self, cash: float = 0.0) -> int:
+        self._reserve(self.n_rows + 1, self.n_cols)
+        row = self.n_rows
+        self.n_rows += 1
+        self._cash[row] = cash
+        return row
+
+    def column(self, symbol: str) -> int:
+        col = self._cols.get(symbol)
+        if col is None:
+            self._reserve(self.n_rows, self.n_cols + 1)
+            col = self._cols[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return col
+
+    def find_column(self, symbol: str) -> Optional[int]:
+        return self._cols.get(symbol)
+
+    def compact(self) -> None:
+        """Drop the columns of symbols no account holds.
+
+        Columns are only ever appended, so a market whose universe rotates
+        (Polymarket) would otherwise grow its matrices on every refresh.
+        """
+        n = self.n_cols
+        keep = np.flatnonzero(self._held[: self.n_rows, :n].any(axis=0))
+        if len(keep) == n:
+            return
+        for name in ("_quantity", "_average_price", "_current_price", "_held"):
+            matrix = getattr(self, name)
+            matrix[:, : len(keep)] = matrix[:, keep]
+            matrix[:, len(keep) : n] = 0
+        remap = {int(old): new for new, old in enumerate(keep)}
+        self.symbols = [self.symbols[c] for c in keep]
+        self._cols = {symbol: col for col, symbol in enumerate(self.symbols)}
+        self.urls = {
+            (row, remap[col]): url
+            for (row, col), url in self.urls.items()
+            if col in remap
+        }
+
+    # -- single row --------------------------------------------------------
+
+    def set_position(
+        self,
+        row: int,
+        symbol: str,
+        quantity: float,
+        average_price: float,
+        current_price: float,
+        url: Optional[str] = None,
+    ) -> None:
+        col = self.column(symbol)
+        self._quantity[row, col] = quantity
+        self._average_price[row, col] = average_price
+        self._current_price[row, col] = current_price
+        self._held[row, col] = True
+        if url:
+            self.urls[(row, col)] = url
+        else:
+            self.urls.pop((row, col), None)
+
+    def remove_position(self, row: int, col: int) -> None:
+        self._quantity[row, col] = 0.0
+        self._average_price[row, col] = 0.0
+        self._current_price[row, col] = 0.0
+        self._held[row, col] = False
+        self.urls.pop((row, col), None)
+
+    def clear_row(self, row: int) -> None:
+        self._quantity[row] = 0.0
+        self._average_price[row] = 0.0
+        self._current_price[row] = 0.0
+        self._held[row] = False
+        for key in [k for k in self.urls if k[0] == row]:
+            del self.urls[key]
+
+    def clear_rows(self, rows: Sequence[int]) -> None:
+        row_idx = np.asarray(rows)
+        self._quantity[row_idx] = 0.0
+        self._average_price[row_idx] = 0.0
+        self._current_price[row_idx] = 0.0
+        self._held[row_idx] = False
+        if self.urls:
+            cleared = set(rows)
+            self.urls = {k: v for k, v in self.urls.items() if k[0] not in cleared}
+
+    def held_columns(self, row: int, min_quantity: Optional[float] = None) -> np.ndarray:
+        mask = self._held[row, : self.n_cols]
+        if min_quantity is not None:
+            mask = mask & (self._quantity[row, : self.n_cols] > min_quantity)
+        return np.flatnonzero(mask)
+
+    def position_book(
+        self, row: int, min_quantity: Optional[float] = None
+    ) -> "PositionBook":
+        cols = self.held_columns(row, min_quantity)
+        return PositionBook(
+            symbols=self.symbols,
+            symbol_ids=cols.astype(np.int32),
+            quantity=self._quantity[row, cols],
+            average_price=self._average_price[row, cols],
+            current_price=self._current_price[row, cols],
+            urls=[self.urls.get((row, int(c))) for c in cols],
+        )
+
+    # -- whole book --------------------------------------------------------
+
+    def position_values(self) -> np.ndarray:
+        """(accounts x symbols) market value of open positions."""
+        open_ = self.held & (self.quantity > MIN_POSITION_QUANTITY)
+        return np.where(open_, self.quantity * self.current_price, 0.0)
+
+    def positions_values(self) -> np.ndarray:
+        return self.position_values().sum(axis=1)
+
+    def total_values(self) -> np.ndarray:
+        return self.cash + self.positions_values()
+
+    def allocations(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-symbol weights and cash weight for every account."""
+        values = self.position_values()
+        totals = self.cash + values.sum(axis=1)
+        safe = np.where(totals == 0, 1.0, totals)
+        return values / safe[:, None], self.cash / safe
+
+    def mark_to_market(
+        self, snapshot: MarketSnapshot, rows: Optional[Sequence[int]] = None
+    ) -> None:
+        """Move every held position in ``rows`` (default all) to snapshot prices."""
+        cols = np.fromiter(
+            (self._cols.get(s, -1) for s in snapshot.symbols),
+            dtype=np.intp,
+            count=len(snapshot),
+        )
+        known = cols >= 0
+        if not known.any():
+            return
+        cols, prices = cols[known], snapshot.prices[known]
+        row_idx = np.arange(self.n_rows) if rows is None else np.asarray(rows)
+        block = self._current_price[np.ix_(row_idx, cols)]
+        held = self._held[np.ix_(row_idx, cols)]
+        self._current_price[np.ix_(row_idx, cols)] = np.where(held, prices, block)
+
+    def value_at(self, row: int, snapshot: MarketSnapshot) -> float:
+        cols = self.held_columns(row, MIN_POSITION_QUANTITY)
+        if not len(cols):
+            return float(self._cash[row])
+        symbols = [self.symbols[c] for c in cols]
+        return float(self._cash[row]) + snapshot.value_of(
+            symbols, self._quantity[row, cols], self._current_price[row, cols]
+        )
+
+    def rebalance(
+        self,
+        rows: Sequence[int],
+        target_allocations: Sequence[Mapping[str, Any]],
+        price_map: Mapping[str, Optional[float]],
+        metadata_map: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> None:
+        """Liquidate ``rows`` at ``price_map`` and rebuild them to their targets.
+
+        Targets are weights of each account's total value; ``CASH``, non-positive
+        weights and symbols without a positive price are skipped.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        snapshot = (
+            price_map
+            if isinstance(price_map, MarketSnapshot)
+            else MarketSnapshot.from_price_map(price_map)
+        )
+        self.mark_to_market(snapshot, rows)
+        row_idx = np.asarray(rows)
+        n = self.n_cols
+        quantity = self._quantity[row_idx, :n]
+        open_ = self._held[row_idx, :n] & (quantity > MIN_POSITION_QUANTITY)
+        values = np.where(open_, quantity * self._current_price[row_idx, :n], 0.0)
+        totals = self._cash[row_idx] + values.sum(axis=1)
+
+        weights: Dict[Tuple[int, int], float] = {}
+        for i, targets in enumerate(target_allocations):
+            for symbol, ratio in targets.items():
+                if symbol == "CASH":
+                    continue
+                try:
+                    ratio = float(ratio)
+                except (TypeError, ValueError):
+                    continue
+                price = snapshot.get(symbol)
+                if ratio <= 0 or price is None or price <= 0:
+                    continue
+                weights[(i, self.column(symbol))] = ratio
+
+        self.clear_rows(rows)
+        self._cash[row_idx] = totals
+        if not weights:
+            return
+
+        w = np.zeros((len(rows), self.n_cols))
+        for (i, col), ratio in weights.items():
+            w[i, col] = ratio
+        cols = np.unique([col for _, col in weights])
+        prices = snapshot.prices_for([self.symbols[c] for c in cols])
+        target_values = totals[:, None] * w[:, cols]
+        open_ = target_values > 0
+        block = np.ix_(row_idx, cols)
+        self._quantity[block] = np.where(open_, target_values / prices, 0.0)
+        self._average_price[block] = np.where(open_, prices, 0.0)
+        self._current_price[block] = np.where(open_, prices, 0.0)
+        self._held[block] = open_
+        self._cash[row_idx] = totals - target_values.sum(axis=1)
+
+        if metadata_map:
+            for i, col in zip(*np.nonzero(open_)):
+                url = metadata_map.get(self.symbols[cols[col]], {}).get("url")
+                if url:
+                    self.urls[(rows[i], int(cols[col]))] = url
+
+
+class PositionBook:
+    """Struct-of-arrays copy of one account's positions.
+
+    ``symbol_ids`` index into the engine's ``symbols``; the price and quantity
+    arrays are aligned with them. Used for serialization and replay loops
+    that would otherwise build one ``Position`` object per holding.
+    """
+
+    __slots__ = (
+        "symbols",
+        "symbol_ids",
+        "quantity",
+        "average_price",
+        "current_price",
+        "urls",
+    )
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        symbol_ids: np.ndarray,
+        quantity: np.ndarray,
+        average_price: np.ndarray,
+        current_price: np.ndarray,
+        urls: Sequence[Optional[str]],
+    ) -> None:
+        self.symbols = symbols
+        self.symbol_ids = symbol_ids
+        self.quantity = quantity
+        self.average_price = average_price
+        self.current_price = current_price
+        self.urls = urls
+
+    def __len__(self) -> int:
+        return len(self.symbol_ids)
+
+    def market_values(self) -> np.ndarray:
+        return self.quantity * self.current_price
+
+    def unrealized_pnl(self) -> np.ndarray:
+        return self.quantity * (self.current_price - self.average_price)
+
+    def total_value(self) -> float:
+        return float(np.dot(self.quantity, self.current_price))
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """The ``serialize_positions`` payload, built column-wise."""
+        names = [self.symbols[i] for i in self.symbol_ids]
+        out: Dict[str, Dict[str, Any]] = {}
+        for symbol, qty, avg, cur, url in zip(
+            names,
+            self.quantity.tolist(),
+            self.average_price.tolist(),
+            self.current_price.tolist(),
+            self.urls,
+        ):
+            pos_dict = {
+                "symbol": symbol,
+                "quantity": qty,
+                "average_price": avg,
+                "current_price": cur,
+            }
+            if url:
+                pos_dict["url"] = url
+            out[symbol] = pos_dict
+        return out
+
+
+class PositionRef:
+    """Live view of one cell of the engine that reads like a ``Position``."""
+
+    __slots__ = ("_engine", "_row", "_col")
+
+    def __init__(self, engine: PortfolioEngine, row: int, col: int) -> None:
+        self._engine = engine
+        self._row = row
+        self._col = col
+
+    @property
+    def symbol(self) -> str:
+        return self._engine.symbols[self._col]
+
+    @property
+    def quantity(self) -> float:
+        return float(self._engine._quantity[self._row, self._col])
+
+    @quantity.setter
+    def quantity(self, value: float) -> None:
+        self._engine._quantity[self._row, self._col] = value
+
+    @property
+    def average_price(self) -> float:
+        return float(self._engine._average_price[self._row, self._col])
+
+    @average_price.setter
+    def average_price(self, value: float) -> None:
+        self._engine._average_price[self._row, self._col] = value
+
+    @property
+    def current_price(self) -> float:
+        return float(self._engine._current_price[self._row, self._col])
+
+    @current_price.setter
+    def current_price(self, value: float) -> None:
+        self._engine._current_price[self._row, self._col] = value
+
+    @property
+    def url(self) -> Optional[str]:
+        return self._engine.urls.get((self._row, self._col))
+
+    @property
+    def market_value(self) -> float:
+        return self.quantity * self.current_price
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self.quantity * (self.current_price - self.average_price)
+
+    def __repr__(self) -> str:
+        return (
+            f"Position(symbol={self.symbol!r}, quantity={self.quantity}, "
+            f"average_price={self.average_price}, current_price={self.current_price}, "
+            f"url={self.url!r})"
+        )
+
+
+class PositionsView(MutableMapping[str, PositionRef]):
+    """``Dict[str, Position]``-style access to one account's row."""
+
+    __slots__ = ("_engine", "_row")
+
+    def __init__(self, engine: PortfolioEngine, row: int) -> None:
+        self._engine = engine
+        self._row = row
+
+    def __getitem__(self, symbol: str) -> PositionRef:
+        col = self._engine.find_column(symbol)
+        if col is None or not self._engine._held[self._row, col]:
+            raise KeyError(symbol)
+        return PositionRef(self._engine, self._row, col)
+
+    def __setitem__(self, symbol: str, position: Any) -> None:
+        self._engine.set_position(
+            self._row,
+            symbol,
+            position.quantity,
+            position.average_price,
+            position.current_price,
+            getattr(position, "url", None),
+        )
+
+    def __delitem__(self, symbol: str) -> None:
+        col = self._engine.find_column(symbol)
+        if col is None or not self._engine._held[self._row, col]:
+            raise KeyError(symbol)
+        self._engine.remove_position(self._row, col)
+
+    def __iter__(self) -> Iterator[str]:
+        symbols = self._engine.symbols
+        return iter([symbols[c] for c in self._engine.held_columns(self._row)])
+
+    def __len__(self) -> int:
+        return len(self._engine.held_columns(self._row))
+
+    def clear(self) -> None:
+        self._engine.clear_row(self._row)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
@@ -0,0 +1,141 @@
+"""
+Compressed store for LLM transcripts referenced from allocation snapshots.
+
+``record_allocation`` used to inline the full prompt and response in every
+snapshot of ``allocation_history``. Snapshots now carry a ``transcript_id``
+and the transcript lives here as a gzip-compressed JSON blob, in memory by
+default or under a directory when one is configured (``LTB_TRANSCRIPT_DIR``
+or ``configure_transcript_store``).
+
+Ids are a hash of the transcript, so storing the same transcript again (for
+example when legacy inline snapshots are externalized on every load) reuses
+its blob instead of adding a copy.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+TRANSCRIPT_DIR_ENV = "LTB_TRANSCRIPT_DIR"
+
+TRANSCRIPT_KEYS = ("llm_input", "llm_output")
+
+
+class TranscriptStore:
+    def __init__(self, root: Optional[str] = None, compresslevel: int = 6) -> None:
+        self.root = root
+        self.compresslevel = compresslevel
+        self._blobs: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, transcript_id: str) -> str:
+        return os.path.join(self.root, transcript_id[:2], transcript_id + ".json.gz")
+
+    def put(
+        self,
+        llm_input: Optional[Dict[str, Any]],
+        llm_output: Optional[Dict[str, Any]],
+        transcript_id: Optional[str] = None,
+    ) -> str:
+        payload = json.dumps(
+            {"llm_input": llm_input, "llm_output": llm_output}, sort_keys=True
+        ).encode("utf-8")
+        transcript_id = transcript_id or hashlib.sha256(payload).hexdigest()[:32]
+        if transcript_id not in self:
+            self._put_blob(
+                transcript_id,
+                gzip.compress(payload, compresslevel=self.compresslevel, mtime=0),
+            )
+        return transcript_id
+
+    def _put_blob(self, transcript_id: str, blob: bytes) -> None:
+        if self.root is None:
+            with self._lock:
+                self._blobs[transcript_id] = blob
+            return
+
+        path = self._path(transcript_id)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def export_blobs(self, transcript_ids: Iterable[str]) -> Dict[str, bytes]:
+        """Compressed blobs held in memory; an on-disk store has none to export."""
+        if self.root is not None:
+            return {}
+        with self._lock:
+            return {t: self._blobs[t] for t in transcript_ids if t in self._blobs}
+
+    def import_blobs(self, blobs: Mapping[str, bytes]) -> None:
+        for transcript_id, blob in blobs.items():
+            self._put_blob(transcript_id, blob)
+
+    def get(self, transcript_id: str) -> Optional[Dict[str, Any]]:
+        if self.root is None:
+            with self._lock:
+                blob = self._blobs.get(transcript_id)
+        else:
+            try:
+                with open(self._path(transcript_id), "rb") as f:
+                    blob = f.read()
+            except FileNotFoundError:
+                blob = None
+        if blob is None:
+            return None
+        return json.loads(gzip.decompress(blob).decode("utf-8"))
+
+    def __contains__(self, transcript_id: object) -> bool:
+        if not isinstance(transcript_id, str):
+            return False
+        if self.root is None:
+            return transcript_id in self._blobs
+        return os.path.exists(self._path(transcript_id))
+
+
+_transcript_store: Optional[TranscriptStore] = None
+_transcript_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> TranscriptStore:
+    global _transcript_store
+    if _transcript_store is None:
+        with _transcript_store_lock:
+            if _transcript_store is None:
+                _transcript_store = TranscriptStore(
+                    os.environ.get(TRANSCRIPT_DIR_ENV) or None
+                )
+    return _transcript_store
+
+
+def configure_transcript_store(root: Optional[str] = None) -> TranscriptStore:
+    """Switch the process-wide store (``None`` keeps transcripts in memory)."""
+    global _transcript_store
+    with _transcript_store_lock:
+        _transcript_store = TranscriptStore(root)
+    return _transcript_store
+
+
+def load_transcript(snapshot: Mapping[str, Any]) -> Dict[str, Any]:
+    """``llm_input``/``llm_output`` for a snapshot, inline or by reference."""
+    transcript_id = snapshot.get("transcript_id")
+    if transcript_id:
+        transcript = get_transcript_store().get(transcript_id)
+        if transcript is not None:
+            return transcript
+    return {key: snapshot.get(key) for key in TRANSCRIPT_KEYS}
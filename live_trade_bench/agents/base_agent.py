@@ -7,6 +7,7 @@ from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from ..accounts import BaseAccount
 from ..utils.agent_utils import normalize_allocations, parse_llm_response_to_json
+from ..utils.llm_cache import CacheMode
 
 AccountType = TypeVar("AccountType", bound=BaseAccount[Any, Any])
 DataType = TypeVar("DataType")
@@ -22,6 +23,8 @@ class BaseAgent(ABC, Generic[AccountType, DataType]):
         self.price_history: Dict[str, List[float]] = defaultdict(list)
         self.last_llm_input = None
         self.last_llm_output = None
+        # None follows the process-wide default set by configure_llm_cache
+        self.llm_cache_mode: Optional[CacheMode] = None
 
     def generate_allocation(
         self,
@@ -91,7 +94,9 @@ class BaseAgent(ABC, Generic[AccountType, DataType]):
         try:
             from ..utils import call_llm
 
-            return call_llm(messages, self.model_name, self.name)
+            return call_llm(
+                messages, self.model_name, self.name, cache_mode=self.llm_cache_mode
+            )
         except Exception as e:
             return {"success": False, "content": "", "error": str(e)}
 
@@ -4,9 +4,30 @@ backtest module for live_trade_bench
 Provides historical data replay and portfolio backtest functionality.
 """
 
-from .backtest_runner import BacktestRunner, run_backtest
+from .backtest_runner import BacktestRunner, run_backtest, run_backtests
+from .checkpoint import load_checkpoint, save_checkpoint
+from .parallel import BacktestLane, run_lanes
+from .replay import (
+    ExecutionParams,
+    RecordedRun,
+    load_recorded_runs,
+    replay,
+    runs_from_accounts,
+    runs_from_models,
+)
 
 __all__ = [
+    "BacktestLane",
     "BacktestRunner",
     "run_backtest",
+    "run_backtests",
+    "run_lanes",
+    "load_checkpoint",
+    "save_checkpoint",
+    "ExecutionParams",
+    "RecordedRun",
+    "load_recorded_runs",
+    "replay",
+    "runs_from_accounts",
+    "runs_from_models",
 ]
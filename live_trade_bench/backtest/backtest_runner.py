@@ -7,11 +7,15 @@ Just controls time flow, uses existing systems unchanged.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, time
 from typing import Any, Dict, List
 
+from ..fetchers.price_store import enable_price_store
 from ..systems.polymarket_system import PolymarketPortfolioSystem
 from ..systems.stock_system import StockPortfolioSystem
+from ..utils.llm_cache import CacheMode, configure_llm_cache
+from .checkpoint import load_checkpoint, restore, save_checkpoint
+from .parallel import run_lanes
 
 
 class BacktestRunner:
@@ -20,41 +24,98 @@ class BacktestRunner:
         system: StockPortfolioSystem | PolymarketPortfolioSystem,
         start_date: str,
         end_date: str,
+        use_price_cache: bool = True,
+        llm_cache_mode: CacheMode | str = CacheMode.BYPASS,
+        prefetch: bool = True,
+        prefetch_news: bool = True,
+        workers: int = 1,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = 1,
+        resume_from: str | None = None,
     ) -> None:
+        if workers > 1 and (checkpoint_path or resume_from):
+            raise ValueError("Checkpoints are only supported with workers=1")
         self.system = system
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
+        self.use_price_cache = use_price_cache
+        self.llm_cache_mode = CacheMode(llm_cache_mode)
+        # load the whole period up front and slice it per day
+        self.prefetch = prefetch
+        self.prefetch_news = prefetch_news
+        # >1 runs each agent as its own lane in a process pool
+        self.workers = workers
+        # snapshot the system every checkpoint_every completed days
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.resume_from = resume_from
+        self.completed: List[str] = []
+
+    def prepare(self) -> List[datetime] | None:
+        """Set up caches, universe and prefetched data; ``None`` skips the run."""
+        if self.use_price_cache:
+            # consecutive days overlap in their 10-day windows; fetch each bar once
+            enable_price_store()
+        if self.llm_cache_mode is not CacheMode.BYPASS:
+            # same prompts on a re-run replay from disk instead of the API
+            configure_llm_cache(mode=self.llm_cache_mode)
+        for agent in self.system.agents.values():
+            agent.llm_cache_mode = self.llm_cache_mode
 
-    def run(self) -> Dict[str, Any]:
         trading_days = self._get_trading_days()
 
-        if isinstance(self.system, PolymarketPortfolioSystem):
+        if self.resume_from:
+            # the checkpoint brings its own universe; no need to rebuild it
+            self.completed = restore(self.system, load_checkpoint(self.resume_from))
+            print(
+                f"--- ♻️ Resumed from {self.resume_from}: {len(self.completed)} days already done ---"
+            )
+        elif isinstance(self.system, PolymarketPortfolioSystem):
             self.system.initialize_for_backtest(trading_days)
             if not self.system.universe:
                 print(
                     "--- ⚠️ No Polymarket markets found with complete price history for the given period. Skipping backtest. ---"
                 )
-                return {}
+                return None
         elif isinstance(self.system, StockPortfolioSystem):
             self.system.initialize_for_live()  # Assuming live-like init for stocks
 
-        for day in trading_days:
-            date_str = day.strftime("%Y-%m-%d")
-            print(
-                f"\n===== 📆 Day {trading_days.index(day) + 1}/{len(trading_days)}: {date_str} ====="
+        if self.prefetch and trading_days:
+            self.system.prefetch_backtest_data(
+                trading_days[0].strftime("%Y-%m-%d"),
+                trading_days[-1].strftime("%Y-%m-%d"),
+                include_news=self.prefetch_news,
             )
+        return trading_days
+
+    def run(self) -> Dict[str, Any]:
+        trading_days = self.prepare()
+        if trading_days is None:
+            return {}
+        if self.workers > 1 and len(self.system.agents) > 1:
+            results = run_backtests({"": self}, self.workers, {"": trading_days})
+            return results[""]
+
+        done = set(self.completed)
+        for i, day in enumerate(trading_days, start=1):
+            date_str = day.strftime("%Y-%m-%d")
+            if date_str in done:
+                continue
+            print(f"\n===== 📆 Day {i}/{len(trading_days)}: {date_str} =====")
             self.system.run_cycle(date_str)
+            self.completed.append(date_str)
+            if self.checkpoint_path and (
+                len(self.completed) % self.checkpoint_every == 0
+                or i == len(trading_days)
+            ):
+                save_checkpoint(self.checkpoint_path, self.system, self.completed)
 
         return self._collect_results()
 
     def _get_trading_days(self) -> List[datetime]:
-        days: List[datetime] = []
-        current = self.start_date
-        while current <= self.end_date:
-            if current.weekday() < 5:
-                days.append(current)
-            current += timedelta(days=1)
-        return days
+        # sessions of the system's market: NYSE skips holidays, BitMEX is 24/7
+        sessions = self.system.calendar.sessions(self.start_date, self.end_date)
+        return [datetime.combine(day, time()) for day in sessions.tolist()]
 
     def _collect_results(self) -> Dict[str, Any]:
         final_results = {}
@@ -76,12 +137,54 @@ class BacktestRunner:
         return final_results
 
 
+def run_backtests(
+    runners: Dict[str, BacktestRunner],
+    workers: int,
+    prepared: Dict[str, List[datetime] | None] | None = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Run several markets' backtests with one process pool over all lanes.
+
+    Each (market, agent) pair runs in its own lane. The finished accounts
+    replace the ones on each runner's system, so ``runner.system`` afterwards
+    looks as if the runner had run sequentially. Results use the
+    ``BacktestRunner.run`` format per market.
+    """
+    prepared = dict(prepared or {})
+    systems = {}
+    for market, runner in runners.items():
+        if market not in prepared:
+            prepared[market] = runner.prepare()
+        days = prepared[market]
+        if days is not None:
+            dates = [day.strftime("%Y-%m-%d") for day in days]
+            systems[market] = (runner.system, dates)
+
+    accounts = run_lanes(systems, workers)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for market, runner in runners.items():
+        if market not in systems:
+            results[market] = {}
+            continue
+        engine = runner.system.engine
+        for name, account in accounts[market].items():
+            # lane accounts come back on private engines; move them into the
+            # system's engine, onto the rows of the untouched originals
+            _, row = runner.system.accounts[name]._book()
+            account.attach(engine, row)
+        runner.system.accounts.update(accounts[market])
+        results[market] = runner._collect_results()
+    return results
+
+
 def run_backtest(
     models: List[tuple[str, str]],
     initial_cash: float,
     start_date: str,
     end_date: str,
     market_type: str = "stock",
+    llm_cache_mode: CacheMode | str = CacheMode.BYPASS,
+    workers: int = 1,
 ) -> tuple[Dict[str, Any], StockPortfolioSystem | PolymarketPortfolioSystem]:
     system: StockPortfolioSystem | PolymarketPortfolioSystem
     if market_type == "stock":
@@ -92,6 +195,8 @@ def run_backtest(
     for name, model_id in models:
         system.add_agent(name=name, initial_cash=initial_cash, model_name=model_id)
 
-    runner = BacktestRunner(system, start_date, end_date)
+    runner = BacktestRunner(
+        system, start_date, end_date, llm_cache_mode=llm_cache_mode, workers=workers
+    )
     results = runner.run()
     return results, system
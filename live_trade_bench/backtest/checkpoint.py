@@ -0,0 +1,135 @@
+"""
+Checkpoint and resume for long backtests.
+
+Before checkpoints, all backtest state lived in memory (accounts with their
+``allocation_history``, agent price histories, the cycle counter), so a crash
+or a rate-limit outage meant replaying every day and paying for its LLM calls
+again. A checkpoint captures that state after a completed day:
+
+- the accounts of one system, pickled together so they keep sharing one
+  ``PortfolioEngine``
+- the agents' price histories and last transcripts
+- the universe, the cycle counter and the completed dates
+- the ``random`` and NumPy RNG states
+- the transcripts referenced from the histories, when they only live in an
+  in-memory ``TranscriptStore``
+
+The snapshot is pickled with the highest protocol and gzip-compressed, then
+written atomically, so a crash mid-write leaves the previous checkpoint in
+place.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import pickle
+import random
+import tempfile
+from typing import Any, Dict, List
+
+import numpy as np
+
+from ..accounts import get_transcript_store
+
+CHECKPOINT_VERSION = 1
+
+# Agent attributes that carry state from one day to the next
+AGENT_STATE = (
+    "available",
+    "_history",
+    "_last_price",
+    "price_history",
+    "last_llm_input",
+    "last_llm_output",
+)
+# Per-system universe attributes, whichever the system has
+UNIVERSE_STATE = ("universe", "stock_info", "market_info", "contract_info")
+
+
+def capture(system: Any, completed: List[str]) -> Dict[str, Any]:
+    transcript_ids = [
+        snapshot["transcript_id"]
+        for account in system.accounts.values()
+        for snapshot in account.allocation_history
+        if snapshot.get("transcript_id")
+    ]
+    return {
+        "version": CHECKPOINT_VERSION,
+        "system": type(system).__name__,
+        "completed": list(completed),
+        "cycle_count": system.cycle_count,
+        "universe": {
+            name: getattr(system, name)
+            for name in UNIVERSE_STATE
+            if hasattr(system, name)
+        },
+        "accounts": system.accounts,
+        "agents": {
+            name: {
+                key: getattr(agent, key) for key in AGENT_STATE if hasattr(agent, key)
+            }
+            for name, agent in system.agents.items()
+        },
+        "transcripts": get_transcript_store().export_blobs(transcript_ids),
+        "random_state": random.getstate(),
+        "numpy_state": np.random.get_state(),
+    }
+
+
+def restore(system: Any, state: Dict[str, Any]) -> List[str]:
+    """Put ``state`` back onto ``system``; returns the completed dates."""
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+    if state["system"] != type(system).__name__:
+        raise ValueError(
+            f"Checkpoint is for {state['system']}, not {type(system).__name__}"
+        )
+    missing = set(system.agents) - set(state["accounts"])
+    if missing:
+        raise ValueError(f"Checkpoint has no state for agents: {sorted(missing)}")
+
+    for name, value in state["universe"].items():
+        setattr(system, name, value)
+    system.cycle_count = state["cycle_count"]
+    system.accounts.update(state["accounts"])
+    if state["accounts"]:
+        # restored accounts share the engine they were pickled with
+        system.engine = next(iter(state["accounts"].values()))._book()[0]
+    for name, agent_state in state["agents"].items():
+        agent = system.agents.get(name)
+        if agent is not None:
+            for key, value in agent_state.items():
+                setattr(agent, key, value)
+    get_transcript_store().import_blobs(state["transcripts"])
+    random.setstate(state["random_state"])
+    np.random.set_state(state["numpy_state"])
+    return list(state["completed"])
+
+
+def save_checkpoint(path: str, system: Any, completed: List[str]) -> None:
+    blob = gzip.compress(
+        pickle.dumps(capture(system, completed), protocol=pickle.HIGHEST_PROTOCOL),
+        compresslevel=6,
+    )
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    # checkpoints are pickles: only load files this bench wrote
+    with open(path, "rb") as f:
+        return pickle.loads(gzip.decompress(f.read()))
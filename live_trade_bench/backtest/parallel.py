@@ -0,0 +1,158 @@
+"""
+Process-pool backtests over independent (market, agent) lanes.
+
+An agent's run is path dependent, because each day's prompt includes its own
+allocation history. Agents never see each other, though, so every agent of
+every market is a lane that can run on its own core. The parent sets each
+market up once (universe and prefetched data) and hands it to the workers as
+a read-only template. The template is pickled once per worker through the
+pool initializer, not once per lane. A lane clones the template with only
+its own agent and account and replays the trading days. The finished
+accounts are returned in lane order rather than completion order, so the
+merged results do not depend on scheduling.
+
+Workers are spawned, not forked. They open their own price store and LLM
+cache connections instead of inheriting the parent's SQLite handles and
+threads. They write transcripts to the parent's transcript directory when it
+has one; otherwise a lane sends its in-memory transcripts back with its
+account.
+"""
+
+from __future__ import annotations
+
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..accounts import (
+    PortfolioEngine,
+    configure_transcript_store,
+    get_transcript_store,
+)
+from ..fetchers.price_store import enable_price_store, get_price_store
+from ..utils.llm_cache import CacheMode, configure_llm_cache, get_llm_cache
+
+
+@dataclass(frozen=True)
+class BacktestLane:
+    market: str
+    agent_name: str
+    model_name: str
+    initial_cash: float
+    llm_cache_mode: CacheMode = CacheMode.BYPASS
+
+
+def lanes_for(market: str, system: Any) -> List[BacktestLane]:
+    return [
+        BacktestLane(
+            market,
+            name,
+            agent.model_name,
+            system.accounts[name].initial_cash,
+            CacheMode(agent.llm_cache_mode or CacheMode.BYPASS),
+        )
+        for name, agent in system.agents.items()
+    ]
+
+
+def strip_agents(system: Any) -> Any:
+    """Shallow copy of ``system`` without agents, accounts or portfolio state."""
+    template = copy.copy(system)
+    template.agents = {}
+    template.accounts = {}
+    template.engine = PortfolioEngine()
+    template.market_snapshot = None
+    template.cycle_count = 0
+    return template
+
+
+# per worker process, set by _init_worker
+_templates: Dict[str, Tuple[Any, List[str]]] = {}
+
+
+def _init_worker(
+    templates: Dict[str, Tuple[Any, List[str]]],
+    price_store_root: Optional[str],
+    use_llm_cache: bool,
+    llm_cache_path: Optional[str],
+    transcript_root: Optional[str],
+) -> None:
+    global _templates
+    _templates = templates
+    if price_store_root:
+        enable_price_store(price_store_root)
+    configure_transcript_store(transcript_root)
+    if use_llm_cache:
+        # each lane's agent passes its own mode to the cache
+        configure_llm_cache(llm_cache_path)
+
+
+def _run_lane(lane: BacktestLane) -> Tuple[Any, Dict[str, bytes]]:
+    template, dates = _templates[lane.market]
+    system = strip_agents(template)
+    system.add_agent(
+        name=lane.agent_name,
+        initial_cash=lane.initial_cash,
+        model_name=lane.model_name,
+    )
+    system.agents[lane.agent_name].llm_cache_mode = lane.llm_cache_mode
+    for i, date_str in enumerate(dates):
+        print(
+            f"\n===== 📆 {lane.market}/{lane.agent_name} Day {i + 1}/{len(dates)}: {date_str} ====="
+        )
+        system.run_cycle(date_str)
+    account = system.accounts[lane.agent_name]
+    transcript_ids = [
+        snapshot["transcript_id"]
+        for snapshot in account.allocation_history
+        if snapshot.get("transcript_id")
+    ]
+    return account, get_transcript_store().export_blobs(transcript_ids)
+
+
+def run_lanes(
+    systems: Dict[str, Tuple[Any, List[str]]],
+    workers: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Run every agent of every ``{market: (system, dates)}`` in a process pool.
+
+    Each lane keeps its agent's LLM cache mode. Returns the final account of each lane as ``{market: {agent: account}}``,
+    ordered like ``systems`` and each system's agents. The lanes'
+    transcripts are added to this process's transcript store.
+    """
+    lanes = [
+        lane
+        for market, (system, _) in systems.items()
+        for lane in lanes_for(market, system)
+    ]
+    results: Dict[str, Dict[str, Any]] = {market: {} for market in systems}
+    if not lanes:
+        return results
+
+    templates = {
+        market: (strip_agents(system), dates)
+        for market, (system, dates) in systems.items()
+    }
+    store = get_price_store()
+    llm_cache = get_llm_cache()
+    transcripts = get_transcript_store()
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(workers, len(lanes))),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(
+            templates,
+            store.root if store is not None else None,
+            any(lane.llm_cache_mode is not CacheMode.BYPASS for lane in lanes),
+            llm_cache.path if llm_cache is not None else None,
+            transcripts.root,
+        ),
+    ) as pool:
+        futures = [pool.submit(_run_lane, lane) for lane in lanes]
+        for lane, future in zip(lanes, futures):
+            account, blobs = future.result()
+            transcripts.import_blobs(blobs)
+            results[lane.market][lane.agent_name] = account
+    return results
@@ -0,0 +1,266 @@
+"""
+Offline replay of recorded runs under different execution settings.
+
+Every cycle of a run leaves a snapshot in ``allocation_history`` with its
+timestamp and the target weights the LLM chose. The decisions therefore do
+not have to be made again to ask how the run would have done with fees,
+slippage or a rebalance band. A replay takes the recorded targets of each
+cycle and re-prices them against cached daily prices. No LLM or network call
+is made: prices come from the price store or from data a backtest already
+prefetched.
+
+A run's targets are turned into a ``(cycles, symbols)`` weight matrix once,
+and its prices into a matching matrix. Each set of ``ExecutionParams`` is then
+a short NumPy loop over the cycles, so a sweep over many settings for every
+model takes seconds.
+
+Execution model, per cycle:
+
+- positions are marked at the cycle's price; a symbol without a price keeps
+  its last mark and is not traded that cycle
+- when no weight is off its target by ``rebalance_threshold`` or more, the
+  cycle does not trade
+- otherwise each position is traded to its target value. Sells fill
+  ``slippage_bps`` below the mark and buys above it, and ``fee_bps`` is
+  charged on the traded notional. Buys are scaled down if the cash after
+  sells cannot pay for them and their fees.
+
+With the default (zero-cost) parameters this is the rebalance the live
+engine performs, so the replay reproduces the recorded values.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..fetchers.backtest_data import PrefetchedPrices, load_stored_prices
+from ..fetchers.price_store import to_day
+
+# price store (source, field, current_days) per market; the stock close of a
+# day falls back to the next session's, as in backtests
+STORE_SOURCES = {
+    "stock": ("yfinance", "close", 2),
+    "bitmex": ("bitmex", "close", 1),
+}
+
+
+@dataclass(frozen=True)
+class ExecutionParams:
+    fee_bps: float = 0.0
+    slippage_bps: float = 0.0
+    # largest weight drift (as a fraction of total value) left untraded
+    rebalance_threshold: float = 0.0
+
+
+# the costless, always-rebalancing execution of the live engine
+LIVE_EXECUTION = ExecutionParams()
+
+
+@dataclass
+class RecordedRun:
+    name: str
+    market: str
+    initial_cash: float
+    timestamps: List[str]
+    symbols: List[str]
+    weights: np.ndarray  # (cycles, symbols)
+
+    @property
+    def days(self) -> np.ndarray:
+        return np.array([to_day(t) for t in self.timestamps], dtype="datetime64[D]")
+
+    @classmethod
+    def from_history(
+        cls,
+        name: str,
+        allocation_history: Sequence[Mapping[str, Any]],
+        market: str = "stock",
+        initial_cash: Optional[float] = None,
+    ) -> "RecordedRun":
+        snapshots = sorted(allocation_history, key=lambda s: s["timestamp"])
+        if initial_cash is None:
+            # every snapshot records profit against the initial cash
+            first = snapshots[0] if snapshots else {}
+            initial_cash = float(first.get("total_value", 0)) - float(
+                first.get("profit", 0)
+            )
+        symbols = list(
+            dict.fromkeys(
+                symbol
+                for s in snapshots
+                for symbol in (s.get("allocations") or {})
+                if symbol != "CASH"
+            )
+        )
+        column = {symbol: j for j, symbol in enumerate(symbols)}
+        weights = np.zeros((len(snapshots), len(symbols)))
+        for i, snapshot in enumerate(snapshots):
+            for symbol, ratio in (snapshot.get("allocations") or {}).items():
+                if symbol == "CASH":
+                    continue
+                try:
+                    weights[i, column[symbol]] = max(float(ratio), 0.0)
+                except (TypeError, ValueError):
+                    continue
+        return cls(
+            name,
+            market,
+            initial_cash,
+            [s["timestamp"] for s in snapshots],
+            symbols,
+            weights,
+        )
+
+
+def runs_from_models(models: Iterable[Mapping[str, Any]]) -> List[RecordedRun]:
+    """Runs of the agent models in a ``models_data_hist.json``-style list."""
+    return [
+        RecordedRun.from_history(
+            model.get("name") or model["id"],
+            model["allocationHistory"],
+            market=model.get("category", "stock"),
+        )
+        for model in models
+        if model.get("category") != "benchmark" and model.get("allocationHistory")
+    ]
+
+
+def runs_from_accounts(
+    accounts: Mapping[str, Any], market: str = "stock"
+) -> List[RecordedRun]:
+    """Runs of the accounts of a finished backtest (``system.accounts``)."""
+    return [
+        RecordedRun.from_history(
+            name, account.allocation_history, market, account.initial_cash
+        )
+        for name, account in accounts.items()
+        if account.allocation_history
+    ]
+
+
+def load_recorded_runs(path: str) -> List[RecordedRun]:
+    with open(path, "r") as f:
+        return runs_from_models(json.load(f))
+
+
+def stored_prices_for(runs: Sequence[RecordedRun]) -> Dict[str, PrefetchedPrices]:
+    """Prices of every symbol of ``runs`` from the price store, per market."""
+    prices: Dict[str, PrefetchedPrices] = {}
+    for market in dict.fromkeys(run.market for run in runs):
+        if market not in STORE_SOURCES:
+            print(f"No stored prices for {market} runs; pass them to replay()")
+            continue
+        source, field, current_days = STORE_SOURCES[market]
+        market_runs = [run for run in runs if run.market == market and run.timestamps]
+        if not market_runs:
+            continue
+        prices[market] = load_stored_prices(
+            dict.fromkeys(s for run in market_runs for s in run.symbols),
+            min(run.timestamps[0] for run in market_runs)[:10],
+            max(run.timestamps[-1] for run in market_runs)[:10],
+            source=source,
+            field=field,
+            current_days=current_days,
+        )
+    return prices
+
+
+def simulate(
+    run: RecordedRun, prices: np.ndarray, params: ExecutionParams
+) -> Dict[str, Any]:
+    """Replay ``run`` against its ``(cycles, symbols)`` price matrix."""
+    slippage = params.slippage_bps / 1e4
+    fee = params.fee_bps / 1e4
+    n = len(run.symbols)
+    quantity = np.zeros(n)
+    mark = np.full(n, np.nan)
+    cash = float(run.initial_cash)
+    fees = turnover = 0.0
+    rebalances = 0
+    values = np.empty(len(run.timestamps))
+
+    for t in range(len(run.timestamps)):
+        priced = ~np.isnan(prices[t])
+        mark = np.where(priced, prices[t], mark)
+        held_value = quantity * np.nan_to_num(mark)
+        total = cash + held_value.sum()
+        target = np.where(priced, run.weights[t], 0.0) * total
+        delta = np.where(priced, target - held_value, 0.0)
+        drift = np.abs(delta).max(initial=0.0) / total if total > 0 else 0.0
+        if drift > 0 and drift >= params.rebalance_threshold:
+            rebalances += 1
+            price = np.where(priced, mark, 1.0)
+            sells = np.minimum(delta, 0.0)
+            buys = np.maximum(delta, 0.0)
+            cash -= sells.sum() * (1 - slippage) + fee * -sells.sum()
+            budget = buys.sum() * (1 + fee)
+            if budget > max(cash, 0.0):
+                buys *= max(cash, 0.0) / budget
+            cash -= buys.sum() * (1 + fee)
+            quantity += sells / price + buys / (price * (1 + slippage))
+            # targets of zero close the position outright
+            quantity[priced & (run.weights[t] <= 0)] = 0.0
+            traded = buys.sum() - sells.sum()
+            fees += fee * traded
+            turnover += traded
+        values[t] = cash + (quantity * np.nan_to_num(mark)).sum()
+
+    final_value = float(values[-1]) if len(values) else float(run.initial_cash)
+    initial = run.initial_cash
+    return {
+        "initial_value": initial,
+        "final_value": final_value,
+        "return_percentage": (
+            (final_value - initial) / initial * 100 if initial > 0 else 0
+        ),
+        "period": (
+            f"{run.timestamps[0][:10]} to {run.timestamps[-1][:10]}"
+            if run.timestamps
+            else ""
+        ),
+        "fees": fees,
+        "turnover": turnover,
+        "rebalances": rebalances,
+        "value_history": [
+            {"timestamp": ts, "total_value": float(v)}
+            for ts, v in zip(run.timestamps, values)
+        ],
+    }
+
+
+def replay(
+    runs: Sequence[RecordedRun],
+    params: ExecutionParams | Sequence[ExecutionParams] = LIVE_EXECUTION,
+    prices: Optional[Mapping[str, PrefetchedPrices]] = None,
+) -> Any:
+    """Replay ``runs`` under ``params`` without calling any LLM.
+
+    ``prices`` maps a market to its daily prices (e.g. a backtest system's
+    ``backtest_data.prices``); markets not given are read from the price
+    store. Returns ``{run name: result}`` for one ``ExecutionParams``, or a
+    list of those for a sequence of them. The price matrices are built once
+    and shared by every parameter set.
+    """
+    prices = dict(prices or {})
+    missing = [run for run in runs if run.market not in prices]
+    prices.update(stored_prices_for(missing))
+
+    matrices = []
+    for run in runs:
+        market_prices = prices.get(run.market)
+        matrices.append(
+            market_prices.current_prices(run.symbols, run.days)
+            if market_prices is not None
+            else np.full(run.weights.shape, np.nan)
+        )
+
+    sweep = [params] if isinstance(params, ExecutionParams) else list(params)
+    results = [
+        {run.name: simulate(run, matrix, p) for run, matrix in zip(runs, matrices)}
+        for p in sweep
+    ]
+    return results[0] if isinstance(params, ExecutionParams) else results
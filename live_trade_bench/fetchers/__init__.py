@@ -4,10 +4,41 @@ Fetchers Package - Data fetching utilities for various financial markets
 
 from typing import TYPE_CHECKING
 
+from .async_fetcher import (
+    AsyncBitMEXFetcher,
+    AsyncPolymarketFetcher,
+    AsyncStockFetcher,
+    gather_bounded,
+    run_coroutine_sync,
+)
+from .backtest_data import (
+    BacktestData,
+    PrefetchedNews,
+    PrefetchedPrices,
+    load_news,
+    load_polymarket_prices,
+    load_stock_prices,
+    load_stored_prices,
+)
 from .base_fetcher import BaseFetcher
 from .bitmex_fetcher import BitMEXFetcher
+from .http_session import (
+    SessionManager,
+    TokenBucket,
+    configure_session_manager,
+    get_session_manager,
+)
+from .market_catalog import PolymarketMarketCatalog, get_market_catalog
+from .market_data_cache import MarketDataCache, get_market_data_cache
 from .news_fetcher import NewsFetcher
 from .polymarket_fetcher import PolymarketFetcher, fetch_trending_markets
+from .price_store import (
+    PriceStore,
+    disable_price_store,
+    enable_price_store,
+    get_price_store,
+)
+from .quote_cache import QuoteCache
 
 if TYPE_CHECKING:
     # Optional imports for type checking only
@@ -15,6 +46,7 @@ if TYPE_CHECKING:
     from .stock_fetcher import (
         StockFetcher,
         fetch_current_stock_price,
+        fetch_current_stock_prices,
         fetch_trending_stocks,
     )
 else:
@@ -23,12 +55,14 @@ else:
         from .stock_fetcher import (
             StockFetcher,
             fetch_current_stock_price,
+            fetch_current_stock_prices,
             fetch_trending_stocks,
         )
     except Exception:
         StockFetcher = None  # type: ignore
         fetch_trending_stocks = None  # type: ignore
         fetch_current_stock_price = None  # type: ignore
+        fetch_current_stock_prices = None  # type: ignore
 
     try:
         from .reddit_fetcher import RedditFetcher  # type: ignore
@@ -43,11 +77,41 @@ __all__ = [
     "NewsFetcher",
     "PolymarketFetcher",
     "fetch_trending_markets",
+    "SessionManager",
+    "TokenBucket",
+    "configure_session_manager",
+    "get_session_manager",
+    "AsyncBitMEXFetcher",
+    "AsyncPolymarketFetcher",
+    "AsyncStockFetcher",
+    "gather_bounded",
+    "run_coroutine_sync",
+    "PriceStore",
+    "disable_price_store",
+    "enable_price_store",
+    "get_price_store",
+    "PolymarketMarketCatalog",
+    "get_market_catalog",
+    "QuoteCache",
+    "MarketDataCache",
+    "get_market_data_cache",
+    "BacktestData",
+    "PrefetchedNews",
+    "PrefetchedPrices",
+    "load_news",
+    "load_polymarket_prices",
+    "load_stock_prices",
+    "load_stored_prices",
 ]
 
 if StockFetcher is not None:
     __all__.extend(
-        ["StockFetcher", "fetch_trending_stocks", "fetch_current_stock_price"]
+        [
+            "StockFetcher",
+            "fetch_trending_stocks",
+            "fetch_current_stock_price",
+            "fetch_current_stock_prices",
+        ]
     )
 
 if RedditFetcher is not None:
@@ -0,0 +1,154 @@
+"""
+Asyncio front-end for the synchronous fetchers.
+
+Each blocking fetcher call runs on a worker thread, so a system can fan out
+over its whole universe at once. Requests still go through
+``BaseFetcher.make_request``, which means the per-host token buckets in
+``http_session`` keep limiting how fast each host is actually hit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .base_fetcher import BaseFetcher
+from .bitmex_fetcher import BitMEXFetcher
+from .polymarket_fetcher import PolymarketFetcher
+
+T = TypeVar("T")
+
+DEFAULT_FETCH_CONCURRENCY = 8
+
+
+async def gather_bounded(
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    limit: int = DEFAULT_FETCH_CONCURRENCY,
+) -> List[Union[T, BaseException]]:
+    """Run coroutine factories with at most ``limit`` in flight.
+
+    Results come back in input order; failures are returned as exception
+    objects so one bad symbol does not cancel the rest of the cycle.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(
+        *(_run(factory) for factory in factories), return_exceptions=True
+    )
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion from synchronous code.
+
+    Falls back to a helper thread when called from inside a running event loop
+    (e.g. an async FastAPI handler), where ``asyncio.run`` is not allowed.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncBaseFetcher:
+    def __init__(self, fetcher: BaseFetcher) -> None:
+        self.fetcher = fetcher
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class AsyncStockFetcher(AsyncBaseFetcher):
+    def __init__(self, fetcher: Optional[BaseFetcher] = None) -> None:
+        if fetcher is None:
+            from .stock_fetcher import StockFetcher
+
+            fetcher = StockFetcher()
+        super().__init__(fetcher)
+
+    async def get_price_with_history(
+        self, ticker: str, date: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return await self.run(self.fetcher.get_price_with_history, ticker, date)
+
+    async def get_prices_with_history(
+        self, tickers: List[str], date: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        return await self.run(self.fetcher.get_prices_with_history, tickers, date)
+
+    async def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        return await self.run(self.fetcher.get_current_prices, tickers)
+
+
+class AsyncPolymarketFetcher(AsyncBaseFetcher):
+    fetcher: PolymarketFetcher
+
+    def __init__(self, fetcher: Optional[PolymarketFetcher] = None) -> None:
+        super().__init__(fetcher or PolymarketFetcher())
+
+    async def get_price_with_history(
+        self, token_id: str, date: Optional[str] = None, side: str = "buy"
+    ) -> Dict[str, Any]:
+        return await self.run(
+            self.fetcher.get_price_with_history, token_id, date=date, side=side
+        )
+
+    async def get_current_price(
+        self, token_id: str, side: str = "buy"
+    ) -> Optional[float]:
+        return await self.run(self.fetcher.get_price, token_id, side=side)
+
+    async def get_daily_history(
+        self, token_id: str, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        return await self.run(
+            self.fetcher._fetch_daily_history, token_id, start_date, end_date
+        )
+
+
+class AsyncBitMEXFetcher(AsyncBaseFetcher):
+    fetcher: BitMEXFetcher
+
+    def __init__(self, fetcher: Optional[BitMEXFetcher] = None) -> None:
+        super().__init__(fetcher or BitMEXFetcher())
+
+    async def get_price_with_history(
+        self,
+        symbol: str,
+        lookback_days: int = 10,
+        price_type: str = "mark",
+        date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await self.run(
+            self.fetcher.get_price_with_history,
+            symbol,
+            lookback_days=lookback_days,
+            price_type=price_type,
+            date=date,
+        )
+
+    async def get_price(self, symbol: str, price_type: str = "mark") -> float:
+        return await self.run(self.fetcher.get_price, symbol, price_type)
+
+    async def get_funding_rate(self, symbol: str) -> Dict[str, Any]:
+        return await self.run(self.fetcher.get_funding_rate, symbol)
+
+    async def get_orderbook(self, symbol: str, depth: int = 25) -> Dict[str, Any]:
+        return await self.run(self.fetcher.get_orderbook, symbol, depth)
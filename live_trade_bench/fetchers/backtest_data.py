@@ -0,0 +1,330 @@
+"""
+Whole-period market data for backtests.
+
+A backtest cycle used to fetch its prices and news over the network for the
+simulated day, so a run cost one round of requests per day per symbol.
+``BacktestData`` loads the daily series of the whole universe over
+``[start - lookback, end]`` and the news of the whole window a week at a time,
+before the day loop starts, and serves each day by slicing them in memory. The slices
+use the same windows as the per-day fetchers: a day sees the 10 days of
+history before it, the close on (or, for stocks, just after) the day and the
+news of the three days before it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .async_fetcher import (
+    DEFAULT_FETCH_CONCURRENCY,
+    AsyncBaseFetcher,
+    AsyncPolymarketFetcher,
+    gather_bounded,
+    run_coroutine_sync,
+)
+from .news_fetcher import NewsFetcher
+from .price_store import DateLike, get_price_store, to_day
+
+# the per-day fetchers load the 10 days before the day before the target
+HISTORY_DAYS = 11
+NEWS_DAYS = 3
+# a per-day news query reads one results page
+NEWS_ITEMS_PER_DAY = 10
+NEWS_PAGE_SIZE = 10
+# the window's news is fetched a week at a time, with as many pages as the
+# per-day queries of that week would have read
+NEWS_WINDOW_DAYS = 7
+
+
+class PrefetchedPrices:
+    def __init__(self, current_days: int = 1) -> None:
+        # closes on [day, day + current_days) count as the day's price
+        self.current_days = current_days
+        self._series: Dict[
+            str, Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+        ] = {}
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._series
+
+    def add(
+        self,
+        symbol: str,
+        dates: Iterable[DateLike],
+        prices: Iterable[float],
+        volumes: Optional[Iterable[float]] = None,
+    ) -> None:
+        days = np.array([to_day(d) for d in dates], dtype="datetime64[D]")
+        values = np.asarray(list(prices), dtype=np.float64)
+        volume = None if volumes is None else np.asarray(list(volumes), np.float64)
+        keep = ~np.isnan(values)
+        order = np.argsort(days[keep], kind="stable")
+        self._series[symbol] = (
+            days[keep][order],
+            values[keep][order],
+            None if volume is None else np.nan_to_num(volume[keep][order]),
+        )
+
+    def prices_with_history(
+        self, symbols: Iterable[str], date: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """``{symbol: {"current_price", "price_history"}}`` as seen on ``date``."""
+        day = to_day(date)
+        bounds = np.array(
+            [day - HISTORY_DAYS, day, day + self.current_days], dtype="datetime64[D]"
+        )
+        results: Dict[str, Dict[str, Any]] = {}
+        for symbol in symbols:
+            series = self._series.get(symbol)
+            if series is None:
+                continue
+            dates, prices, volumes = series
+            lo, mid, hi = np.searchsorted(dates, bounds)
+            history = [
+                {"date": str(d), "price": float(p)}
+                for d, p in zip(dates[lo:mid], prices[lo:mid])
+            ]
+            if volumes is not None:
+                for point, v in zip(history, volumes[lo:mid]):
+                    point["volume"] = int(v)
+            results[symbol] = {
+                "current_price": float(prices[mid]) if mid < hi else None,
+                "price_history": history,
+            }
+        return results
+
+    def current_prices(self, symbols: List[str], days: np.ndarray) -> np.ndarray:
+        """``(len(days), len(symbols))`` current prices, NaN where there is none."""
+        days = np.asarray(days, dtype="datetime64[D]")
+        out = np.full((len(days), len(symbols)), np.nan)
+        for j, symbol in enumerate(symbols):
+            series = self._series.get(symbol)
+            if series is None or not len(series[0]):
+                continue
+            dates, prices, _ = series
+            idx = np.searchsorted(dates, days)
+            found = idx < len(dates)
+            idx = np.minimum(idx, len(dates) - 1)
+            found &= dates[idx] < days + self.current_days
+            out[found, j] = prices[idx[found]]
+        return out
+
+
+class PrefetchedNews:
+    def __init__(self) -> None:
+        self._items: Dict[str, Tuple[np.ndarray, List[Dict[str, Any]]]] = {}
+
+    def __contains__(self, query: object) -> bool:
+        return query in self._items
+
+    def add(self, query: str, items: Iterable[Dict[str, Any]]) -> None:
+        dated = sorted(
+            (it for it in items if it.get("date") is not None),
+            key=lambda it: it["date"],
+        )
+        stamps = np.array([it["date"] for it in dated], dtype=np.float64)
+        self._items[query] = (stamps, dated)
+
+    def for_day(
+        self, query: str, date: str, tag: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """News of the days before ``date``, closest to ``date`` first."""
+        if query not in self._items:
+            return []
+        stamps, items = self._items[query]
+        target = datetime.strptime(date, "%Y-%m-%d")
+        lo, hi = np.searchsorted(
+            stamps,
+            [
+                (target - timedelta(days=NEWS_DAYS + 1)).timestamp(),
+                target.timestamp(),
+            ],
+        )
+        window = sorted(
+            items[lo:hi], key=lambda it: abs(it["date"] - target.timestamp())
+        )
+        return [
+            dict(it, tag=tag) if tag is not None else dict(it)
+            for it in window[:NEWS_ITEMS_PER_DAY]
+        ]
+
+
+@dataclass
+class BacktestData:
+    start_date: str
+    end_date: str
+    prices: PrefetchedPrices
+    news: Optional[PrefetchedNews] = None
+
+    def covers(self, date: str) -> bool:
+        return self.start_date <= date <= self.end_date
+
+    def prices_for_day(
+        self, symbols: Iterable[str], date: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Prefetched prices, or ``None`` when ``date`` is outside the period."""
+        if not self.covers(date):
+            return None
+        return self.prices.prices_with_history(symbols, date)
+
+    def news_for_day(
+        self, query: str, date: str, tag: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Prefetched news, or ``None`` when ``query`` or ``date`` was not loaded."""
+        if self.news is None or query not in self.news or not self.covers(date):
+            return None
+        return self.news.for_day(query, date, tag=tag)
+
+
+def _shift(date: str, days: int) -> str:
+    return (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=days)).strftime(
+        "%Y-%m-%d"
+    )
+
+
+def load_stock_prices(
+    tickers: List[str], start_date: str, end_date: str
+) -> PrefetchedPrices:
+    """Daily closes of ``tickers`` for a backtest, in one download."""
+    from .stock_fetcher import StockFetcher
+
+    # a stock day falls back to the next session's close
+    closes, volumes = StockFetcher()._load_daily_bars(
+        tickers, _shift(start_date, -HISTORY_DAYS), _shift(end_date, 1)
+    )
+    prices = PrefetchedPrices(current_days=2)
+    for ticker in tickers:
+        if ticker not in closes:
+            continue
+        close = closes[ticker].dropna()
+        volume = (
+            volumes[ticker].reindex(close.index).fillna(0)
+            if ticker in volumes
+            else np.zeros(len(close))
+        )
+        prices.add(
+            ticker,
+            close.index.strftime("%Y-%m-%d"),
+            close.to_numpy(),
+            np.asarray(volume),
+        )
+    return prices
+
+
+def load_stored_prices(
+    symbols: Iterable[str],
+    start_date: str,
+    end_date: str,
+    source: str = "yfinance",
+    field: str = "close",
+    current_days: int = 2,
+) -> PrefetchedPrices:
+    """Daily ``field`` bars of ``symbols`` read from the price store only.
+
+    Nothing is downloaded; symbols the store has no bars for are left out.
+    """
+    store = get_price_store()
+    prices = PrefetchedPrices(current_days=current_days)
+    if store is None:
+        return prices
+    for symbol in symbols:
+        bars = store.read(source, symbol, _shift(start_date, -HISTORY_DAYS), end_date)
+        if field in bars and len(bars["date"]):
+            prices.add(symbol, bars["date"], bars[field])
+    return prices
+
+
+def load_polymarket_prices(
+    token_ids: List[str],
+    start_date: str,
+    end_date: str,
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+) -> PrefetchedPrices:
+    """Daily prices of ``token_ids`` for a backtest, one series per token."""
+    first = _shift(start_date, -HISTORY_DAYS)
+    fetcher = AsyncPolymarketFetcher()
+    results = run_coroutine_sync(
+        gather_bounded(
+            [
+                partial(fetcher.get_daily_history, token_id, first, end_date)
+                for token_id in token_ids
+            ],
+            concurrency,
+        )
+    )
+    prices = PrefetchedPrices(current_days=1)
+    for token_id, history in zip(token_ids, results):
+        if isinstance(history, BaseException):
+            print(f"    - Failed to prefetch history for token {token_id}: {history}")
+            continue
+        prices.add(
+            token_id, [h["date"] for h in history], [h["price"] for h in history]
+        )
+    return prices
+
+
+def news_windows(
+    first: str, last: str, window_days: int = NEWS_WINDOW_DAYS
+) -> List[Tuple[str, str, int]]:
+    """``(start, end, pages)`` of each window covering ``[first, last]``.
+
+    A single query over a long range returns the same few pages whatever its
+    length, so most days would get no news. Each window instead reads about
+    the ``NEWS_ITEMS_PER_DAY`` items a day the per-day queries would have.
+    """
+    windows = []
+    start = first
+    while start <= last:
+        end = min(_shift(start, window_days - 1), last)
+        days = (
+            datetime.strptime(end, "%Y-%m-%d") - datetime.strptime(start, "%Y-%m-%d")
+        ).days + 1
+        pages = -(-days * NEWS_ITEMS_PER_DAY // NEWS_PAGE_SIZE)
+        windows.append((start, end, pages))
+        start = _shift(end, 1)
+    return windows
+
+
+def load_news(
+    queries: List[str],
+    start_date: str,
+    end_date: str,
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    window_days: int = NEWS_WINDOW_DAYS,
+) -> PrefetchedNews:
+    """All news of the backtest window, fetched per query and week."""
+    first = _shift(start_date, -(NEWS_DAYS + 1))
+    last = _shift(end_date, -1)
+    fetcher = AsyncBaseFetcher(NewsFetcher())
+    queries = list(dict.fromkeys(queries))
+    windows = news_windows(first, last, window_days)
+    results = run_coroutine_sync(
+        gather_bounded(
+            [
+                partial(fetcher.run, fetcher.fetcher.fetch, q, start, end, pages)
+                for q in queries
+                for start, end, pages in windows
+            ],
+            concurrency,
+        )
+    )
+    news = PrefetchedNews()
+    for i, query in enumerate(queries):
+        items: Dict[Any, Dict[str, Any]] = {}
+        failed = 0
+        for result in results[i * len(windows) : (i + 1) * len(windows)]:
+            if isinstance(result, BaseException):
+                failed += 1
+                continue
+            for item in result:
+                # a story on a window boundary can show up in both windows
+                items.setdefault(item.get("link") or id(item), item)
+        if failed:
+            print(f"    - Failed to prefetch {failed} news windows for '{query}'")
+        news.add(query, items.values())
+    return news
@@ -1,5 +1,3 @@
-import random
-import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
@@ -12,6 +10,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from .http_session import get_session_manager
+
 
 class BaseFetcher(ABC):
     def __init__(self, min_delay: float = 1.0, max_delay: float = 3.0):
@@ -30,8 +30,12 @@ class BaseFetcher(ABC):
             "Upgrade-Insecure-Requests": "1",
         }
 
-    def _rate_limit_delay(self) -> None:
-        time.sleep(random.uniform(self.min_delay, self.max_delay))
+    def _rate_limit_delay(self, url: str) -> None:
+        # Hosts without an explicit limit get the fetcher's average delay as
+        # their refill interval; only calls that exceed it actually wait.
+        mean_delay = (self.min_delay + self.max_delay) / 2
+        default_rate = 1.0 / mean_delay if mean_delay > 0 else None
+        get_session_manager().throttle(url, default_rate=default_rate)
 
     @staticmethod
     def is_rate_limited(response: Any) -> bool:
@@ -48,7 +52,7 @@ class BaseFetcher(ABC):
     def make_request(
         self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs: Any
     ) -> requests.Response:
-        self._rate_limit_delay()
+        self._rate_limit_delay(url)
         headers = headers or self.default_headers
         kwargs.setdefault("timeout", 8)
 
@@ -61,7 +65,7 @@ class BaseFetcher(ABC):
             })
             kwargs["cookies"] = cookies
 
-        return requests.get(url, headers=headers, **kwargs)
+        return get_session_manager().get(url, headers=headers, **kwargs)
 
     @retry(
         retry=retry_if_exception_type((RuntimeError, Exception)),
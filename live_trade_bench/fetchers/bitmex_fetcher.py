@@ -10,14 +10,24 @@ import hmac
 import logging
 import os
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from .base_fetcher import BaseFetcher
+from .price_store import get_price_store
 
 logger = logging.getLogger(__name__)
 
 
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _day_start(day: date) -> datetime:
+    """Midnight UTC, which is where BitMEX stamps its daily buckets."""
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
 class BitMEXFetcher(BaseFetcher):
     """Fetcher for BitMEX cryptocurrency derivatives exchange data."""
 
@@ -215,6 +225,62 @@ class BitMEXFetcher(BaseFetcher):
         Returns:
             List of OHLCV data points
         """
+        store = get_price_store()
+        if store is None or interval != "1d":
+            return self._request_price_history(symbol, start_date, end_date, interval)
+
+        source = "bitmex_testnet" if self.base_url == self.TESTNET_URL else "bitmex"
+        for gap_start, gap_end in store.missing_ranges(
+            source, symbol, start_date, end_date
+        ):
+            fetch_start = _day_start(gap_start.astype(object))
+            fetch_end = _day_start(gap_end.astype(object))
+            candles = self._request_price_history(symbol, fetch_start, fetch_end, "1d")
+            covered_end = gap_end
+            if len(candles) >= 500:
+                # truncated page: only trust what came back
+                covered_end = candles[-1]["date"]
+            store.write(
+                source,
+                symbol,
+                [c["date"] for c in candles],
+                {
+                    field: [
+                        c[field] if c[field] is not None else float("nan")
+                        for c in candles
+                    ]
+                    for field in ("open", "high", "low", "close", "volume", "trades")
+                },
+                covered=(gap_start, covered_end),
+            )
+
+        start_utc = _as_utc(start_date)
+        end_utc = _as_utc(end_date)
+        bars = store.read(source, symbol, start_date, end_date)
+        history = []
+        for i, day in enumerate(bars["date"].astype(object)):
+            if not start_utc <= _day_start(day) <= end_utc:
+                continue
+            point: Dict[str, Any] = {
+                "timestamp": f"{day.isoformat()}T00:00:00.000Z",
+                "date": day.isoformat(),
+            }
+            for field in ("open", "high", "low", "close"):
+                value = bars[field][i] if field in bars else float("nan")
+                point[field] = None if value != value else float(value)
+            for field in ("volume", "trades"):
+                value = bars[field][i] if field in bars else 0
+                point[field] = 0 if value != value else int(value)
+            history.append(point)
+        return history
+
+    def _request_price_history(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d"
+    ) -> List[Dict[str, Any]]:
         url = f"{self.base_url}/trade/bucketed"
 
         # BitMEX expects ISO format timestamps
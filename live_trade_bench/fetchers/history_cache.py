@@ -0,0 +1,157 @@
+"""
+Cache for full price-history series keyed by token.
+
+Polymarket's ``prices-history`` endpoint returns the whole series for a token,
+so the fetcher keeps it here and filters windows locally. Entries expire after
+``ttl`` seconds; an expired entry is topped up with only the points after its
+last timestamp instead of being downloaded again. An entry fetched after the
+end of the requested window is served regardless of age, since that part of
+the series can no longer change (this is what backtests hit).
+
+Entries live in memory and, when the price store is enabled, as JSON files
+next to it so they survive restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .price_store import get_price_store
+
+DEFAULT_HISTORY_TTL = 15 * 60
+
+Points = List[Dict[str, Any]]
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class _Entry:
+    __slots__ = ("points", "fetched_at")
+
+    def __init__(self, points: Points, fetched_at: float) -> None:
+        self.points = points
+        self.fetched_at = fetched_at
+
+
+class PriceHistoryCache:
+    def __init__(
+        self,
+        name: str,
+        ttl: float = DEFAULT_HISTORY_TTL,
+        root: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.root = root
+        self._clock = clock
+        self._entries: Dict[Tuple[str, int], _Entry] = {}
+        self._key_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _dir(self) -> Optional[str]:
+        if self.root:
+            return self.root
+        store = get_price_store()
+        return os.path.join(store.root, self.name) if store is not None else None
+
+    def _path(self, token_id: str, fidelity: int) -> Optional[str]:
+        directory = self._dir()
+        if directory is None:
+            return None
+        return os.path.join(
+            directory, f"{_UNSAFE_CHARS.sub('_', token_id)}_{fidelity}.json"
+        )
+
+    def _key_lock(self, key: Tuple[str, int]) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _load(self, token_id: str, fidelity: int) -> Optional[_Entry]:
+        path = self._path(token_id, fidelity)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            return _Entry(data["points"], float(data["fetched_at"]))
+        except Exception as e:
+            print(f"Ignoring unreadable history cache {path}: {e}")
+            return None
+
+    def _save(self, token_id: str, fidelity: int, entry: _Entry) -> None:
+        path = self._path(token_id, fidelity)
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"fetched_at": entry.fetched_at, "points": entry.points}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Failed to write history cache {path}: {e}")
+
+    def get(
+        self,
+        token_id: str,
+        fidelity: int,
+        fetch: Callable[[Optional[int]], Optional[Points]],
+        until_ts: Optional[int] = None,
+    ) -> Optional[Points]:
+        """Cached points for ``token_id``, fetching or topping up as needed.
+
+        ``fetch(start_ts)`` downloads points from ``start_ts`` on (the whole
+        series when None) and returns None on failure.
+        """
+        key = (token_id, fidelity)
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._load(token_id, fidelity)
+                if entry is not None:
+                    self._entries[key] = entry
+
+            now = self._clock()
+            if entry is not None and (
+                now - entry.fetched_at < self.ttl
+                or (until_ts is not None and entry.fetched_at > until_ts)
+            ):
+                return entry.points
+
+            if entry is not None and entry.points:
+                last_ts = int(entry.points[-1]["t"])
+                try:
+                    new_points = fetch(last_ts)
+                except Exception as e:
+                    print(f"Serving stale history for {token_id}: {e}")
+                    return entry.points
+                if new_points is None:
+                    return entry.points
+                # refetched timestamps replace what was cached for them
+                merged = {p["t"]: p for p in entry.points}
+                merged.update({p["t"]: p for p in new_points})
+                points = [merged[t] for t in sorted(merged)]
+            else:
+                fetched = fetch(None)
+                if fetched is None:
+                    return entry.points if entry is not None else None
+                points = sorted(fetched, key=lambda p: p["t"])
+
+            entry = _Entry(points, now)
+            self._entries[key] = entry
+            self._save(token_id, fidelity, entry)
+            return entry.points
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
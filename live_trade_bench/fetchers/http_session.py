@@ -0,0 +1,184 @@
+"""
+Process-wide HTTP session layer shared by all fetchers.
+
+Keeps one keep-alive ``requests.Session`` per host (so repeated calls reuse the
+same TCP/TLS connection) and one token bucket per host (so we only wait when a
+host is actually being hit faster than it allows).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+
+# (requests per second, burst) for the hosts the fetchers talk to
+HOST_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "www.bitmex.com": (0.5, 10),  # public API allows 30 requests/minute
+    "testnet.bitmex.com": (0.5, 10),
+    "gamma-api.polymarket.com": (5.0, 10),
+    "clob.polymarket.com": (5.0, 10),
+    "www.reddit.com": (1.0, 2),
+    "www.google.com": (0.25, 1),
+}
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket and return how long the caller must wait.
+
+        Reservations may drive the balance negative, which queues concurrent
+        callers behind each other instead of letting them race for refills.
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SessionManager:
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        host_rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_rate_limits: Dict[str, Tuple[float, int]] = dict(
+            HOST_RATE_LIMITS if host_rate_limits is None else host_rate_limits
+        )
+        self._sessions: Dict[str, requests.Session] = {}
+        self._limiters: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    def configure_host(self, host: str, rate: float, burst: int = 1) -> None:
+        host = host.lower()
+        with self._lock:
+            self.host_rate_limits[host] = (rate, burst)
+            self._limiters[host] = TokenBucket(rate, burst)
+
+    def session_for(self, url: str) -> requests.Session:
+        parsed = urlparse(url)
+        key = f"{parsed.scheme}://{(parsed.hostname or '').lower()}"
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+        return session
+
+    def limiter_for(
+        self,
+        url: str,
+        default_rate: Optional[float] = None,
+        default_burst: int = 1,
+    ) -> Optional[TokenBucket]:
+        host = self.host_of(url)
+        limiter = self._limiters.get(host)
+        if limiter is not None:
+            return limiter
+        rate, burst = self.host_rate_limits.get(host, (default_rate, default_burst))
+        if not rate:
+            return None
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = TokenBucket(rate, burst)
+                self._limiters[host] = limiter
+        return limiter
+
+    def throttle(
+        self,
+        url: str,
+        default_rate: Optional[float] = None,
+        default_burst: int = 1,
+    ) -> float:
+        limiter = self.limiter_for(url, default_rate, default_burst)
+        return limiter.acquire() if limiter is not None else 0.0
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session_for(url).get(url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_session_manager: Optional[SessionManager] = None
+_session_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> SessionManager:
+    global _session_manager
+    if _session_manager is None:
+        with _session_manager_lock:
+            if _session_manager is None:
+                _session_manager = SessionManager()
+    return _session_manager
+
+
+def configure_session_manager(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    host_rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+) -> SessionManager:
+    """Replace the process-wide manager, e.g. to raise pool sizes for backtests."""
+    global _session_manager
+    with _session_manager_lock:
+        if _session_manager is not None:
+            _session_manager.close()
+        _session_manager = SessionManager(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            host_rate_limits=host_rate_limits,
+        )
+    return _session_manager
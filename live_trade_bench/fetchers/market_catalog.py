@@ -0,0 +1,211 @@
+"""
+Indexed catalog of active Polymarket markets.
+
+Pages through the Gamma ``/markets`` endpoint once and indexes the result by
+event slug and market id, so bootstrapping a universe from a list of event
+URLs is one paged scan plus dictionary lookups. The catalog is refreshed
+after ``ttl`` seconds and persisted (``LTB_MARKET_CATALOG`` or
+``data/polymarket_catalog.json``) so restarts within the TTL skip the scan
+entirely. A page that fails aborts the scan and the previous index is kept,
+so a partial scan never replaces a complete one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+CATALOG_PATH_ENV = "LTB_MARKET_CATALOG"
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "polymarket_catalog.json",
+)
+DEFAULT_CATALOG_TTL = 6 * 60 * 60
+CATALOG_PAGE_SIZE = 500
+CATALOG_MAX_PAGES = 20
+# after a failed scan, lookups skip rescanning for this many seconds
+CATALOG_RETRY_DELAY = 60
+
+Market = Dict[str, Any]
+FetchPage = Callable[[Dict[str, Any]], List[Dict[str, Any]]]
+
+
+def _json_list(value: Any) -> List[Any]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return list(value) if isinstance(value, (list, tuple)) else []
+
+
+def normalize_market(raw: Dict[str, Any]) -> Optional[Market]:
+    """The fields the systems use, or None for entries without an id."""
+    if not isinstance(raw, dict) or not raw.get("id"):
+        return None
+    events = raw.get("events") or []
+    first_event = events[0] if events and isinstance(events[0], dict) else {}
+    event_slug = first_event.get("slug")
+    return {
+        "id": raw.get("id"),
+        "question": raw.get("question"),
+        "category": raw.get("category"),
+        "token_ids": _json_list(raw.get("clobTokenIds")),
+        "outcomes": _json_list(raw.get("outcomes")),
+        "event_slug": event_slug,
+    }
+
+
+class PolymarketMarketCatalog:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CATALOG_TTL,
+        root: Optional[str] = None,
+        fetch_page: Optional[FetchPage] = None,
+        page_size: int = CATALOG_PAGE_SIZE,
+        max_pages: int = CATALOG_MAX_PAGES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.root = root
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._fetch_page = fetch_page
+        self._clock = clock
+        self._by_slug: Dict[str, Market] = {}
+        self._by_id: Dict[str, Market] = {}
+        self._fetched_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _path(self) -> str:
+        if self.root:
+            return os.path.join(self.root, "polymarket_catalog.json")
+        return os.environ.get(CATALOG_PATH_ENV) or DEFAULT_CATALOG_PATH
+
+    def _default_fetch_page(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # unlike PolymarketFetcher._fetch_markets, failures raise: an empty
+        # page would end the scan as if the catalog were complete
+        from .polymarket_fetcher import PolymarketFetcher
+
+        fetcher = PolymarketFetcher()
+        resp = fetcher.make_request(
+            "https://gamma-api.polymarket.com/markets", params=params, timeout=15
+        )
+        fetcher.validate_response(resp, "Markets API")
+        data = fetcher.safe_json_parse(resp, "Markets API")
+        return data.get("data", []) if isinstance(data, dict) else (data or [])
+
+    def _scan(self) -> List[Market]:
+        fetch_page = self._fetch_page or self._default_fetch_page
+        markets: List[Market] = []
+        for page in range(self.max_pages):
+            params = {
+                "limit": self.page_size,
+                "offset": page * self.page_size,
+                "active": "true",
+                "closed": "false",
+            }
+            rows = fetch_page(params)
+            for raw in rows:
+                market = normalize_market(raw)
+                if market is not None:
+                    markets.append(market)
+            if len(rows) < self.page_size:
+                break
+        return markets
+
+    def _index(self, markets: List[Market], fetched_at: float) -> None:
+        by_slug: Dict[str, Market] = {}
+        by_id: Dict[str, Market] = {}
+        for market in markets:
+            by_id.setdefault(str(market["id"]), market)
+            slug = market.get("event_slug")
+            # first market of an event with tradable tokens wins
+            if slug and market["token_ids"] and slug not in by_slug:
+                by_slug[slug] = market
+        self._by_slug = by_slug
+        self._by_id = by_id
+        self._fetched_at = fetched_at
+
+    def _load(self) -> bool:
+        path = self._path()
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            self._index(data["markets"], float(data["fetched_at"]))
+            return True
+        except Exception as e:
+            print(f"Ignoring unreadable market catalog {path}: {e}")
+            return False
+
+    def _save(self, markets: List[Market]) -> None:
+        path = self._path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"fetched_at": self._fetched_at, "markets": markets}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Failed to write market catalog {path}: {e}")
+
+    def _ensure_fresh(self, force: bool = False) -> None:
+        if self._fetched_at is None:
+            self._load()
+        now = self._clock()
+        fresh = self._fetched_at is not None and now - self._fetched_at < self.ttl
+        if fresh and not force:
+            return
+        if (
+            not force
+            and self._failed_at is not None
+            and now - self._failed_at < CATALOG_RETRY_DELAY
+        ):
+            return
+        try:
+            markets = self._scan()
+        except Exception as e:
+            print(f"Market catalog refresh failed: {e}")
+            markets = []
+        if not markets:
+            # a failed page or an empty scan is an API failure; keep whatever
+            # we had and retry later
+            self._failed_at = now
+            return
+        self._failed_at = None
+        self._index(markets, now)
+        self._save(markets)
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._ensure_fresh(force=True)
+
+    def by_event_slug(self, event_slug: str) -> Optional[Market]:
+        with self._lock:
+            self._ensure_fresh()
+            market = self._by_slug.get(event_slug)
+        return dict(market) if market is not None else None
+
+    def by_id(self, market_id: Any) -> Optional[Market]:
+        with self._lock:
+            self._ensure_fresh()
+            market = self._by_id.get(str(market_id))
+        return dict(market) if market is not None else None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+_market_catalog = PolymarketMarketCatalog()
+
+
+def get_market_catalog() -> PolymarketMarketCatalog:
+    return _market_catalog
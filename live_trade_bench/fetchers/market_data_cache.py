@@ -0,0 +1,107 @@
+"""
+Shared cache for live per-symbol market data.
+
+The trading cycle and the backend's news job both call a system's
+``_fetch_market_data`` for the same universe within minutes, and each call
+used to download price history (plus funding and order books for BitMEX)
+again. Live fetches now go through this cache. Entries younger than ``ttl``
+seconds are served from memory. Only missing or expired symbols are fetched,
+and a symbol that is already being fetched by another thread is waited for
+rather than requested twice, so there is one upstream fetch per symbol per
+freshness window. Backtest fetches (with a date) bypass the cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_MARKET_DATA_TTL = 5 * 60
+
+FetchMany = Callable[[List[str]], Dict[str, Any]]
+
+
+class MarketDataCache:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_MARKET_DATA_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key: Tuple[str, str], now: float) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and now - entry[1] < self.ttl
+
+    def get_many(
+        self, namespace: str, symbols: Iterable[str], fetch: FetchMany
+    ) -> Dict[str, Any]:
+        """Payloads for ``symbols``; ``fetch`` gets the stale ones in one call.
+
+        ``fetch`` returns a dict of the symbols it could load. A symbol it
+        leaves out (or whose concurrent fetch failed) is dropped from the
+        cache and missing from the result, like an uncached failed fetch;
+        only payloads younger than ``ttl`` are ever returned. Exceptions from
+        ``fetch`` propagate to the caller that made the request.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        with self._lock:
+            now = self._clock()
+            to_fetch: List[str] = []
+            waits: List[threading.Event] = []
+            for symbol in symbols:
+                key = (namespace, symbol)
+                if self._fresh(key, now):
+                    continue
+                event = self._inflight.get(key)
+                if event is None:
+                    self._inflight[key] = threading.Event()
+                    to_fetch.append(symbol)
+                else:
+                    waits.append(event)
+
+        if to_fetch:
+            fetched: Dict[str, Any] = {}
+            try:
+                fetched = fetch(to_fetch)
+            finally:
+                with self._lock:
+                    fetched_at = self._clock()
+                    for symbol in to_fetch:
+                        key = (namespace, symbol)
+                        if symbol in fetched:
+                            self._entries[key] = (fetched[symbol], fetched_at)
+                        else:
+                            # never trade on the previous window's prices
+                            self._entries.pop(key, None)
+                        self._inflight.pop(key).set()
+        for event in waits:
+            event.wait()
+
+        with self._lock:
+            now = self._clock()
+            return {
+                symbol: self._entries[(namespace, symbol)][0]
+                for symbol in symbols
+                if self._fresh((namespace, symbol), now)
+            }
+
+    def invalidate(self, namespace: str | None = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == namespace]:
+                    del self._entries[key]
+
+
+_market_data_cache = MarketDataCache()
+
+
+def get_market_data_cache() -> MarketDataCache:
+    return _market_data_cache
@@ -90,11 +90,6 @@ class NewsFetcher(BaseFetcher):
 
     def _extract_snippet_from_url(self, url: str) -> str:
         try:
-            # Add small delay to avoid rate limiting
-            import time
-
-            time.sleep(0.5)
-
             # Fetch the article page with timeout
             resp = self.make_request(url, timeout=10)
             if resp.status_code != 200:
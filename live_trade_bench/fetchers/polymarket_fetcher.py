@@ -4,6 +4,11 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Union
 
 from live_trade_bench.fetchers.base_fetcher import BaseFetcher
+from live_trade_bench.fetchers.history_cache import PriceHistoryCache
+from live_trade_bench.fetchers.price_store import get_price_store, to_day
+
+# full prices-history series per token, shared by every PolymarketFetcher
+_history_cache = PriceHistoryCache("polymarket_history")
 
 
 class PolymarketFetcher(BaseFetcher):
@@ -256,35 +261,92 @@ class PolymarketFetcher(BaseFetcher):
     def _fetch_daily_history(
         self, token_id: str, start_date: str, end_date: str, fidelity: int = 1440
     ) -> List[Dict[str, Any]]:
-        url = "https://clob.polymarket.com/prices-history"
-        cur = datetime.strptime(start_date, "%Y-%m-%d").replace(
-            hour=0, minute=0, second=0, tzinfo=timezone.utc
+        until_ts = int(
+            datetime.strptime(end_date, "%Y-%m-%d")
+            .replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
+            .timestamp()
         )
-        end = datetime.strptime(end_date, "%Y-%m-%d").replace(
-            hour=23, minute=59, second=59, tzinfo=timezone.utc
-        )
-        resp = self.make_request(
-            url,
-            params={
-                "market": token_id,
-                "fidelity": fidelity,
-                "interval": "max",
-            },
-            timeout=15,
+        store = get_price_store()
+        if store is None or fidelity != 1440:
+            points = self._fetch_history_points(token_id, fidelity, until_ts) or []
+            return self._daily_prices(points, start_date, end_date)
+
+        gaps = store.missing_ranges("polymarket", token_id, start_date, end_date)
+        if gaps:
+            # prices-history always returns the full series, so store all of it
+            points = self._fetch_history_points(token_id, fidelity, until_ts)
+            if points is not None:
+                daily = self._daily_prices(points)
+                covered_start = gaps[0][0]
+                if daily:
+                    covered_start = min(covered_start, to_day(daily[0]["date"]))
+                store.write(
+                    "polymarket",
+                    token_id,
+                    [d["date"] for d in daily],
+                    {"price": [d["price"] for d in daily]},
+                    covered=(covered_start, gaps[-1][1]),
+                )
+
+        bars = store.read("polymarket", token_id, start_date, end_date)
+        return [
+            {"date": str(day), "price": float(price)}
+            for day, price in zip(bars["date"], bars.get("price", []))
+            if price == price
+        ]
+
+    def _fetch_history_points(
+        self, token_id: str, fidelity: int = 1440, until_ts: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        return _history_cache.get(
+            token_id,
+            fidelity,
+            lambda start_ts: self._request_history_points(token_id, fidelity, start_ts),
+            until_ts=until_ts,
         )
 
-        if resp.status_code == 200:
-            data = self.safe_json_parse(resp, f"History for {token_id}")
-            points = data.get("history", []) if isinstance(data, dict) else []
-            filtered_points = []
-            for p in points:
-                if p["t"] < int(cur.timestamp()) or p["t"] > int(end.timestamp()):
-                    continue
-                filtered_points.append(p)
+    def _request_history_points(
+        self, token_id: str, fidelity: int, start_ts: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        url = "https://clob.polymarket.com/prices-history"
+        params: Dict[str, Any] = {"market": token_id, "fidelity": fidelity}
+        if start_ts is None:
+            params["interval"] = "max"
+        else:
+            params["startTs"] = start_ts
+        resp = self.make_request(url, params=params, timeout=15)
+        if resp.status_code != 200:
+            return None
+        data = self.safe_json_parse(resp, f"History for {token_id}")
+        return data.get("history", []) if isinstance(data, dict) else []
+
+    @staticmethod
+    def _daily_prices(
+        points: List[Dict[str, Any]],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        start_ts = end_ts = None
+        if start_date:
+            start_ts = int(
+                datetime.strptime(start_date, "%Y-%m-%d")
+                .replace(hour=0, minute=0, second=0, tzinfo=timezone.utc)
+                .timestamp()
+            )
+        if end_date:
+            end_ts = int(
+                datetime.strptime(end_date, "%Y-%m-%d")
+                .replace(hour=23, minute=59, second=59, tzinfo=timezone.utc)
+                .timestamp()
+            )
 
         # Group by date and keep the latest price for each day
         daily_prices = {}
-        for p in filtered_points:
+        for p in points:
+            if start_ts is not None and p["t"] < start_ts:
+                continue
+            if end_ts is not None and p["t"] > end_ts:
+                continue
             date_str = datetime.fromtimestamp(p["t"], tz=timezone.utc).strftime(
                 "%Y-%m-%d"
             )
@@ -0,0 +1,239 @@
+"""
+On-disk columnar cache for daily price bars.
+
+Each (source, symbol) series is one ``.npz`` file holding a sorted
+``datetime64[D]`` date column, one float column per field and the list of date
+intervals that have already been fetched. Fetchers ask for the missing parts
+of a window, download only those, and read the whole window back from here.
+
+The store is opt-in: it is enabled by ``enable_price_store`` (the backtest
+runner does this) or by setting ``LTB_PRICE_CACHE_DIR``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+import threading
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+PRICE_CACHE_ENV = "LTB_PRICE_CACHE_DIR"
+DEFAULT_PRICE_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "price_cache",
+)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def to_day(value: DateLike) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        value = value[:10]
+    return np.datetime64(value, "D")
+
+
+def _today() -> np.datetime64:
+    return np.datetime64(datetime.now(timezone.utc).date(), "D")
+
+
+class _Series:
+    __slots__ = ("columns", "covered", "dates")
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        covered: np.ndarray,
+    ) -> None:
+        self.dates = dates
+        self.columns = columns
+        self.covered = covered  # (k, 2) int64 day numbers, inclusive, merged
+
+
+class PriceStore:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, source: str, symbol: str) -> str:
+        return os.path.join(
+            self.root,
+            _UNSAFE_CHARS.sub("_", source),
+            f"{_UNSAFE_CHARS.sub('_', symbol)}.npz",
+        )
+
+    def _load(self, source: str, symbol: str) -> _Series:
+        key = (source, symbol)
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        path = self._path(source, symbol)
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    columns = {
+                        name[4:]: data[name]
+                        for name in data.files
+                        if name.startswith("col_")
+                    }
+                    series = _Series(data["dates"], columns, data["covered"])
+            except Exception as e:
+                print(f"Ignoring unreadable price cache {path}: {e}")
+        if series is None:
+            series = _Series(
+                np.empty(0, dtype="datetime64[D]"), {}, np.empty((0, 2), dtype=np.int64)
+            )
+        self._series[key] = series
+        return series
+
+    def _save(self, source: str, symbol: str, series: _Series) -> None:
+        path = self._path(source, symbol)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    dates=series.dates,
+                    covered=series.covered,
+                    **{f"col_{name}": col for name, col in series.columns.items()},
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def missing_ranges(
+        self, source: str, symbol: str, start: DateLike, end: DateLike
+    ) -> List[Tuple[np.datetime64, np.datetime64]]:
+        """Sub-ranges of ``[start, end]`` (inclusive days) not fetched yet."""
+        lo = int(to_day(start).astype(np.int64))
+        hi = int(to_day(end).astype(np.int64))
+        if hi < lo:
+            return []
+        with self._lock:
+            covered = self._load(source, symbol).covered
+        gaps = []
+        cursor = lo
+        for c_start, c_end in covered:
+            if c_end < cursor:
+                continue
+            if c_start > hi:
+                break
+            if c_start > cursor:
+                gaps.append((cursor, min(hi, int(c_start) - 1)))
+            cursor = max(cursor, int(c_end) + 1)
+            if cursor > hi:
+                break
+        if cursor <= hi:
+            gaps.append((cursor, hi))
+        return [(np.datetime64(a, "D"), np.datetime64(b, "D")) for a, b in gaps]
+
+    def write(
+        self,
+        source: str,
+        symbol: str,
+        dates: Sequence[DateLike],
+        columns: Dict[str, Sequence[float]],
+        covered: Optional[Tuple[DateLike, DateLike]] = None,
+    ) -> None:
+        """Upsert bars and mark ``covered`` as fetched.
+
+        Today is never marked covered, since its bar is still changing.
+        """
+        new_dates = np.array([to_day(d) for d in dates], dtype="datetime64[D]")
+        with self._lock:
+            series = self._load(source, symbol)
+            names = sorted(set(series.columns) | set(columns))
+            merged_dates = np.union1d(series.dates, new_dates)
+            merged: Dict[str, np.ndarray] = {}
+            for name in names:
+                col = np.full(len(merged_dates), np.nan)
+                if name in series.columns:
+                    col[np.searchsorted(merged_dates, series.dates)] = series.columns[
+                        name
+                    ]
+                if name in columns:
+                    # new values win over what was cached for the same day
+                    col[np.searchsorted(merged_dates, new_dates)] = np.asarray(
+                        columns[name], dtype=float
+                    )
+                merged[name] = col
+            series.dates = merged_dates
+            series.columns = merged
+
+            if covered is not None:
+                lo = int(to_day(covered[0]).astype(np.int64))
+                hi = min(
+                    int(to_day(covered[1]).astype(np.int64)),
+                    int(_today().astype(np.int64)) - 1,
+                )
+                if hi >= lo:
+                    series.covered = _merge_intervals(series.covered, lo, hi)
+
+            self._save(source, symbol, series)
+
+    def read(
+        self, source: str, symbol: str, start: DateLike, end: DateLike
+    ) -> Dict[str, np.ndarray]:
+        """Bars in ``[start, end]`` as ``{"date": ..., <field>: ...}`` arrays."""
+        lo, hi = to_day(start), to_day(end)
+        with self._lock:
+            series = self._load(source, symbol)
+            i = np.searchsorted(series.dates, lo, side="left")
+            j = np.searchsorted(series.dates, hi, side="right")
+            out = {"date": series.dates[i:j]}
+            for name, col in series.columns.items():
+                out[name] = col[i:j]
+        return out
+
+
+def _merge_intervals(covered: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    intervals = sorted([tuple(map(int, row)) for row in covered] + [(lo, hi)])
+    merged: List[List[int]] = []
+    for a, b in intervals:
+        if merged and a <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    return np.array(merged, dtype=np.int64).reshape(-1, 2)
+
+
+_price_store: Optional[PriceStore] = None
+_price_store_lock = threading.Lock()
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """The process-wide store, or None when caching is off."""
+    global _price_store
+    if _price_store is None and os.environ.get(PRICE_CACHE_ENV):
+        with _price_store_lock:
+            if _price_store is None:
+                _price_store = PriceStore(os.environ[PRICE_CACHE_ENV])
+    return _price_store
+
+
+def enable_price_store(root: Optional[str] = None) -> PriceStore:
+    global _price_store
+    root = root or os.environ.get(PRICE_CACHE_ENV) or DEFAULT_PRICE_CACHE_DIR
+    with _price_store_lock:
+        if _price_store is None or _price_store.root != root:
+            _price_store = PriceStore(root)
+    return _price_store
+
+
+def disable_price_store() -> None:
+    global _price_store
+    with _price_store_lock:
+        _price_store = None
@@ -0,0 +1,69 @@
+"""
+Short-lived cache for last-trade quotes.
+
+The realtime price updater and the live trading cycle both need spot prices
+for overlapping symbols within minutes of each other. Quotes younger than
+``ttl`` seconds are served from memory and only the missing or expired
+symbols are requested, all in one batched call.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_QUOTE_TTL = 60
+
+FetchQuotes = Callable[[List[str]], Dict[str, float]]
+
+
+class QuoteCache:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_QUOTE_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._quotes: Dict[str, Tuple[float, float]] = {}
+        # one batch in flight at a time, so concurrent callers share it
+        self._fetch_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def _fresh(self, symbols: List[str], now: float) -> Dict[str, float]:
+        with self._lock:
+            return {
+                symbol: quote[0]
+                for symbol in symbols
+                if (quote := self._quotes.get(symbol)) is not None
+                and now - quote[1] < self.ttl
+            }
+
+    def get_many(self, symbols: Iterable[str], fetch: FetchQuotes) -> Dict[str, float]:
+        """Prices for ``symbols``; ``fetch`` gets the stale ones in one call.
+
+        Symbols ``fetch`` has no price for are left out of the result.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        quotes = self._fresh(symbols, self._clock())
+        if len(quotes) == len(symbols):
+            return quotes
+
+        with self._fetch_lock:
+            # another caller may have fetched them while we waited
+            now = self._clock()
+            quotes = self._fresh(symbols, now)
+            missing = [symbol for symbol in symbols if symbol not in quotes]
+            if not missing:
+                return quotes
+            fetched = fetch(missing)
+            with self._lock:
+                for symbol, price in fetched.items():
+                    self._quotes[symbol] = (price, now)
+        quotes.update({s: fetched[s] for s in missing if s in fetched})
+        return quotes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
@@ -1,9 +1,21 @@
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
 from live_trade_bench.fetchers.base_fetcher import BaseFetcher
+from live_trade_bench.fetchers.price_store import get_price_store
+from live_trade_bench.fetchers.quote_cache import QuoteCache
+
+# yf.download keeps its results in module-level state, so concurrent calls from
+# worker threads can overwrite each other's frames.
+_YF_DOWNLOAD_LOCK = threading.Lock()
+
+# last prices shared by the realtime price updater and the live trading cycle
+_quote_cache = QuoteCache()
 
 
 class StockFetcher(BaseFetcher):
@@ -50,59 +62,208 @@ class StockFetcher(BaseFetcher):
     def get_price_with_history(
         self, ticker: str, date: Optional[str] = None
     ) -> Dict[str, Any]:
+        return self.get_prices_with_history([ticker], date=date)[ticker]
+
+    def get_prices_with_history(
+        self, tickers: List[str], date: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Price history and current price for many tickers from one download.
+
+        In backtests the history covers the 10 days before ``date`` and the
+        current price is the first close on or after ``date`` (within a day,
+        same as ``_get_price_on_date``). Live, the history runs up to today and
+        the current price is the latest quote, falling back to the last close.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
         if date:
-            end_date = datetime.strptime(date, "%Y-%m-%d") - timedelta(days=1)
+            target = pd.Timestamp(date)
+            start_date = target - timedelta(days=11)
+            end_date = target + timedelta(days=1)
         else:
-            end_date = datetime.now(timezone.utc)
-
-        start_date = end_date - timedelta(days=10)
+            target = None
+            end_date = pd.Timestamp(datetime.now(timezone.utc).date())
+            start_date = end_date - timedelta(days=10)
 
-        price_data = self._download_price_data(
-            ticker,
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d"),
-            interval="1d",
+        closes, volumes = self._load_daily_bars(
+            tickers, start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
         )
+        quotes = self.get_current_prices(tickers) if target is None else {}
 
-        price_history = []
-        if price_data is not None and not price_data.empty:
-            for idx, row in price_data.iterrows():
-                price_history.append(
-                    {
-                        "date": idx.strftime("%Y-%m-%d"),
-                        "price": float(row["Close"]) if "Close" in row else 0.0,
-                        "volume": int(row["Volume"]) if "Volume" in row else 0,
-                    }
-                )
+        results: Dict[str, Dict[str, Any]] = {}
+        for ticker in tickers:
+            close = closes[ticker].dropna() if ticker in closes else pd.Series(dtype=float)
+            volume = (
+                volumes[ticker].reindex(close.index).fillna(0)
+                if ticker in volumes
+                else pd.Series(0, index=close.index)
+            )
+            if target is not None:
+                history_mask = close.index < target
+                after = close[~history_mask]
+                current_price = float(after.iloc[0]) if not after.empty else None
+            else:
+                history_mask = slice(None)
+                current_price = quotes.get(ticker)
+                if current_price is None and not close.empty:
+                    current_price = float(close.iloc[-1])
 
-        return {
-            "current_price": self.get_price(ticker, date),
-            "price_history": price_history,
-            "ticker": ticker,
+            hist_close = close[history_mask]
+            hist_volume = volume[history_mask]
+            results[ticker] = {
+                "current_price": current_price,
+                "price_history": [
+                    {"date": d, "price": float(p), "volume": int(v)}
+                    for d, p, v in zip(
+                        hist_close.index.strftime("%Y-%m-%d"),
+                        hist_close.to_numpy(),
+                        hist_volume.to_numpy(),
+                    )
+                ],
+                "ticker": ticker,
+            }
+        return results
+
+    def _load_daily_bars(
+        self, tickers: List[str], start_date: str, end_date: str
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Daily Close/Volume frames, read through the price store when enabled."""
+        store = get_price_store()
+        if store is None:
+            df = self._download_price_data(tickers, start_date, end_date, interval="1d")
+            return self._split_by_ticker(df, tickers)
+
+        gaps = {
+            ticker: store.missing_ranges("yfinance", ticker, start_date, end_date)
+            for ticker in tickers
         }
+        stale = [ticker for ticker in tickers if gaps[ticker]]
+        if stale:
+            fetch_start = min(gap[0] for ticker in stale for gap in gaps[ticker])
+            fetch_end = max(gap[1] for ticker in stale for gap in gaps[ticker])
+            df = self._download_price_data(
+                stale, str(fetch_start), str(fetch_end), interval="1d"
+            )
+            closes, volumes = self._split_by_ticker(df, stale)
+            for ticker in stale:
+                if ticker not in closes:
+                    continue
+                close = closes[ticker].dropna()
+                volume = (
+                    volumes[ticker].reindex(close.index).fillna(0)
+                    if ticker in volumes
+                    else pd.Series(0, index=close.index)
+                )
+                store.write(
+                    "yfinance",
+                    ticker,
+                    close.index,
+                    {"close": close.to_numpy(), "volume": volume.to_numpy()},
+                    covered=(fetch_start, fetch_end),
+                )
+
+        close_cols, volume_cols = {}, {}
+        for ticker in tickers:
+            bars = store.read("yfinance", ticker, start_date, end_date)
+            index = pd.DatetimeIndex(bars["date"])
+            close_cols[ticker] = pd.Series(bars.get("close", np.empty(0)), index=index)
+            volume_cols[ticker] = pd.Series(bars.get("volume", np.empty(0)), index=index)
+        return pd.DataFrame(close_cols), pd.DataFrame(volume_cols)
+
+    @staticmethod
+    def _split_by_ticker(
+        df: Any, tickers: List[str]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Close and Volume frames with one column per ticker."""
+        if df is None or df.empty:
+            return pd.DataFrame(), pd.DataFrame()
+        if isinstance(df.columns, pd.MultiIndex):
+            # yfinance groups by field first: ("Close", "AAPL"), ...
+            closes = df["Close"] if "Close" in df.columns.get_level_values(0) else None
+            volumes = (
+                df["Volume"] if "Volume" in df.columns.get_level_values(0) else None
+            )
+        else:
+            # older yfinance returns a flat frame for a single ticker
+            ticker = tickers[0]
+            closes = df[["Close"]].set_axis([ticker], axis=1) if "Close" in df else None
+            volumes = (
+                df[["Volume"]].set_axis([ticker], axis=1) if "Volume" in df else None
+            )
+        if closes is None:
+            return pd.DataFrame(), pd.DataFrame()
+        return closes, volumes if volumes is not None else pd.DataFrame()
 
     def _download_price_data(
-        self, ticker: str, start_date: str, end_date: str, interval: str
+        self,
+        ticker: Union[str, List[str]],
+        start_date: str,
+        end_date: str,
+        interval: str,
     ) -> Any:
         # NOTE: it actually does not include the end_date, so we need to add 1 day
         # yfinance is [start_date, end_date)
-        df = yf.download(
-            tickers=ticker,
-            start=start_date,
-            end=(datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).strftime(
-                "%Y-%m-%d"
-            ),
-            interval=interval,
-            progress=False,
-            auto_adjust=True,
-            prepost=True,
-            threads=True,
-        )
+        with _YF_DOWNLOAD_LOCK:
+            df = yf.download(
+                tickers=ticker,
+                start=start_date,
+                end=(
+                    datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+                ).strftime("%Y-%m-%d"),
+                interval=interval,
+                progress=False,
+                auto_adjust=True,
+                prepost=True,
+                threads=True,
+            )
         if df.empty:
-            print(f"No data for {ticker} from {start_date} to {end_date}.")
+            label = ticker if isinstance(ticker, str) else ", ".join(ticker)
+            print(f"No data for {label} from {start_date} to {end_date}.")
         return df
 
     def get_current_price(self, ticker: str) -> Optional[float]:
+        return self.get_current_prices([ticker]).get(ticker)
+
+    def get_current_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Last prices for many tickers, served from the shared quote cache.
+
+        Tickers without a usable price are left out.
+        """
+        return _quote_cache.get_many(tickers, self._fetch_quotes)
+
+    def _fetch_quotes(self, tickers: List[str]) -> Dict[str, float]:
+        """One intraday download for all tickers; ``fast_info`` for the gaps."""
+        try:
+            with _YF_DOWNLOAD_LOCK:
+                df = yf.download(
+                    tickers=tickers,
+                    period="1d",
+                    interval="1m",
+                    progress=False,
+                    auto_adjust=True,
+                    prepost=True,
+                    threads=True,
+                )
+            closes, _ = self._split_by_ticker(df, tickers)
+        except Exception as e:
+            print(f"Batched quote download failed: {e}")
+            closes = pd.DataFrame()
+
+        quotes: Dict[str, float] = {}
+        if not closes.empty:
+            last = closes.ffill().iloc[-1]
+            valid = last[last > 0]
+            quotes = dict(zip(valid.index, valid.to_numpy(dtype=float).tolist()))
+        for ticker in tickers:
+            if ticker not in quotes:
+                price = self._get_fast_info_price(ticker)
+                if price is not None:
+                    quotes[ticker] = price
+        return quotes
+
+    def _get_fast_info_price(self, ticker: str) -> Optional[float]:
         stock = yf.Ticker(ticker)
         try:
             fast_info = stock.fast_info
@@ -137,7 +298,21 @@ def fetch_trending_stocks(limit: int = 15) -> List[str]:
     return StockFetcher().get_trending_stocks(limit=limit)
 
 
+def fetch_current_stock_price(ticker: str) -> Optional[float]:
+    return StockFetcher().get_current_price(ticker)
+
+
+def fetch_current_stock_prices(tickers: List[str]) -> Dict[str, float]:
+    return StockFetcher().get_current_prices(tickers)
+
+
 def fetch_stock_price_with_history(
     ticker: str, date: Optional[str] = None
 ) -> Dict[str, Any]:
     return StockFetcher().get_price_with_history(ticker, date=date)
+
+
+def fetch_stock_prices_with_history(
+    tickers: List[str], date: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    return StockFetcher().get_prices_with_history(tickers, date=date)
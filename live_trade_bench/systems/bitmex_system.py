@@ -7,12 +7,28 @@ from __future__ import annotations
 import logging
 import traceback
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any, Dict, List
 
-from ..accounts import BitMEXAccount, create_bitmex_account
+from ..accounts import (
+    BitMEXAccount,
+    MarketSnapshot,
+    PortfolioEngine,
+    apply_allocations,
+    create_bitmex_account,
+)
 from ..agents.bitmex_agent import LLMBitMEXAgent
+from ..fetchers.async_fetcher import (
+    DEFAULT_FETCH_CONCURRENCY,
+    AsyncBitMEXFetcher,
+    gather_bounded,
+    run_coroutine_sync,
+)
 from ..fetchers.bitmex_fetcher import BitMEXFetcher
+from ..fetchers.market_data_cache import get_market_data_cache
 from ..fetchers.news_fetcher import fetch_news_data
+from ..utils.agent_utils import run_agents_concurrently
+from ..utils.market_calendar import get_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +54,11 @@ class BitMEXPortfolioSystem:
         self.contract_info: Dict[str, Dict[str, Any]] = {}
         self.cycle_count = 0
         self.universe_size = universe_size
+        self.fetch_concurrency = DEFAULT_FETCH_CONCURRENCY
+        self.market_snapshot: MarketSnapshot | None = None
+        self.engine = PortfolioEngine()
         self.fetcher = BitMEXFetcher()
+        self.calendar = get_calendar("bitmex")
 
     def initialize_for_live(self) -> None:
         """Initialize for live trading by fetching trending contracts."""
@@ -67,6 +87,8 @@ class BitMEXPortfolioSystem:
         """
         self.universe = symbols
         self.contract_info = {symbol: {"name": symbol} for symbol in symbols}
+        # symbols that left the universe and are no longer held
+        self.engine.compact()
 
     def add_agent(
         self, name: str, initial_cash: float = 10000.0, model_name: str = "gpt-4o-mini"
@@ -82,7 +104,7 @@ class BitMEXPortfolioSystem:
         if name in self.agents:
             return
         agent = LLMBitMEXAgent(name, model_name)
-        account = create_bitmex_account(initial_cash)
+        account = create_bitmex_account(initial_cash, engine=self.engine)
         self.agents[name] = agent
         self.accounts[name] = account
 
@@ -98,6 +120,9 @@ class BitMEXPortfolioSystem:
         logger.info(f"Cycle {self.cycle_count + 1} started for BitMEX System")
         if for_date:
             logger.info(f"Backtest mode - Date: {for_date}")
+            if not self.calendar.is_session(for_date):
+                logger.info(f"{for_date} is not a {self.calendar.name} session")
+                return
             current_time_str = for_date
         else:
             logger.info("Live Trading Mode (UTC)")
@@ -138,32 +163,90 @@ class BitMEXPortfolioSystem:
             Dictionary mapping symbol to market data
         """
         logger.info("Fetching BitMEX market data...")
-        market_data = {}
+        symbols = list(self.universe)
+        if for_date is None:
+            # live data is shared with the backend jobs for a few minutes
+            contracts = get_market_data_cache().get_many(
+                "bitmex", symbols, self._fetch_contracts
+            )
+        else:
+            contracts = self._fetch_contracts(symbols, for_date)
+        market_data = {
+            symbol: contracts[symbol] for symbol in symbols if symbol in contracts
+        }
 
-        for symbol in self.universe:
-            try:
-                # Get price with history (pass for_date for backtesting)
-                price_data = self.fetcher.get_price_with_history(
-                    symbol, lookback_days=10, price_type="mark", date=for_date
+        # One price vector for the cycle, shared by every account
+        self.market_snapshot = MarketSnapshot.from_market_data(market_data)
+        self.engine.mark_to_market(self.market_snapshot)
+
+        logger.info(f"Market data fetched for {len(market_data)} contracts")
+        for symbol, data in list(market_data.items())[:3]:
+            funding = (data.get("funding_rate") or 0) * 100
+            logger.info(f"{symbol}: ${data['current_price']:,.2f} (funding: {funding:.4f}%)")
+
+        return market_data
+
+    def _fetch_contracts(
+        self, symbols: List[str], for_date: str | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        return run_coroutine_sync(self._fetch_contracts_async(symbols, for_date))
+
+    async def _fetch_contracts_async(
+        self, symbols: List[str], for_date: str | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch price, funding and order book for every contract concurrently.
+
+        The three requests per symbol are independent, so they are issued
+        together and the per-host token bucket decides the actual pace.
+        """
+        fetcher = AsyncBitMEXFetcher(self.fetcher)
+        factories = []
+        for symbol in symbols:
+            factories.extend(
+                [
+                    partial(
+                        fetcher.get_price_with_history,
+                        symbol,
+                        lookback_days=10,
+                        price_type="mark",
+                        date=for_date,
+                    ),
+                    partial(fetcher.get_funding_rate, symbol),
+                    partial(fetcher.get_orderbook, symbol, depth=10),
+                ]
+            )
+        results = await gather_bounded(factories, self.fetch_concurrency)
+
+        market_data = {}
+        for i, symbol in enumerate(symbols):
+            price_data, funding_data, orderbook = results[3 * i : 3 * i + 3]
+            if isinstance(price_data, BaseException):
+                logger.error(f"Failed to fetch data for {symbol}: {price_data}")
+                logger.debug(
+                    f"Full traceback for {symbol}:\n"
+                    + "".join(
+                        traceback.format_exception(
+                            type(price_data), price_data, price_data.__traceback__
+                        )
+                    )
                 )
+                continue
 
-                # Get funding rate
-                try:
-                    funding_data = self.fetcher.get_funding_rate(symbol)
-                    funding_rate = funding_data.get("funding_rate") or 0.0
-                except Exception:
+            try:
+                if isinstance(funding_data, BaseException):
                     funding_rate = 0.0
+                else:
+                    funding_rate = funding_data.get("funding_rate") or 0.0
 
-                # Get order book depth
-                try:
-                    orderbook = self.fetcher.get_orderbook(symbol, depth=10)
+                if isinstance(orderbook, BaseException):
+                    bid_depth = 0
+                    ask_depth = 0
+                else:
                     bids = orderbook.get("bids", [])
                     asks = orderbook.get("asks", [])
                     bid_depth = sum(b["size"] * b["price"] for b in bids[:10]) if bids else 0
                     ask_depth = sum(a["size"] * a["price"] for a in asks[:10]) if asks else 0
-                except Exception:
-                    bid_depth = 0
-                    ask_depth = 0
 
                 current_price = price_data.get("current_price")
                 price_history = price_data.get("price_history", [])
@@ -182,19 +265,10 @@ class BitMEXPortfolioSystem:
                         "url": url,
                     }
 
-                    # Update position prices in all accounts
-                    for account in self.accounts.values():
-                        account.update_position_price(symbol, current_price)
-
             except Exception as e:
-                logger.error(f"Failed to fetch data for {symbol}: {e}")
+                logger.error(f"Failed to process data for {symbol}: {e}")
                 logger.debug(f"Full traceback for {symbol}:\n{traceback.format_exc()}")
 
-        logger.info(f"Market data fetched for {len(market_data)} contracts")
-        for symbol, data in list(market_data.items())[:3]:
-            funding = (data.get("funding_rate") or 0) * 100
-            logger.info(f"{symbol}: ${data['current_price']:,.2f} (funding: {funding:.4f}%)")
-
         return market_data
 
     def _fetch_news_data(
@@ -347,17 +421,21 @@ class BitMEXPortfolioSystem:
             Dictionary mapping agent name to allocation
         """
         logger.info("Generating allocations for all agents...")
-        all_allocations = {}
 
-        for agent_name, agent in self.agents.items():
+        def generate(agent_name: str) -> Dict[str, float] | None:
             logger.info(f"Processing agent: {agent_name}")
-            account = self.accounts[agent_name]
-            account_data = account.get_account_data()
-
-            allocation = agent.generate_allocation(
+            account_data = self.accounts[agent_name].get_account_data()
+            return self.agents[agent_name].generate_allocation(
                 market_data, account_data, for_date, news_data=news_data
             )
 
+        # Agents run in parallel; results are still applied in agent order
+        results = run_agents_concurrently(self.agents, generate)
+        all_allocations = {}
+
+        for agent_name, allocation in results.items():
+            account = self.accounts[agent_name]
+
             if allocation:
                 all_allocations[agent_name] = allocation
                 logger.info(
@@ -373,6 +451,13 @@ class BitMEXPortfolioSystem:
         logger.info("All allocations generated")
         return all_allocations
 
+    def _snapshot_for(self, market_data: Dict[str, Any]) -> MarketSnapshot:
+        """Reuse the cycle's snapshot unless ``market_data`` covers other symbols."""
+        snapshot = self.market_snapshot
+        if snapshot is None or set(snapshot) != set(market_data):
+            snapshot = MarketSnapshot.from_market_data(market_data)
+        return snapshot
+
     def _update_accounts(
         self,
         allocations: Dict[str, Dict[str, float]],
@@ -388,17 +473,25 @@ class BitMEXPortfolioSystem:
             for_date: Optional date string
         """
         logger.info("Updating all accounts...")
-        price_map = {s: d.get("current_price") for s, d in market_data.items()}
-
-        for agent_name, allocation in allocations.items():
-            account = self.accounts[agent_name]
+        price_map = self._snapshot_for(market_data)
+        accounts = [self.accounts[agent_name] for agent_name in allocations]
+        for account, allocation in zip(accounts, allocations.values()):
             account.target_allocations = allocation
 
-            try:
-                account.apply_allocation(
-                    allocation, price_map=price_map, metadata_map=market_data
-                )
+        try:
+            # every account is a row of self.engine: one rebalance per cycle
+            apply_allocations(
+                accounts,
+                list(allocations.values()),
+                price_map=price_map,
+                metadata_map=market_data,
+            )
+        except Exception as e:
+            logger.error(f"Failed to rebalance accounts: {e}")
+            return
 
+        for agent_name, account in zip(allocations, accounts):
+            try:
                 # Capture LLM input/output for audit trail
                 llm_input = None
                 llm_output = None
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any, Dict, List
 
-from ..accounts import PolymarketAccount, create_polymarket_account
+from ..accounts import (
+    MarketSnapshot,
+    PolymarketAccount,
+    PortfolioEngine,
+    apply_allocations,
+    create_polymarket_account,
+)
 from ..agents.polymarket_agent import LLMPolyMarketAgent
-from ..fetchers.news_fetcher import fetch_news_data
-from ..fetchers.polymarket_fetcher import (
-    fetch_market_price_with_history,
-    fetch_verified_markets,
+from ..fetchers.async_fetcher import (
+    DEFAULT_FETCH_CONCURRENCY,
+    AsyncPolymarketFetcher,
+    gather_bounded,
+    run_coroutine_sync,
+)
+from ..fetchers.backtest_data import (
+    BacktestData,
+    load_news,
+    load_polymarket_prices,
 )
+from ..fetchers.market_catalog import get_market_catalog
+from ..fetchers.market_data_cache import get_market_data_cache
+from ..fetchers.news_fetcher import fetch_news_data
+from ..fetchers.polymarket_fetcher import fetch_verified_markets
+from ..utils.agent_utils import run_agents_concurrently
+from ..utils.market_calendar import get_calendar
 
 
 class PolymarketPortfolioSystem:
@@ -20,7 +39,12 @@ class PolymarketPortfolioSystem:
         self.market_info: Dict[str, Dict[str, Any]] = {}
         self.cycle_count = 0
         self.universe_size = universe_size
+        self.fetch_concurrency = DEFAULT_FETCH_CONCURRENCY
         self.market_data: Dict[str, Dict[str, Any]] = {}
+        self.market_snapshot: MarketSnapshot | None = None
+        self.engine = PortfolioEngine()
+        self.backtest_data: BacktestData | None = None
+        self.calendar = get_calendar("polymarket")
         self.initialize_for_live()
 
     def initialize_from_init_data(self):
@@ -134,72 +158,19 @@ class PolymarketPortfolioSystem:
             print(f"Failed to load markets from init data: {e}")
 
     def _get_market_by_event_slug(self, event_slug, url):
-        """Get market data by event slug from Polymarket API"""
+        """Look up market data by event slug in the shared market catalog"""
         try:
-            from ..fetchers.polymarket_fetcher import PolymarketFetcher
-
-            fetcher = PolymarketFetcher()
-            # Search for active markets with much larger limit
-            params = {
-                "limit": 500,  # Much larger limit to find our markets
-                "active": "true",
-                "closed": "false",
-            }
-            markets = fetcher._fetch_markets(params)
-
-            print(f"    API returned {len(markets)} markets")
-            if len(markets) > 0:
-                print(
-                    f"    First market example: {markets[0].keys() if markets[0] else 'Empty'}"
-                )
-
-            found_event_slugs = []
-            for market in markets:
-                if not isinstance(market, dict) or not market.get("id"):
-                    continue
-
-                # Check if this market matches our event slug
-                if market.get("events") and len(market["events"]) > 0:
-                    market_event_slug = market["events"][0].get("slug")
-                    found_event_slugs.append(market_event_slug)
-
-                    if market_event_slug == event_slug:
-                        print(f"    🎯 Found matching event slug: {market_event_slug}")
-                        # Parse token_ids and outcomes
-                        raw_token_ids = market.get("clobTokenIds", [])
-                        raw_outcomes = market.get("outcomes", [])
-
-                        if isinstance(raw_token_ids, str):
-                            import json
-
-                            token_ids = json.loads(raw_token_ids)
-                            outcomes = json.loads(raw_outcomes)
-                        else:
-                            token_ids = raw_token_ids
-                            outcomes = raw_outcomes
-
-                        if token_ids:  # Only return if we have real token IDs
-                            return {
-                                "id": market.get("id"),
-                                "question": market.get("question"),
-                                "category": market.get("category"),
-                                "token_ids": token_ids,
-                                "outcomes": outcomes,
-                                "event_slug": event_slug,
-                                "url": url,
-                            }
-                        else:
-                            print("    ⚠️ Found market but no token_ids")
-
-            print(
-                f"    Available event slugs: {found_event_slugs[:5]}..."
-            )  # Show first 5
-            print(f"    Looking for: {event_slug}")
-
+            market = get_market_catalog().by_event_slug(event_slug)
         except Exception as e:
             print(f"Failed to get market data for {event_slug}: {e}")
+            return None
 
-        return None
+        if market is None:
+            print(f"    Looking for: {event_slug} (not in market catalog)")
+            return None
+        print(f"    🎯 Found matching event slug: {event_slug}")
+        market["url"] = url
+        return market
 
     def initialize_for_live(self):
         # markets = fetch_trending_markets(limit=self.universe_size)
@@ -218,9 +189,28 @@ class PolymarketPortfolioSystem:
         verified_markets = fetch_verified_markets(trading_days, self.universe_size)
         self.set_universe(verified_markets)
 
+    def prefetch_backtest_data(
+        self, start_date: str, end_date: str, include_news: bool = True
+    ) -> None:
+        """Load the universe's prices (and news) for the whole backtest period."""
+        print(f"  - Prefetching backtest data for {len(self.universe)} markets...")
+        token_ids = [token_id for _, _, token_id in self._tokens()]
+        prices = load_polymarket_prices(
+            token_ids, start_date, end_date, self.fetch_concurrency
+        )
+        news = None
+        if include_news:
+            queries = [self.market_info[m]["question"] for m in self.universe]
+            news = load_news(
+                queries, start_date, end_date, concurrency=self.fetch_concurrency
+            )
+        self.backtest_data = BacktestData(start_date, end_date, prices, news)
+
     def set_universe(self, markets: List[Dict[str, Any]]):
         self.universe = []
         self.market_info = {}
+        # symbols that left the universe and are no longer held
+        self.engine.compact()
         for m in markets:
             market_id = m["id"]
             self.universe.append(market_id)
@@ -238,7 +228,7 @@ class PolymarketPortfolioSystem:
         if name in self.agents:
             return
         agent = LLMPolyMarketAgent(name, model_name)
-        account = create_polymarket_account(initial_cash)
+        account = create_polymarket_account(initial_cash, engine=self.engine)
         self.agents[name] = agent
         self.accounts[name] = account
 
@@ -246,6 +236,9 @@ class PolymarketPortfolioSystem:
         print(f"\n--- 🔄 Cycle {self.cycle_count + 1} for Polymarket System ---")
         if for_date:
             print(f"--- 📅 Backtest Date: {for_date} ---")
+            if not self.calendar.is_session(for_date):
+                print(f"--- 💤 {for_date} is not a {self.calendar.name} session ---")
+                return
             current_time_str = for_date
         else:
             print("--- 🚀 Live Trading Mode ---")
@@ -271,38 +264,83 @@ class PolymarketPortfolioSystem:
         self, for_date: str | None = None
     ) -> Dict[str, Dict[str, Any]]:
         print("  - Fetching market data...")
+        tokens = self._tokens()
+        token_ids = [token_id for _, _, token_id in tokens]
+        if for_date is None:
+            # live data is shared with the backend jobs for a few minutes
+            prices = get_market_data_cache().get_many(
+                "polymarket", token_ids, self._fetch_token_prices
+            )
+        else:
+            prices = None
+            if self.backtest_data is not None:
+                prices = self.backtest_data.prices_for_day(token_ids, for_date)
+            if prices is None:
+                prices = self._fetch_token_prices(token_ids, for_date)
+
         market_data_expanded = {}
-        for market_id in self.universe:
-            try:
-                market_info = self.market_info[market_id]
-                token_ids = market_info.get("token_ids")
-                outcomes = market_info.get("outcomes")
-                if not token_ids or len(token_ids) < 2:
-                    continue
-                question = market_info["question"]
-                url = market_info.get("url")
-                for outcome, token_id in zip(outcomes, token_ids):
-                    if not token_id:
-                        continue
-                    price_data = fetch_market_price_with_history(token_id, for_date)
-                    current_price = price_data.get("current_price")
-                    if current_price is not None:
-                        key = f"{question}_{outcome}"
-                        market_data_expanded[key] = {
-                            "price": current_price,
-                            "outcome": outcome,
-                            "id": f"{market_id}_{outcome}",
-                            "question": question,
-                            "url": url,
-                            "price_history": price_data.get("price_history", []),
-                        }
-            except Exception as e:
-                question = self.market_info[market_id].get("question", market_id)
-                print(f"    - Failed to fetch data for '{question[:40]}...': {e}")
+        for market_id, outcome, token_id in tokens:
+            price_data = prices.get(token_id)
+            if price_data is None:
+                continue
+            market_info = self.market_info[market_id]
+            question = market_info["question"]
+            current_price = price_data.get("current_price")
+            if current_price is not None:
+                key = f"{question}_{outcome}"
+                market_data_expanded[key] = {
+                    "price": current_price,
+                    "outcome": outcome,
+                    "id": f"{market_id}_{outcome}",
+                    "question": question,
+                    "url": market_info.get("url"),
+                    "price_history": price_data.get("price_history", []),
+                }
         print(f"  - ✅ Market data fetched for {len(market_data_expanded)} markets")
         self.market_data = market_data_expanded
+        self.market_snapshot = MarketSnapshot.from_market_data(
+            market_data_expanded, price_key="price"
+        )
         return self.market_data
 
+    def _tokens(self) -> List[tuple[str, str, str]]:
+        """``(market_id, outcome, token_id)`` for every tradable outcome."""
+        tokens = []
+        for market_id in list(self.universe):
+            market_info = self.market_info[market_id]
+            token_ids = market_info.get("token_ids")
+            outcomes = market_info.get("outcomes")
+            if not token_ids or len(token_ids) < 2:
+                continue
+            for outcome, token_id in zip(outcomes, token_ids):
+                if token_id:
+                    tokens.append((market_id, outcome, token_id))
+        return tokens
+
+    def _fetch_token_prices(
+        self, token_ids: List[str], for_date: str | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        return run_coroutine_sync(self._fetch_token_prices_async(token_ids, for_date))
+
+    async def _fetch_token_prices_async(
+        self, token_ids: List[str], for_date: str | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        fetcher = AsyncPolymarketFetcher()
+        results = await gather_bounded(
+            [
+                partial(fetcher.get_price_with_history, token_id, for_date)
+                for token_id in token_ids
+            ],
+            self.fetch_concurrency,
+        )
+        prices = {}
+        for token_id, price_data in zip(token_ids, results):
+            if isinstance(price_data, BaseException):
+                print(f"    - Failed to fetch data for token {token_id}: {price_data}")
+                continue
+            prices[token_id] = price_data
+        return prices
+
     def _fetch_social_data(self) -> Dict[str, List[Dict[str, Any]]]:
         print("  - Fetching social media data...")
         from ..fetchers.reddit_fetcher import RedditFetcher
@@ -355,6 +393,13 @@ class PolymarketPortfolioSystem:
             end_date = ref.strftime("%Y-%m-%d")
             for market_id in list(market_data.keys()):
                 question = market_data[market_id]["question"]
+                if for_date and self.backtest_data is not None:
+                    news = self.backtest_data.news_for_day(
+                        question, for_date, tag=question
+                    )
+                    if news is not None:
+                        news_data_map[market_id] = news
+                        continue
                 news_data_map[market_id] = fetch_news_data(
                     question,
                     start_date,
@@ -375,14 +420,18 @@ class PolymarketPortfolioSystem:
         for_date: str | None,
     ) -> Dict[str, Dict[str, float]]:
         print("  - Generating allocations for all agents...")
-        all_allocations = {}
-        for agent_name, agent in self.agents.items():
+
+        def generate(agent_name: str) -> Dict[str, Any] | None:
             print(f"    - Processing agent: {agent_name}...")
-            account = self.accounts[agent_name]
-            account_data = account.get_account_data()
-            raw_allocation = agent.generate_allocation(
+            account_data = self.accounts[agent_name].get_account_data()
+            return self.agents[agent_name].generate_allocation(
                 market_data, account_data, for_date, news_data=news_data
             )
+
+        results = run_agents_concurrently(self.agents, generate)
+        all_allocations = {}
+        for agent_name, raw_allocation in results.items():
+            account = self.accounts[agent_name]
             if raw_allocation:
                 cleaned_allocation = {}
                 for symbol, value in raw_allocation.items():
@@ -405,6 +454,12 @@ class PolymarketPortfolioSystem:
         print("  - ✅ All allocations generated")
         return all_allocations
 
+    def _snapshot_for(self, market_data: Dict[str, Any]) -> MarketSnapshot:
+        snapshot = self.market_snapshot
+        if snapshot is None or set(snapshot) != set(market_data):
+            snapshot = MarketSnapshot.from_market_data(market_data, price_key="price")
+        return snapshot
+
     def _update_accounts(
         self,
         allocations: Dict[str, Dict[str, float]],
@@ -412,14 +467,23 @@ class PolymarketPortfolioSystem:
         for_date: str | None = None,
     ) -> None:
         print("  - Updating all accounts...")
-        price_map = {key: asset["price"] for key, asset in market_data.items()}
-        for agent_name, allocation in allocations.items():
-            account = self.accounts[agent_name]
+        price_map = self._snapshot_for(market_data)
+        accounts = [self.accounts[agent_name] for agent_name in allocations]
+        for account, allocation in zip(accounts, allocations.values()):
             account.target_allocations = allocation
+        try:
+            # every account is a row of self.engine: one rebalance per cycle
+            apply_allocations(
+                accounts,
+                list(allocations.values()),
+                price_map=price_map,
+                metadata_map=market_data,
+            )
+        except Exception as e:
+            print(f"    - ❌ Failed to rebalance accounts: {e}")
+            return
+        for agent_name, account in zip(allocations, accounts):
             try:
-                account.apply_allocation(
-                    allocation, price_map=price_map, metadata_map=market_data
-                )
                 llm_input = None
                 llm_output = None
                 agent = self.agents.get(agent_name)
@@ -5,13 +5,23 @@ from typing import Any, Dict, List
 
 from live_trade_bench.fetchers.constants import TICKER_TO_COMPANY
 
-from ..accounts import StockAccount, create_stock_account
+from ..accounts import (
+    MarketSnapshot,
+    PortfolioEngine,
+    StockAccount,
+    apply_allocations,
+    create_stock_account,
+)
 from ..agents.stock_agent import LLMStockAgent
+from ..fetchers.backtest_data import BacktestData, load_news, load_stock_prices
+from ..fetchers.market_data_cache import get_market_data_cache
 from ..fetchers.news_fetcher import fetch_news_data
 from ..fetchers.stock_fetcher import (
-    fetch_stock_price_with_history,
+    fetch_stock_prices_with_history,
     fetch_trending_stocks,
 )
+from ..utils.agent_utils import run_agents_concurrently
+from ..utils.market_calendar import get_calendar
 
 
 class StockPortfolioSystem:
@@ -22,6 +32,10 @@ class StockPortfolioSystem:
         self.stock_info: Dict[str, Dict[str, Any]] = {}
         self.cycle_count = 0
         self.universe_size = universe_size
+        self.market_snapshot: MarketSnapshot | None = None
+        self.engine = PortfolioEngine()
+        self.backtest_data: BacktestData | None = None
+        self.calendar = get_calendar("stock")
 
     def initialize_for_live(self):
         tickers = fetch_trending_stocks(limit=self.universe_size)
@@ -31,9 +45,25 @@ class StockPortfolioSystem:
         tickers = fetch_trending_stocks(limit=self.universe_size)
         self.set_universe(tickers)
 
+    def prefetch_backtest_data(
+        self, start_date: str, end_date: str, include_news: bool = True
+    ) -> None:
+        """Load the universe's prices (and news) for the whole backtest period."""
+        print(f"  - Prefetching backtest data for {len(self.universe)} stocks...")
+        prices = load_stock_prices(self.universe, start_date, end_date)
+        news = None
+        if include_news:
+            queries = [
+                self._news_query(t) for t in self.universe if t in TICKER_TO_COMPANY
+            ]
+            news = load_news(queries, start_date, end_date)
+        self.backtest_data = BacktestData(start_date, end_date, prices, news)
+
     def set_universe(self, tickers: List[str]):
         self.universe = tickers
         self.stock_info = {ticker: {"name": ticker} for ticker in tickers}
+        # symbols that left the universe and are no longer held
+        self.engine.compact()
 
     def add_agent(
         self, name: str, initial_cash: float = 10000.0, model_name: str = "gpt-4o-mini"
@@ -41,7 +71,7 @@ class StockPortfolioSystem:
         if name in self.agents:
             return
         agent = LLMStockAgent(name, model_name)
-        account = create_stock_account(initial_cash)
+        account = create_stock_account(initial_cash, engine=self.engine)
         self.agents[name] = agent
         self.accounts[name] = account
 
@@ -49,6 +79,9 @@ class StockPortfolioSystem:
         print(f"\n--- 🔄 Cycle {self.cycle_count + 1} for Stock System ---")
         if for_date:
             print(f"--- 📅 Backtest Date: {for_date} ---")
+            if not self.calendar.is_session(for_date):
+                print(f"--- 💤 {for_date} is not a {self.calendar.name} session ---")
+                return
             current_time_str = for_date
         else:
             print("--- 🚀 Live Trading Mode ---")
@@ -78,25 +111,38 @@ class StockPortfolioSystem:
         self, for_date: str | None = None
     ) -> Dict[str, Dict[str, Any]]:
         print("  - Fetching market data...")
+        universe = list(self.universe)
+        try:
+            if for_date is None:
+                # live data is shared with the backend jobs for a few minutes
+                results = get_market_data_cache().get_many(
+                    "stock", universe, fetch_stock_prices_with_history
+                )
+            else:
+                results = None
+                if self.backtest_data is not None:
+                    results = self.backtest_data.prices_for_day(universe, for_date)
+                if results is None:
+                    results = fetch_stock_prices_with_history(universe, date=for_date)
+        except Exception as e:
+            print(f"    - Failed to fetch stock data: {e}")
+            return {}
         market_data = {}
-        for ticker in self.universe:
-            try:
-                price_data = fetch_stock_price_with_history(ticker, for_date)
-                current_price = price_data.get("current_price")
-                price_history = price_data.get("price_history", [])
-                if current_price:
-                    url = f"https://finance.yahoo.com/quote/{ticker}"
-                    market_data[ticker] = {
-                        "ticker": ticker,
-                        "name": self.stock_info[ticker]["name"],
-                        "current_price": current_price,
-                        "price_history": price_history,
-                        "url": url,
-                    }
-                    for account in self.accounts.values():
-                        account.update_position_price(ticker, current_price)
-            except Exception as e:
-                print(f"    - Failed to fetch data for {ticker}: {e}")
+        for ticker in universe:
+            price_data = results.get(ticker, {})
+            current_price = price_data.get("current_price")
+            price_history = price_data.get("price_history", [])
+            if current_price:
+                url = f"https://finance.yahoo.com/quote/{ticker}"
+                market_data[ticker] = {
+                    "ticker": ticker,
+                    "name": self.stock_info[ticker]["name"],
+                    "current_price": current_price,
+                    "price_history": price_history,
+                    "url": url,
+                }
+        self.market_snapshot = MarketSnapshot.from_market_data(market_data)
+        self.engine.mark_to_market(self.market_snapshot)
         print(f"  - ✅ Market data fetched for {len(market_data)} stocks")
         for ticker, data in list(market_data.items())[:3]:
             print(f"    - {ticker}: ${data['current_price']:.2f}")
@@ -158,7 +204,12 @@ class StockPortfolioSystem:
             start_date = (ref - timedelta(days=3)).strftime("%Y-%m-%d")
             end_date = ref.strftime("%Y-%m-%d")
             for ticker in list(market_data.keys()):
-                query = f"{ticker} stock news OR {TICKER_TO_COMPANY[ticker]}"
+                query = self._news_query(ticker)
+                if for_date and self.backtest_data is not None:
+                    news = self.backtest_data.news_for_day(query, for_date, tag=ticker)
+                    if news is not None:
+                        news_data_map[ticker] = news
+                        continue
                 news_data_map[ticker] = fetch_news_data(
                     query,
                     start_date,
@@ -171,6 +222,10 @@ class StockPortfolioSystem:
             print(f"    - News data fetch failed: {e}")
         return news_data_map
 
+    @staticmethod
+    def _news_query(ticker: str) -> str:
+        return f"{ticker} stock news OR {TICKER_TO_COMPANY[ticker]}"
+
     def _generate_allocations(
         self,
         market_data: Dict[str, Any],
@@ -178,14 +233,18 @@ class StockPortfolioSystem:
         for_date: str | None,
     ) -> Dict[str, Dict[str, float]]:
         print("  - Generating allocations for all agents...")
-        all_allocations = {}
-        for agent_name, agent in self.agents.items():
+
+        def generate(agent_name: str) -> Dict[str, float] | None:
             print(f"    - Processing agent: {agent_name}...")
-            account = self.accounts[agent_name]
-            account_data = account.get_account_data()
-            allocation = agent.generate_allocation(
+            account_data = self.accounts[agent_name].get_account_data()
+            return self.agents[agent_name].generate_allocation(
                 market_data, account_data, for_date, news_data=news_data
             )
+
+        results = run_agents_concurrently(self.agents, generate)
+        all_allocations = {}
+        for agent_name, allocation in results.items():
+            account = self.accounts[agent_name]
             if allocation:
                 all_allocations[agent_name] = allocation
                 print(
@@ -199,6 +258,12 @@ class StockPortfolioSystem:
         print("  - ✅ All allocations generated")
         return all_allocations
 
+    def _snapshot_for(self, market_data: Dict[str, Any]) -> MarketSnapshot:
+        snapshot = self.market_snapshot
+        if snapshot is None or set(snapshot) != set(market_data):
+            snapshot = MarketSnapshot.from_market_data(market_data)
+        return snapshot
+
     def _update_accounts(
         self,
         allocations: Dict[str, Dict[str, float]],
@@ -206,14 +271,23 @@ class StockPortfolioSystem:
         for_date: str | None = None,
     ) -> None:
         print("  - Updating all accounts...")
-        price_map = {t: d.get("current_price") for t, d in market_data.items()}
-        for agent_name, allocation in allocations.items():
-            account = self.accounts[agent_name]
+        price_map = self._snapshot_for(market_data)
+        accounts = [self.accounts[agent_name] for agent_name in allocations]
+        for account, allocation in zip(accounts, allocations.values()):
             account.target_allocations = allocation
+        try:
+            # every account is a row of self.engine: one rebalance per cycle
+            apply_allocations(
+                accounts,
+                list(allocations.values()),
+                price_map=price_map,
+                metadata_map=market_data,
+            )
+        except Exception as e:
+            print(f"    - ❌ Failed to rebalance accounts: {e}")
+            return
+        for agent_name, account in zip(allocations, accounts):
             try:
-                account.apply_allocation(
-                    allocation, price_map=price_map, metadata_map=market_data
-                )
                 llm_input = None
                 llm_output = None
                 agent = self.agents.get(agent_name)
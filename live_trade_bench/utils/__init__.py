@@ -2,10 +2,25 @@
 Trading Bench Utils Package
 """
 
-from .llm_client import call_llm, parse_allocation_response, parse_trading_response
+from .agent_utils import run_agents_concurrently
+from .llm_cache import CacheMode, LLMResponseCache, configure_llm_cache
+from .llm_client import (
+    call_llm,
+    parse_allocation_response,
+    parse_trading_response,
+    set_provider_concurrency,
+)
+from .market_calendar import MarketCalendar, get_calendar
 
 __all__ = [
     "call_llm",
     "parse_trading_response",
     "parse_allocation_response",
+    "run_agents_concurrently",
+    "set_provider_concurrency",
+    "CacheMode",
+    "LLMResponseCache",
+    "configure_llm_cache",
+    "MarketCalendar",
+    "get_calendar",
 ]
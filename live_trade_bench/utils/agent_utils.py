@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Upper bound on agent threads per cycle; the per-provider semaphores in
+# llm_client decide how many requests actually run at once.
+MAX_AGENT_WORKERS = 32
 
 
 def normalize_allocations(parsed: Dict[str, Any]) -> Optional[Dict[str, float]]:
@@ -52,3 +59,20 @@ def parse_llm_response_to_json(content: str) -> Optional[Dict[str, Any]]:
         return json.loads(json_str)
     except (json.JSONDecodeError, IndexError):
         return None
+
+
+def run_agents_concurrently(
+    agent_names: Iterable[str],
+    func: Callable[[str], T],
+    max_workers: int = MAX_AGENT_WORKERS,
+) -> Dict[str, T]:
+    """Call ``func(agent_name)`` for every agent on a thread pool.
+
+    The result dict follows the order of ``agent_names``, not completion order.
+    """
+    names = list(agent_names)
+    if not names:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+        futures = {name: pool.submit(func, name) for name in names}
+        return {name: futures[name].result() for name in names}
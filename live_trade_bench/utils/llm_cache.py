@@ -0,0 +1,182 @@
+"""
+Persistent cache for LLM completions.
+
+Responses are stored in SQLite under a SHA-256 of the normalized request
+(provider/model, messages, temperature, max_tokens), so re-running a backtest
+or retrying a failed cycle replays identical prompts without calling the API.
+When the stored content grows past ``max_bytes`` the least recently used
+entries are evicted.
+
+The cache is off unless ``configure_llm_cache`` is called or ``LTB_LLM_CACHE``
+points at a database file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+
+LLM_CACHE_ENV = "LTB_LLM_CACHE"
+DEFAULT_LLM_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "llm_cache.sqlite",
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class CacheMode(str, Enum):
+    READ_ONLY = "read_only"
+    READ_WRITE = "read_write"
+    BYPASS = "bypass"
+
+
+def cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, model: str, content: str) -> None:
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, content, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": count, "bytes": size, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_default_mode = CacheMode.READ_WRITE
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    global _llm_cache
+    if _llm_cache is None and os.environ.get(LLM_CACHE_ENV):
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(os.environ[LLM_CACHE_ENV])
+    return _llm_cache
+
+
+def configure_llm_cache(
+    path: Optional[str] = None,
+    mode: Union[CacheMode, str] = CacheMode.READ_WRITE,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Optional[LLMResponseCache]:
+    """Open the process-wide cache and set the mode used when callers pass none.
+
+    ``CacheMode.BYPASS`` closes the cache instead.
+    """
+    global _llm_cache, _default_mode
+    mode = CacheMode(mode)
+    path = path or os.environ.get(LLM_CACHE_ENV) or DEFAULT_LLM_CACHE_PATH
+    with _llm_cache_lock:
+        _default_mode = mode
+        if mode is CacheMode.BYPASS:
+            if _llm_cache is not None:
+                _llm_cache.close()
+            _llm_cache = None
+            return None
+        if _llm_cache is None or _llm_cache.path != path:
+            if _llm_cache is not None:
+                _llm_cache.close()
+            _llm_cache = LLMResponseCache(path, max_bytes=max_bytes)
+        else:
+            _llm_cache.max_bytes = max_bytes
+    return _llm_cache
+
+
+def resolve_cache_mode(mode: Union[CacheMode, str, None]) -> CacheMode:
+    return _default_mode if mode is None else CacheMode(mode)
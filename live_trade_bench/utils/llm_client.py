@@ -2,7 +2,24 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .llm_cache import CacheMode, cache_key, get_llm_cache, resolve_cache_mode
+
+# Max in-flight completions per provider, so agents running in parallel stay
+# under each API's rate limit.
+PROVIDER_CONCURRENCY: Dict[str, int] = {
+    "openai": 8,
+    "anthropic": 4,
+    "gemini": 4,
+    "xai": 4,
+    "together_ai": 8,
+}
+DEFAULT_PROVIDER_CONCURRENCY = 4
+
+_provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_provider_lock = threading.Lock()
 
 
 def _resolve_provider_and_model(model: str) -> Tuple[Optional[str], str, Optional[str]]:
@@ -27,14 +44,31 @@ def _resolve_provider_and_model(model: str) -> Tuple[Optional[str], str, Optiona
     return "together_ai", raw, "TOGETHER_API_KEY"
 
 
+def provider_semaphore(provider: Optional[str]) -> threading.BoundedSemaphore:
+    key = provider or "default"
+    with _provider_lock:
+        semaphore = _provider_semaphores.get(key)
+        if semaphore is None:
+            limit = PROVIDER_CONCURRENCY.get(key, DEFAULT_PROVIDER_CONCURRENCY)
+            semaphore = threading.BoundedSemaphore(max(1, limit))
+            _provider_semaphores[key] = semaphore
+        return semaphore
+
+
+def set_provider_concurrency(provider: str, limit: int) -> None:
+    """Change a provider's cap; applies to calls that start afterwards."""
+    with _provider_lock:
+        PROVIDER_CONCURRENCY[provider] = limit
+        _provider_semaphores[provider] = threading.BoundedSemaphore(max(1, limit))
+
+
 def call_llm(
     messages: List[Dict[str, str]],
     model: str = "gpt-4o-mini",
     agent_name: str = "default_agent",
+    cache_mode: Union[CacheMode, str, None] = None,
 ) -> Dict[str, Any]:
     try:
-        import litellm
-
         provider, normalized_model, api_key_env = _resolve_provider_and_model(model)
 
         completion_params: Dict[str, Any] = {
@@ -50,14 +84,35 @@ def call_llm(
         ):
             del completion_params["temperature"]
             del completion_params["max_tokens"]
+
+        cache = get_llm_cache()
+        mode = resolve_cache_mode(cache_mode)
+        key = None
+        if cache is not None and mode is not CacheMode.BYPASS:
+            key = cache_key(
+                f"{provider}/{normalized_model}",
+                messages,
+                completion_params.get("temperature"),
+                completion_params.get("max_tokens"),
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                print(f"✅ LLM ({agent_name}) served from cache")
+                return {"success": True, "content": cached, "cached": True}
+
+        import litellm
+
         if provider:
             completion_params["custom_llm_provider"] = provider
         if api_key_env and os.getenv(api_key_env):
             completion_params["api_key"] = os.getenv(api_key_env)
 
-        response = litellm.completion(**completion_params)
+        with provider_semaphore(provider):
+            response = litellm.completion(**completion_params)
         content = response.choices[0].message.content
         print(f"✅ LLM ({agent_name}) call successful")
+        if key is not None and mode is CacheMode.READ_WRITE and content:
+            cache.put(key, f"{provider}/{normalized_model}", content)
         return {"success": True, "content": content}
 
     except Exception as e:
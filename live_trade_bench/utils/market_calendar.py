@@ -0,0 +1,240 @@
+"""
+Trading calendars for the markets the bench trades.
+
+Treating every weekday as a trading day ran stock cycles (network fetches
+and LLM calls) on NYSE holidays, where ``yf.download`` only returns empty
+frames. ``MarketCalendar`` knows the NYSE holiday rules and early closes.
+BitMEX trades 24/7, and Polymarket keeps the weekday cadence the bench has
+always used for it.
+
+Holidays are generated per year from the exchange rules and cached. Session
+lists are built with NumPy business-day arithmetic rather than a date loop,
+so a multi-year range costs one vectorized call.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+
+import numpy as np
+import pytz
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+NYSE_OPEN = time(9, 30)
+NYSE_CLOSE = time(16, 0)
+NYSE_EARLY_CLOSE = time(13, 0)
+
+# Unscheduled full-day closures (national days of mourning, weather)
+NYSE_SPECIAL_CLOSURES = frozenset(
+    date.fromisoformat(d)
+    for d in (
+        "2012-10-29",
+        "2012-10-30",
+        "2018-12-05",
+        "2025-01-09",
+    )
+)
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[D]").item()
+    return date.fromisoformat(str(value)[:10])
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """``n``-th ``weekday`` (0=Monday) of the month; ``n=-1`` is the last."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    ell = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * ell) // 451
+    month, day = divmod(h + ell - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    # Saturday holidays move to Friday, Sunday holidays to Monday
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    new_year = date(year, 1, 1)
+    # a Saturday New Year's Day is not observed on the Friday before
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.update(d for d in NYSE_SPECIAL_CLOSURES if d.year == year)
+    return frozenset(d for d in holidays if d.year == year)
+
+
+@lru_cache(maxsize=None)
+def nyse_early_closes(year: int) -> FrozenSet[date]:
+    closes = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}
+    for eve in (date(year, 7, 3), date(year, 12, 24)):
+        # only when the holiday itself falls Tuesday to Friday
+        if eve.weekday() < 4:
+            closes.add(eve)
+    return frozenset(d for d in closes if d not in nyse_holidays(year))
+
+
+@lru_cache(maxsize=64)
+def _busdaycalendar(
+    weekmask: str, holidays: bool, first_year: int, last_year: int
+) -> np.busdaycalendar:
+    days = (
+        sorted(d for y in range(first_year, last_year + 1) for d in nyse_holidays(y))
+        if holidays
+        else []
+    )
+    return np.busdaycalendar(
+        weekmask=weekmask, holidays=np.array(days, dtype="datetime64[D]")
+    )
+
+
+class MarketCalendar:
+    def __init__(
+        self,
+        name: str,
+        tz: str = "UTC",
+        weekmask: str = "1111111",
+        open_time: Optional[time] = None,
+        close_time: Optional[time] = None,
+        holidays: bool = False,
+    ) -> None:
+        self.name = name
+        self.tz = pytz.timezone(tz)
+        self.weekmask = weekmask
+        # None/None means the market trades around the clock on session days
+        self.open_time = open_time
+        self.close_time = close_time
+        self.holidays = holidays
+
+    @property
+    def always_open(self) -> bool:
+        return self.open_time is None
+
+    def _calendar_for(self, start: date, end: date) -> np.busdaycalendar:
+        return _busdaycalendar(
+            self.weekmask, self.holidays, start.year - 1, end.year + 1
+        )
+
+    def is_session(self, day: DateLike) -> bool:
+        day = _to_date(day)
+        return bool(np.is_busday(day, busdaycal=self._calendar_for(day, day)))
+
+    def sessions(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """Session days in ``[start, end]`` as ``datetime64[D]``."""
+        first, last = _to_date(start), _to_date(end)
+        if last < first:
+            return np.empty(0, dtype="datetime64[D]")
+        days = np.arange(first, last + timedelta(days=1), dtype="datetime64[D]")
+        return days[np.is_busday(days, busdaycal=self._calendar_for(first, last))]
+
+    def next_session(self, day: DateLike) -> date:
+        """First session strictly after ``day``."""
+        day = _to_date(day)
+        cal = self._calendar_for(day, day + timedelta(days=14))
+        nxt = np.busday_offset(np.datetime64(day) + 1, 0, roll="forward", busdaycal=cal)
+        return nxt.astype("datetime64[D]").item()
+
+    def close_time_on(self, day: DateLike) -> Optional[time]:
+        if self.close_time is None:
+            return None
+        day = _to_date(day)
+        if self.holidays and day in nyse_early_closes(day.year):
+            return NYSE_EARLY_CLOSE
+        return self.close_time
+
+    def session_bounds(self, day: DateLike) -> Optional[Tuple[datetime, datetime]]:
+        """Open and close of ``day``'s session as aware datetimes, if it is one."""
+        day = _to_date(day)
+        if self.always_open or not self.is_session(day):
+            return None
+        return (
+            self.tz.localize(datetime.combine(day, self.open_time)),
+            self.tz.localize(datetime.combine(day, self.close_time_on(day))),
+        )
+
+    def is_open(self, now: datetime) -> bool:
+        local = now.astimezone(self.tz)
+        if not self.is_session(local.date()):
+            return False
+        if self.always_open:
+            return True
+        opens, closes = self.session_bounds(local.date())
+        return opens <= local <= closes
+
+    def next_open(self, now: datetime) -> datetime:
+        """``now`` if the market is open, else the start of the next session."""
+        if self.is_open(now):
+            return now
+        local = now.astimezone(self.tz)
+        if self.always_open:
+            day = self.next_session(local.date())
+            return self.tz.localize(datetime.combine(day, time(0, 0)))
+        bounds = self.session_bounds(local.date())
+        if bounds is not None and local < bounds[0]:
+            return bounds[0]
+        return self.session_bounds(self.next_session(local.date()))[0]
+
+
+NYSE = MarketCalendar(
+    "NYSE",
+    tz="US/Eastern",
+    weekmask="1111100",
+    open_time=NYSE_OPEN,
+    close_time=NYSE_CLOSE,
+    holidays=True,
+)
+ALWAYS_OPEN = MarketCalendar("24/7")
+WEEKDAYS = MarketCalendar("weekdays", weekmask="1111100")
+
+_CALENDARS: Dict[str, MarketCalendar] = {
+    "stock": NYSE,
+    "bitmex": ALWAYS_OPEN,
+    "polymarket": WEEKDAYS,
+}
+
+
+def get_calendar(market: str) -> MarketCalendar:
+    try:
+        return _CALENDARS[market]
+    except KeyError:
+        raise ValueError(f"Unknown market: {market}") from None
@@ -5,6 +5,8 @@ Regenerate allocation snapshots where LLM calls previously failed.
 This script loads an input models data JSON file, replays any allocation history
 entry with a failed `llm_output`, and writes a new JSON file with refreshed
 results. It uses the existing agent implementations to perform the LLM calls.
+Snapshots that reference their transcript by `transcript_id` are resolved via
+the transcript store, so point `LTB_TRANSCRIPT_DIR` at e.g. backend/transcripts.
 """
 
 from __future__ import annotations
@@ -16,6 +18,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from live_trade_bench.accounts import load_transcript
 from live_trade_bench.agents.polymarket_agent import LLMPolyMarketAgent
 from live_trade_bench.agents.stock_agent import LLMStockAgent
 from live_trade_bench.utils.agent_utils import normalize_allocations
@@ -123,11 +126,12 @@ def refresh_snapshot(
     agent_cache: Dict[Tuple[str, str, str], Any],
     delay: float,
 ) -> bool:
-    llm_output = snapshot.get("llm_output") or {}
+    transcript = load_transcript(snapshot)
+    llm_output = transcript.get("llm_output") or {}
     if llm_output.get("success") is not False:
         return False
 
-    llm_input = snapshot.get("llm_input")
+    llm_input = transcript.get("llm_input")
     if not llm_input:
         raise RuntimeError("Missing llm_input for failed snapshot")
 
@@ -165,6 +169,9 @@ def refresh_snapshot(
     snapshot["allocations_array"] = build_allocations_array(
         allocations, snapshot.get("allocations_array", [])
     )
+    # write the refreshed transcript inline; it is externalized again on load
+    snapshot.pop("transcript_id", None)
+    snapshot["llm_input"] = llm_input
     snapshot["llm_output"] = {
         "success": True,
         "content": response.get("content"),
@@ -0,0 +1,59 @@
+"""Shared fixtures for the backtest tests."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from live_trade_bench.backtest import BacktestRunner
+from live_trade_bench.systems.stock_system import StockPortfolioSystem
+
+
+class ScriptedStockSystem(StockPortfolioSystem):
+    """Stock system with made-up prices and fixed per-agent targets."""
+
+    TARGETS = {
+        "all_in": {"AAPL": 1.0},
+        "split": {"AAPL": 0.5, "MSFT": 0.5},
+        "cash": {"CASH": 1.0},
+    }
+
+    def _fetch_market_data(self, for_date=None):
+        day = datetime.strptime(for_date, "%Y-%m-%d").day
+        return {
+            "AAPL": {"ticker": "AAPL", "current_price": 100.0 + day},
+            "MSFT": {"ticker": "MSFT", "current_price": 300.0 - 2 * day},
+        }
+
+    def _fetch_news_data(self, market_data, for_date):
+        return {}
+
+    def _generate_allocations(self, market_data, news_data, for_date):
+        for name, agent in self.agents.items():
+            agent.last_llm_input = {"prompt": f"{name} on {for_date}"}
+            agent.last_llm_output = {"content": json.dumps(self.TARGETS[name])}
+        return {name: dict(self.TARGETS[name]) for name in self.agents}
+
+
+@pytest.fixture
+def scripted_runner():
+    """Builds backtest runners over a fresh ``ScriptedStockSystem``."""
+
+    def make(
+        workers: int = 1, end_date: str = "2024-03-08", **kwargs
+    ) -> BacktestRunner:
+        system = ScriptedStockSystem()
+        for name in ScriptedStockSystem.TARGETS:
+            system.add_agent(name, initial_cash=1000.0, model_name=f"model-{name}")
+        return BacktestRunner(
+            system,
+            "2024-03-04",
+            end_date,
+            use_price_cache=False,
+            llm_cache_mode="bypass",
+            prefetch=False,
+            workers=workers,
+            **kwargs,
+        )
+
+    return make
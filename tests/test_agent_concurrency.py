@@ -0,0 +1,57 @@
+"""Tests for running agent LLM calls and backtest lanes in parallel."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from live_trade_bench.utils.agent_utils import run_agents_concurrently
+from live_trade_bench.utils.llm_client import call_llm, set_provider_concurrency
+
+
+def test_run_agents_concurrently_keeps_agent_order() -> None:
+    """Results follow agent order even when later agents finish first."""
+    delays = {"slow": 0.05, "medium": 0.02, "fast": 0.0}
+
+    def work(name: str) -> str:
+        time.sleep(delays[name])
+        return name.upper()
+
+    results = run_agents_concurrently(["slow", "medium", "fast"], work)
+    assert list(results.items()) == [
+        ("slow", "SLOW"),
+        ("medium", "MEDIUM"),
+        ("fast", "FAST"),
+    ]
+
+
+def test_call_llm_respects_provider_concurrency() -> None:
+    """No more than the provider's cap of completions run at once."""
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def completion(**kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        response = MagicMock()
+        response.choices[0].message.content = "{}"
+        return response
+
+    set_provider_concurrency("anthropic", 2)
+    fake_litellm = MagicMock(completion=completion)
+    try:
+        with patch.dict("sys.modules", {"litellm": fake_litellm}):
+            results = run_agents_concurrently(
+                [f"agent{i}" for i in range(6)],
+                lambda name: call_llm([], model="anthropic/claude", agent_name=name),
+            )
+    finally:
+        set_provider_concurrency("anthropic", 4)
+
+    assert all(r["success"] for r in results.values())
+    assert peak <= 2
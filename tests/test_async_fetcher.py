@@ -0,0 +1,59 @@
+"""Tests for the asyncio fetcher layer."""
+
+import asyncio
+import threading
+import time
+
+from live_trade_bench.fetchers.async_fetcher import gather_bounded, run_coroutine_sync
+
+
+def test_gather_bounded_keeps_order_and_returns_errors() -> None:
+    """Results follow input order and a failing call does not cancel the rest."""
+
+    async def value(x: int) -> int:
+        await asyncio.sleep(0.01 * (3 - x))
+        if x == 1:
+            raise ValueError("boom")
+        return x * 10
+
+    results = run_coroutine_sync(
+        gather_bounded([lambda x=x: value(x) for x in range(3)], limit=3)
+    )
+
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 20
+
+
+def test_gather_bounded_limits_concurrency() -> None:
+    """No more than ``limit`` blocking calls run at the same time."""
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def blocking() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    run_coroutine_sync(
+        gather_bounded([lambda: asyncio.to_thread(blocking) for _ in range(6)], 2)
+    )
+
+    assert peak <= 2
+
+
+def test_run_coroutine_sync_inside_running_loop() -> None:
+    """Works when the caller already sits inside an event loop."""
+
+    async def inner() -> int:
+        return 7
+
+    async def outer() -> int:
+        return run_coroutine_sync(inner())
+
+    assert asyncio.run(outer()) == 7
@@ -0,0 +1,31 @@
+"""Tests for checkpointing and resuming backtests."""
+
+from unittest.mock import patch
+
+from live_trade_bench.systems.stock_system import StockPortfolioSystem
+
+
+def test_backtest_resumes_from_checkpoint(scripted_runner, tmp_path) -> None:
+    """A resumed run only replays the days after the checkpoint."""
+    expected = scripted_runner().run()
+
+    path = str(tmp_path / "backtest.ckpt.gz")
+    # stands in for a run that died after its third day
+    scripted_runner(end_date="2024-03-06", checkpoint_path=path).run()
+
+    resumed = scripted_runner(resume_from=path, checkpoint_path=path)
+    with patch.object(
+        type(resumed.system),
+        "run_cycle",
+        autospec=True,
+        side_effect=StockPortfolioSystem.run_cycle,
+    ) as run_cycle:
+        results = resumed.run()
+
+    assert [call.args[1] for call in run_cycle.call_args_list] == [
+        "2024-03-07",
+        "2024-03-08",
+    ]
+    assert results == expected
+    assert resumed.system.cycle_count == 5
+    assert resumed.completed[-1] == "2024-03-08"
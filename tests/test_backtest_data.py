@@ -0,0 +1,100 @@
+"""Tests for the prefetched backtest prices and news."""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+from live_trade_bench.fetchers.backtest_data import (
+    PrefetchedNews,
+    load_news,
+    load_stock_prices,
+)
+
+
+@patch("live_trade_bench.fetchers.stock_fetcher.yf.download")
+def test_prefetched_prices_match_per_day_fetch(mock_download: Mock) -> None:
+    """Slicing the bulk load gives what each day would have downloaded."""
+    index = pd.bdate_range("2024-01-01", "2024-02-09")
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["AAPL"]])
+    frame = pd.DataFrame(
+        [[100.0 + i, 10 + i] for i in range(len(index))], index=index, columns=columns
+    )
+    # weekend gaps and a missing close must slice the same way
+    frame.loc[pd.Timestamp("2024-01-17"), ("Close", "AAPL")] = float("nan")
+
+    def download(start, end, **kwargs):
+        return frame[(frame.index >= start) & (frame.index < end)]
+
+    mock_download.side_effect = download
+    prices = load_stock_prices(["AAPL"], "2024-01-15", "2024-02-05")
+    assert mock_download.call_count == 1
+
+    from live_trade_bench.fetchers.stock_fetcher import StockFetcher
+
+    fetcher = StockFetcher()
+    for day in ["2024-01-15", "2024-01-17", "2024-01-22", "2024-02-05"]:
+        expected = fetcher.get_prices_with_history(["AAPL"], day)["AAPL"]
+        sliced = prices.prices_with_history(["AAPL"], day)["AAPL"]
+        assert sliced["current_price"] == expected["current_price"]
+        assert sliced["price_history"] == expected["price_history"]
+
+
+def test_prefetched_news_windows_per_day() -> None:
+    """A day gets the items of the three days before it, closest first."""
+    from datetime import datetime
+
+    def item(day: str, hour: int) -> dict:
+        ts = datetime.strptime(day, "%Y-%m-%d").replace(hour=hour).timestamp()
+        return {"title": f"{day} {hour}", "date": ts}
+
+    news = PrefetchedNews()
+    news.add(
+        "q",
+        [
+            item("2024-01-05", 9),
+            item("2024-01-06", 9),
+            item("2024-01-08", 12),
+            item("2024-01-09", 1),
+            item("2024-01-10", 9),
+            {"title": "undated", "date": None},
+        ],
+    )
+    day = news.for_day("q", "2024-01-10", tag="AAPL")
+    assert [it["title"] for it in day] == [
+        "2024-01-09 1",
+        "2024-01-08 12",
+        "2024-01-06 9",
+    ]
+    assert all(it["tag"] == "AAPL" for it in day)
+    assert news.for_day("other", "2024-01-10") == []
+
+
+@patch("live_trade_bench.fetchers.backtest_data.NewsFetcher.fetch")
+def test_news_budget_scales_with_window(mock_fetch: Mock) -> None:
+    """A long window is fetched per week with ten items a day, then merged."""
+    from datetime import datetime
+
+    def fetch(query, start, end, max_pages):
+        ts = datetime.strptime(start, "%Y-%m-%d").timestamp()
+        return [
+            {"link": f"{start}-{i}", "title": start, "date": ts} for i in range(2)
+        ] + [{"link": "shared", "title": "shared", "date": ts}]
+
+    mock_fetch.side_effect = fetch
+    news = load_news(["q", "q"], "2024-01-05", "2024-01-25", concurrency=2)
+
+    calls = sorted(c.args for c in mock_fetch.call_args_list)
+    assert calls == [
+        ("q", "2024-01-01", "2024-01-07", 7),
+        ("q", "2024-01-08", "2024-01-14", 7),
+        ("q", "2024-01-15", "2024-01-21", 7),
+        ("q", "2024-01-22", "2024-01-24", 3),
+    ]
+    titles = [it["title"] for it in news.for_day("q", "2024-01-25")]
+    assert titles == ["2024-01-22", "2024-01-22"]
+    # the story every window returns is kept once
+    assert sorted(it["title"] for it in news.for_day("q", "2024-01-04")) == [
+        "2024-01-01",
+        "2024-01-01",
+        "shared",
+    ]
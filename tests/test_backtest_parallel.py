@@ -0,0 +1,46 @@
+"""Tests for the process-pool backtest lanes."""
+
+from live_trade_bench.accounts import load_transcript
+from live_trade_bench.backtest.parallel import lanes_for
+from live_trade_bench.utils.llm_cache import CacheMode
+
+
+def test_parallel_backtest_lanes_match_sequential_run(scripted_runner) -> None:
+    """Process-pool lanes give the sequential results in agent order."""
+    sequential = scripted_runner(workers=1)
+    expected = sequential.run()
+
+    parallel = scripted_runner(workers=2)
+    results = parallel.run()
+
+    assert list(results) == list(parallel.system.TARGETS)
+    assert results == expected
+    assert results["all_in"]["final_value"] > results["cash"]["final_value"]
+    # the finished lane accounts are put back on the runner's system
+    for name, account in parallel.system.accounts.items():
+        assert account.get_total_value() == results[name]["final_value"]
+        assert len(account.allocation_history) == 5
+        assert account.engine is parallel.system.engine
+        # transcripts recorded in the workers resolve in this process
+        last = account.allocation_history[-1]
+        assert load_transcript(last)["llm_input"] == {"prompt": f"{name} on 2024-03-08"}
+    # and reuse the rows of the accounts they replace
+    assert parallel.system.engine.n_rows == len(parallel.system.TARGETS)
+
+
+def test_lanes_keep_their_agents_cache_mode(scripted_runner) -> None:
+    """Each lane runs with the LLM cache mode its own runner gave the agent."""
+    runner = scripted_runner()
+    agents = runner.system.agents
+    agents["all_in"].llm_cache_mode = CacheMode.READ_WRITE
+    agents["split"].llm_cache_mode = CacheMode.READ_ONLY
+
+    modes = {
+        lane.agent_name: lane.llm_cache_mode
+        for lane in lanes_for("stock", runner.system)
+    }
+    assert modes == {
+        "all_in": CacheMode.READ_WRITE,
+        "split": CacheMode.READ_ONLY,
+        "cash": CacheMode.BYPASS,
+    }
@@ -0,0 +1,40 @@
+"""Tests for the offline replay of recorded backtest runs."""
+
+from unittest.mock import patch
+
+from live_trade_bench.backtest import ExecutionParams, replay, runs_from_accounts
+from live_trade_bench.fetchers import PrefetchedPrices
+
+
+def test_replay_reprices_recorded_run_offline(scripted_runner) -> None:
+    """A replay reproduces the recorded run and reprices it under costs."""
+    runner = scripted_runner()
+    expected = runner.run()
+    runs = runs_from_accounts(runner.system.accounts)
+
+    days = [f"2024-03-0{d}" for d in range(4, 9)]
+    prices = PrefetchedPrices(current_days=1)
+    prices.add("AAPL", days, [100.0 + d for d in range(4, 9)])
+    prices.add("MSFT", days, [300.0 - 2 * d for d in range(4, 9)])
+
+    with patch.object(type(runner.system), "_generate_allocations") as llm:
+        baseline, costly, banded = replay(
+            runs,
+            [
+                ExecutionParams(),
+                ExecutionParams(fee_bps=10, slippage_bps=5),
+                ExecutionParams(rebalance_threshold=0.05),
+            ],
+            prices={"stock": prices},
+        )
+    llm.assert_not_called()
+
+    for name, result in expected.items():
+        assert abs(baseline[name]["final_value"] - result["final_value"]) < 1e-6
+        assert len(baseline[name]["value_history"]) == 5
+    assert costly["all_in"]["final_value"] < baseline["all_in"]["final_value"]
+    assert costly["all_in"]["fees"] > 0
+    assert costly["cash"]["final_value"] == 1000.0
+    # small daily drifts of the 50/50 split stay inside the band
+    assert banded["split"]["rebalances"] == 1
+    assert baseline["split"]["rebalances"] == 5
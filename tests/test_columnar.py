@@ -0,0 +1,75 @@
+"""Tests for the columnar /api/models encoding."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.data_store import data_store
+from backend.app.routers import models as models_router
+
+
+def test_columnar_models_with_since_and_gzip(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "models.json")
+    monkeypatch.setattr(models_router, "MODELS_DATA_FILE", path)
+    app = FastAPI()
+    app.include_router(models_router.router, prefix="/api")
+    client = TestClient(app)
+
+    def snapshot(day: int, allocations: dict) -> dict:
+        return {
+            "timestamp": f"2025-09-0{day}T15:00:00",
+            "total_value": 1000.0 + day,
+            "profit": float(day),
+            "performance": day / 10,
+            "allocations": allocations,
+            "allocations_array": [
+                {"name": k, "allocation": v, "url": f"https://x/{k}"}
+                for k, v in allocations.items()
+            ],
+        }
+
+    model = {
+        "id": "m1",
+        "profit": 2.0,
+        "allocationHistory": [
+            snapshot(1, {"AAPL": 0.5, "CASH": 0.5}),
+            snapshot(2, {"MSFT": 0.7, "CASH": 0.3}),
+        ],
+        "profitHistory": [
+            {"timestamp": "2025-09-01T15:00:00", "profit": 1.0, "totalValue": 1001.0},
+            {"timestamp": "2025-09-02T15:00:00", "profit": 2.0, "totalValue": 1002.0},
+        ],
+    }
+    data_store.write_json(path, [model])
+    try:
+        resp = client.get("/api/models/columnar")
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        payload = resp.json()
+        assert payload["symbols"] == ["AAPL", "CASH", "MSFT"]
+        assert payload["symbol_meta"][0] == {"url": "https://x/AAPL"}
+        history = payload["models"][0]["allocationHistory"]
+        assert history["columns"] == [0, 1, 2]
+        assert history["weights"] == [[0.5, 0.5, 0.0], [0.0, 0.3, 0.7]]
+        assert history["total_value"] == [1001.0, 1002.0]
+        assert payload["models"][0]["profit"] == 2.0
+
+        delta = client.get(
+            "/api/models/columnar", params={"since": "2025-09-01T15:00:00"}
+        ).json()
+        assert delta["models"][0]["profitHistory"] == {
+            "timestamps": ["2025-09-02T15:00:00"],
+            "profit": [2.0],
+            "totalValue": [1002.0],
+        }
+        assert delta["symbols"] == payload["symbols"]
+        assert delta["models"][0]["allocationHistory"]["columns"] == [2, 1]
+        assert delta["models"][0]["allocationHistory"]["weights"] == [[0.7, 0.3]]
+
+        etag = resp.headers["etag"]
+        cached = client.get("/api/models/columnar", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert client.get("/api/models/columnar?since=yesterday").status_code == 400
+        if models_router.msgpack is None:
+            assert client.get("/api/models/columnar?format=msgpack").status_code == 406
+    finally:
+        data_store.invalidate(path)
@@ -339,5 +339,78 @@ def fetch_polymarket_trending_markets(limit: int = 10) -> List[Dict[str, Any]]:
     return sorted_markets[:limit]
 
 
+@patch("live_trade_bench.fetchers.stock_fetcher.yf.download")
+def test_get_prices_with_history_single_download(mock_download: Mock) -> None:
+    """Many tickers come from one download split by ticker."""
+    index = pd.to_datetime(["2024-01-15", "2024-01-16", "2024-01-17"])
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["AAPL", "MSFT"]])
+    mock_download.return_value = pd.DataFrame(
+        [
+            [100.0, 300.0, 10, 30],
+            [101.0, None, 11, 0],
+            [102.0, 302.0, 12, 32],
+        ],
+        index=index,
+        columns=columns,
+    )
+
+    from live_trade_bench.fetchers.stock_fetcher import StockFetcher
+
+    result = StockFetcher().get_prices_with_history(["AAPL", "MSFT"], "2024-01-17")
+
+    mock_download.assert_called_once()
+    assert mock_download.call_args.kwargs["tickers"] == ["AAPL", "MSFT"]
+    assert result["AAPL"]["current_price"] == 102.0
+    assert [p["price"] for p in result["AAPL"]["price_history"]] == [100.0, 101.0]
+    assert result["MSFT"]["current_price"] == 302.0
+    assert result["MSFT"]["price_history"] == [
+        {"date": "2024-01-15", "price": 300.0, "volume": 30}
+    ]
+
+
+@patch("live_trade_bench.fetchers.stock_fetcher.yf.Ticker")
+@patch("live_trade_bench.fetchers.stock_fetcher.yf.download")
+def test_current_prices_one_download_and_cached(
+    mock_download: Mock, mock_ticker: Mock
+) -> None:
+    """Quotes for all tickers come from one download and are reused briefly."""
+    from live_trade_bench.fetchers import stock_fetcher
+
+    stock_fetcher._quote_cache.clear()
+    index = pd.to_datetime(["2024-01-17 15:58", "2024-01-17 15:59"])
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["AAPL", "MSFT", "QQQ"]])
+    mock_download.return_value = pd.DataFrame(
+        [
+            [185.0, 390.0, None, 1, 1, 0],
+            [185.5, None, None, 1, 0, 0],
+        ],
+        index=index,
+        columns=columns,
+    )
+    mock_ticker.return_value.fast_info.last_price = 420.0
+
+    try:
+        fetcher = stock_fetcher.StockFetcher()
+        quotes = fetcher.get_current_prices(["AAPL", "MSFT", "QQQ"])
+        assert quotes == {"AAPL": 185.5, "MSFT": 390.0, "QQQ": 420.0}
+        mock_download.assert_called_once()
+        assert mock_download.call_args.kwargs["tickers"] == ["AAPL", "MSFT", "QQQ"]
+        # only QQQ needed the per-ticker fallback
+        mock_ticker.assert_called_once_with("QQQ")
+
+        assert fetcher.get_current_price("MSFT") == 390.0
+        mock_download.assert_called_once()
+    finally:
+        stock_fetcher._quote_cache.clear()
+
+
+def test_fetchers_export_everything_in_all() -> None:
+    """Every name in ``fetchers.__all__`` resolves, so ``import *`` works."""
+    import live_trade_bench.fetchers as fetchers
+
+    missing = [name for name in fetchers.__all__ if not hasattr(fetchers, name)]
+    assert missing == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,99 @@
+"""Tests for the backend's cached JSON responses."""
+
+import json
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend.app.data_store import JSONDataStore, data_store
+from backend.app.routers import router_utils
+
+
+def _client(path: str) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/data")
+    def get_data(request: Request):
+        return router_utils.cached_json_response(request, path)
+
+    @app.get("/slice/{n}")
+    def get_slice(request: Request, n: int):
+        return router_utils.cached_json_response(
+            request, path, key=n, build=lambda data: data["items"][:n]
+        )
+
+    return TestClient(app)
+
+
+def test_store_parses_once_and_reloads_on_change(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "data.json")
+    store = JSONDataStore()
+    assert store.get(path) is None
+
+    with open(path, "w") as f:
+        json.dump({"a": 1}, f)
+    first = store.get(path)
+    assert first.data == {"a": 1}
+    assert first.body == b'{"a":1}'
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged file was re-parsed")
+
+    monkeypatch.setattr(json, "load", fail)
+    assert store.get(path) is first
+    monkeypatch.undo()
+
+    with open(path, "w") as f:
+        json.dump({"a": 22}, f)
+    os.utime(path, ns=(0, 10**9))
+    assert store.get(path).data == {"a": 22}
+
+    with open(path, "w") as f:
+        f.write('{"a": ')
+    os.utime(path, ns=(0, 2 * 10**9))
+    assert store.get(path).data == {"a": 22}
+
+    store.write_json(path, {"b": 2})
+    assert store.get(path).etag != first.etag
+    with open(path) as f:
+        assert json.load(f) == {"b": 2}
+
+
+def test_write_json_rejects_unservable_data_before_writing(tmp_path) -> None:
+    path = str(tmp_path / "models.json")
+    store = JSONDataStore()
+    store.write_json(path, [{"profit": 1.0}])
+    with pytest.raises(ValueError):
+        store.write_json(path, [{"profit": float("nan")}])
+    with open(path) as f:
+        assert json.load(f) == [{"profit": 1.0}]
+    assert store.get(path).data == [{"profit": 1.0}]
+
+
+def test_cached_response_honours_if_none_match(tmp_path) -> None:
+    path = str(tmp_path / "models.json")
+    client = _client(path)
+    assert client.get("/data").status_code == 404
+
+    data_store.write_json(path, {"items": [1, 2, 3]})
+    try:
+        resp = client.get("/data")
+        assert resp.status_code == 200
+        assert resp.json() == {"items": [1, 2, 3]}
+        etag = resp.headers["etag"]
+
+        cached = client.get("/data", headers={"If-None-Match": f'W/{etag}, "x"'})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        sliced = client.get("/slice/2")
+        assert sliced.json() == [1, 2]
+        assert sliced.headers["etag"] != etag
+
+        data_store.write_json(path, {"items": [4]})
+        assert client.get("/data", headers={"If-None-Match": etag}).status_code == 200
+        assert client.get("/slice/2").json() == [4]
+    finally:
+        data_store.invalidate(path)
@@ -0,0 +1,54 @@
+"""Tests for the Polymarket full-history cache."""
+
+from live_trade_bench.fetchers.history_cache import PriceHistoryCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_history_cache_ttl_and_incremental_append(tmp_path) -> None:
+    """Fresh entries are served locally; stale ones only fetch newer points."""
+    clock = FakeClock()
+    cache = PriceHistoryCache("test", ttl=60, root=str(tmp_path), clock=clock)
+    calls = []
+
+    def fetch(start_ts):
+        calls.append(start_ts)
+        if start_ts is None:
+            return [{"t": 10, "p": 0.1}, {"t": 20, "p": 0.2}]
+        return [{"t": 20, "p": 0.25}, {"t": 30, "p": 0.3}]
+
+    assert cache.get("tok", 1440, fetch) == [{"t": 10, "p": 0.1}, {"t": 20, "p": 0.2}]
+    cache.get("tok", 1440, fetch)
+    assert calls == [None]
+
+    clock.now += 120
+    points = cache.get("tok", 1440, fetch)
+    assert calls == [None, 20]
+    assert [p["p"] for p in points] == [0.1, 0.25, 0.3]
+
+    # a new process picks the entry up from disk
+    reloaded = PriceHistoryCache("test", ttl=60, root=str(tmp_path), clock=clock)
+    assert reloaded.get("tok", 1440, fetch) == points
+    assert calls == [None, 20]
+
+
+def test_history_cache_serves_old_entry_for_past_window() -> None:
+    """A window that ended before the last fetch never needs a refresh."""
+    clock = FakeClock()
+    cache = PriceHistoryCache("test", ttl=60, clock=clock)
+    calls = []
+
+    def fetch(start_ts):
+        calls.append(start_ts)
+        return [{"t": 10, "p": 0.1}]
+
+    cache.get("tok", 1440, fetch)
+    clock.now += 10_000
+    cache.get("tok", 1440, fetch, until_ts=500)
+    assert calls == [None]
@@ -0,0 +1,76 @@
+"""Tests for the shared HTTP session layer."""
+
+from unittest.mock import Mock, patch
+
+from live_trade_bench.fetchers.http_session import SessionManager, TokenBucket
+from live_trade_bench.fetchers.polymarket_fetcher import PolymarketFetcher
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_waits() -> None:
+    """First calls within the burst are free; later ones queue behind the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_session_manager_reuses_session_per_host() -> None:
+    """Requests to the same host share one pooled session."""
+    manager = SessionManager()
+    a = manager.session_for("https://clob.polymarket.com/price")
+    b = manager.session_for("https://clob.polymarket.com/prices-history")
+    c = manager.session_for("https://gamma-api.polymarket.com/markets")
+
+    assert a is b
+    assert a is not c
+    manager.close()
+
+
+def test_session_manager_unknown_host_uses_default_rate() -> None:
+    """Hosts without a configured limit fall back to the caller's default."""
+    manager = SessionManager(host_rate_limits={})
+    assert manager.limiter_for("https://example.com/a") is None
+
+    limiter = manager.limiter_for("https://example.com/a", default_rate=4.0)
+    assert limiter is not None
+    assert limiter.rate == 4.0
+    assert manager.limiter_for("https://example.com/b") is limiter
+
+    manager.configure_host("example.com", rate=1.0, burst=3)
+    assert manager.limiter_for("https://example.com/a").capacity == 3
+
+
+def test_make_request_goes_through_session_manager() -> None:
+    """BaseFetcher.make_request uses the pooled session and per-host limiter."""
+    manager = Mock()
+    response = Mock(status_code=200)
+    manager.get.return_value = response
+
+    with patch(
+        "live_trade_bench.fetchers.base_fetcher.get_session_manager",
+        return_value=manager,
+    ):
+        fetcher = PolymarketFetcher()
+        result = fetcher.make_request(
+            "https://clob.polymarket.com/price", params={"token_id": "1"}
+        )
+
+    assert result is response
+    manager.throttle.assert_called_once()
+    url = manager.get.call_args.args[0]
+    assert url == "https://clob.polymarket.com/price"
+    assert manager.get.call_args.kwargs["params"] == {"token_id": "1"}
@@ -0,0 +1,86 @@
+"""Tests for scheduler job locks and metrics."""
+
+import threading
+from contextlib import contextmanager
+
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from backend.app.jobs import JOB_DEFAULTS, JobMonitor, LockManager, build_executors
+
+
+def test_job_monitor_records_lag_duration_and_busy_skips() -> None:
+    clock = [100.0]
+    monitor = JobMonitor(clock=lambda: clock[0])
+
+    def work() -> None:
+        clock[0] += 2.5
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    monitor.submitted("prices", 99.0)
+    monitor.wrap("prices", work, locks=("models_data",))()
+    with pytest.raises(RuntimeError):
+        monitor.wrap("prices", fail)()
+
+    stats = monitor.report()["prices"]
+    assert stats["runs"] == 2 and stats["failures"] == 1
+    assert stats["last_error"] == "boom"
+    assert stats["max_duration"] == 2.5
+    assert stats["max_lag"] == 1.0
+
+    # a non-waiting job is skipped while another thread holds its lock
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock() -> None:
+        with monitor.locks.hold("models_data"):
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait(5)
+    monitor.wrap("ticks", work, locks=("models_data",), wait=False)()
+    release.set()
+    holder.join()
+    assert monitor.report()["ticks"]["skipped_busy"] == 1
+    assert monitor.report()["ticks"]["runs"] == 0
+
+
+def test_job_monitor_reports_lock_wait_apart_from_duration() -> None:
+    clock = [100.0]
+
+    class SlowLocks(LockManager):
+        @contextmanager
+        def hold(self, *names, blocking=True):
+            clock[0] += 4.0  # another job held the lock for 4s
+            with super().hold(*names, blocking=blocking) as acquired:
+                yield acquired
+
+    monitor = JobMonitor(SlowLocks(), clock=lambda: clock[0])
+
+    def work() -> None:
+        clock[0] += 1.5
+
+    monitor.wrap("trading", work, locks=("stock_system",))()
+    stats = monitor.report()["trading"]
+    assert stats["last_lock_wait"] == 4.0
+    assert stats["last_duration"] == 1.5
+
+
+def test_first_run_of_a_job_reports_its_lag() -> None:
+    """The executor records the scheduled time before a worker can start it."""
+    monitor = JobMonitor()
+    scheduler = BackgroundScheduler(
+        executors=build_executors(monitor), job_defaults=JOB_DEFAULTS
+    )
+    monitor.attach(scheduler)
+    done = threading.Event()
+    scheduler.add_job(monitor.wrap("prices", done.set), id="prices", executor="prices")
+    scheduler.start()
+    try:
+        assert done.wait(5)
+    finally:
+        scheduler.shutdown()
+    assert monitor.report()["prices"]["last_lag"] is not None
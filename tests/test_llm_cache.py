@@ -0,0 +1,68 @@
+"""Tests for the persistent LLM response cache."""
+
+from unittest.mock import MagicMock, patch
+
+from live_trade_bench.utils.llm_cache import (
+    CacheMode,
+    LLMResponseCache,
+    cache_key,
+    configure_llm_cache,
+)
+from live_trade_bench.utils.llm_client import call_llm
+
+
+def _fake_litellm(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return MagicMock(completion=MagicMock(return_value=response))
+
+
+def test_cache_evicts_least_recently_used(tmp_path) -> None:
+    """Once over the size budget the oldest-used entries go first."""
+    cache = LLMResponseCache(str(tmp_path / "cache.sqlite"), max_bytes=10)
+    cache.put("a", "m", "12345")
+    cache.put("b", "m", "12345")
+    assert cache.get("a") == "12345"  # "a" is now the most recently used
+    cache.put("c", "m", "12345")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345"
+    assert cache.get("c") == "12345"
+    cache.close()
+
+
+def test_call_llm_cache_modes(tmp_path) -> None:
+    """read_write stores, read_only reads without storing, bypass skips the cache."""
+    messages = [{"role": "user", "content": "allocate"}]
+    configure_llm_cache(str(tmp_path / "cache.sqlite"))
+    try:
+        fake = _fake_litellm('{"allocations": {}}')
+        with patch.dict("sys.modules", {"litellm": fake}):
+            first = call_llm(messages, "openai/gpt-4o-mini")
+            second = call_llm(messages, "openai/gpt-4o-mini")
+            call_llm(messages, "openai/gpt-4o-mini", cache_mode=CacheMode.BYPASS)
+            call_llm(
+                [{"role": "user", "content": "new"}],
+                "openai/gpt-4o-mini",
+                cache_mode="read_only",
+            )
+            after_read_only = call_llm(
+                [{"role": "user", "content": "new"}],
+                "openai/gpt-4o-mini",
+                cache_mode="read_only",
+            )
+
+        assert first == {"success": True, "content": '{"allocations": {}}'}
+        assert second["cached"] is True
+        assert second["content"] == first["content"]
+        assert "cached" not in after_read_only
+        assert fake.completion.call_count == 4
+    finally:
+        configure_llm_cache(mode=CacheMode.BYPASS)
+
+
+def test_cache_key_depends_on_sampling_params() -> None:
+    messages = [{"role": "user", "content": "x"}]
+    assert cache_key("openai/gpt-4o", messages, 0.3, 100) != cache_key(
+        "openai/gpt-4o", messages, 0.0, 100
+    )
@@ -0,0 +1,73 @@
+"""Tests for the exchange trading calendars."""
+
+from datetime import date, datetime
+
+import pytz
+
+from live_trade_bench.utils.market_calendar import (
+    ALWAYS_OPEN,
+    NYSE,
+    nyse_early_closes,
+    nyse_holidays,
+)
+
+
+def test_nyse_holidays_and_session_counts() -> None:
+    """Observed holidays follow the NYSE rules, year session counts match."""
+    assert sorted(str(d) for d in nyse_holidays(2026)) == [
+        "2026-01-01",
+        "2026-01-19",
+        "2026-02-16",
+        "2026-04-03",
+        "2026-05-25",
+        "2026-06-19",
+        "2026-07-03",
+        "2026-09-07",
+        "2026-11-26",
+        "2026-12-25",
+    ]
+    # a Saturday New Year's Day is not observed on the Friday before
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert len(NYSE.sessions("2023-01-01", "2023-12-31")) == 250
+    assert len(NYSE.sessions("2024-01-01", "2024-12-31")) == 252
+    assert nyse_early_closes(2024) == {
+        date(2024, 7, 3),
+        date(2024, 11, 29),
+        date(2024, 12, 24),
+    }
+    assert len(ALWAYS_OPEN.sessions("2024-03-01", "2024-03-31")) == 31
+
+
+def test_nyse_open_hours_respect_early_closes() -> None:
+    """Christmas Eve closes at 13:00 ET and the next open skips Christmas."""
+    eve_afternoon = datetime(2024, 12, 24, 19, 0, tzinfo=pytz.UTC)  # 14:00 ET
+    assert NYSE.is_open(datetime(2024, 12, 24, 17, 0, tzinfo=pytz.UTC))
+    assert not NYSE.is_open(eve_afternoon)
+    assert NYSE.next_open(eve_afternoon) == NYSE.tz.localize(
+        datetime(2024, 12, 26, 9, 30)
+    )
+    assert NYSE.next_session("2024-03-28") == date(2024, 4, 1)
+
+
+def test_next_price_update_skips_holidays() -> None:
+    """After the close before Good Friday the next stock update is Monday's open."""
+    from backend.app.price_data import _compute_next_price_update_time
+
+    after_close = datetime(2024, 3, 28, 21, 0, tzinfo=pytz.UTC)
+    assert _compute_next_price_update_time("stock", after_close) == datetime(
+        2024, 4, 1, 13, 30, tzinfo=pytz.UTC
+    )
+
+
+def test_stock_hours_follow_market_hours_config(monkeypatch) -> None:
+    """The backend's stock calendar takes its session from MARKET_HOURS."""
+    from backend.app import config
+
+    hours = dict(config.MARKET_HOURS, stock_open="10:00", stock_close="15:00")
+    monkeypatch.setattr(config, "MARKET_HOURS", hours)
+    calendar = config.stock_calendar()
+    assert not calendar.is_open(datetime(2024, 4, 1, 13, 45, tzinfo=pytz.UTC))
+    assert calendar.is_open(datetime(2024, 4, 1, 14, 0, tzinfo=pytz.UTC))
+    assert not calendar.is_open(datetime(2024, 4, 1, 19, 30, tzinfo=pytz.UTC))
+    # holidays still come from the exchange rules
+    assert not calendar.is_session("2024-03-29")
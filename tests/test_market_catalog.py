@@ -0,0 +1,84 @@
+"""Tests for the indexed Polymarket market catalog."""
+
+from live_trade_bench.fetchers.market_catalog import PolymarketMarketCatalog
+
+
+def test_market_catalog_pages_once_and_indexes(tmp_path) -> None:
+    now = [1000.0]
+    pages = []
+
+    def fetch_page(params):
+        pages.append(params["offset"])
+        start = params["offset"]
+        rows = [
+            {
+                "id": str(i),
+                "question": f"Q{i}",
+                "clobTokenIds": f'["a{i}", "b{i}"]' if i % 3 else "[]",
+                "outcomes": '["Yes", "No"]',
+                "events": [{"slug": f"event-{i // 2}"}],
+            }
+            for i in range(start, min(start + 2, 5))
+        ]
+        return rows
+
+    catalog = PolymarketMarketCatalog(
+        root=str(tmp_path), fetch_page=fetch_page, page_size=2, clock=lambda: now[0]
+    )
+    # event-0 = markets 0 (no tokens) and 1; the first tradable one wins
+    assert catalog.by_event_slug("event-0")["id"] == "1"
+    assert catalog.by_event_slug("event-2")["token_ids"] == ["a4", "b4"]
+    assert catalog.by_id(3)["question"] == "Q3"
+    assert catalog.by_event_slug("missing") is None
+    assert pages == [0, 2, 4]
+
+    restored = PolymarketMarketCatalog(
+        root=str(tmp_path), fetch_page=fetch_page, clock=lambda: now[0]
+    )
+    assert restored.by_event_slug("event-1")["id"] == "2"
+    assert pages == [0, 2, 4]
+
+    now[0] += restored.ttl + 1
+    restored.by_id("1")
+    assert len(pages) == 4
+
+
+def test_market_catalog_keeps_previous_index_when_a_page_fails(tmp_path) -> None:
+    now = [1000.0]
+    fail_from = [None]
+
+    def fetch_page(params):
+        start = params["offset"]
+        if fail_from[0] is not None and start >= fail_from[0]:
+            raise RuntimeError("Markets API failed with status 502")
+        return [
+            {"id": str(i), "clobTokenIds": '["a"]', "events": [{"slug": f"e{i}"}]}
+            for i in range(start, min(start + 2, 5))
+        ]
+
+    catalog = PolymarketMarketCatalog(
+        root=str(tmp_path), fetch_page=fetch_page, page_size=2, clock=lambda: now[0]
+    )
+    assert catalog.by_event_slug("e4")["id"] == "4"
+
+    # the second page fails: the first page alone must not become the index
+    fail_from[0] = 2
+    now[0] += catalog.ttl + 1
+    catalog.refresh()
+    assert catalog.by_event_slug("e4")["id"] == "4"
+    restored = PolymarketMarketCatalog(
+        root=str(tmp_path), fetch_page=fetch_page, clock=lambda: 1000.0
+    )
+    assert restored.by_event_slug("e4")["id"] == "4"
+
+
+def test_market_catalog_persists_without_the_price_store(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "catalog.json"
+    monkeypatch.setenv("LTB_MARKET_CATALOG", str(path))
+    catalog = PolymarketMarketCatalog(
+        fetch_page=lambda params: [
+            {"id": "1", "clobTokenIds": '["a"]', "events": [{"slug": "e1"}]}
+        ]
+    )
+    assert catalog.by_id("1")["event_slug"] == "e1"
+    assert path.exists()
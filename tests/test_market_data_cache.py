@@ -0,0 +1,81 @@
+"""Tests for the live market data cache shared by the trading cycle and jobs."""
+
+import threading
+
+import pytest
+
+from live_trade_bench.fetchers.market_data_cache import MarketDataCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_market_data_cache_fetches_each_symbol_once_per_window() -> None:
+    clock = FakeClock()
+    cache = MarketDataCache(ttl=300, clock=clock)
+    calls = []
+    started, waiting = threading.Event(), threading.Event()
+
+    class ObservedEvent(threading.Event):
+        def wait(self, timeout=None):
+            waiting.set()
+            return super().wait(timeout)
+
+    def slow_fetch(symbols):
+        calls.append(list(symbols))
+        if len(calls) == 1:
+            # let the fetch finish only once the second caller waits on it
+            cache._inflight[("stock", "B")] = ObservedEvent()
+            started.set()
+            assert waiting.wait(5)
+        return {s: {"current_price": 1.0} for s in symbols}
+
+    results = {}
+    first = threading.Thread(
+        target=lambda: results.update(a=cache.get_many("stock", ["A", "B"], slow_fetch))
+    )
+    first.start()
+    started.wait(5)
+    # a second consumer waits for the in-flight fetch instead of repeating it
+    second = threading.Thread(
+        target=lambda: results.update(b=cache.get_many("stock", ["B"], slow_fetch))
+    )
+    second.start()
+    first.join()
+    second.join()
+    assert waiting.is_set()
+    assert calls == [["A", "B"]]
+    assert results["b"] == {"B": {"current_price": 1.0}}
+
+    assert cache.get_many("stock", ["A", "C"], slow_fetch).keys() == {"A", "C"}
+    clock.now += 301
+    cache.get_many("stock", ["A"], slow_fetch)
+    assert calls == [["A", "B"], ["C"], ["A"]]
+
+
+def test_market_data_cache_drops_symbols_a_refetch_misses() -> None:
+    clock = FakeClock()
+    cache = MarketDataCache(ttl=300, clock=clock)
+    prices = {"A": 1.0, "B": 2.0}
+
+    def fetch(symbols):
+        return {s: {"current_price": prices[s]} for s in symbols if s in prices}
+
+    assert cache.get_many("stock", ["A", "B"], fetch).keys() == {"A", "B"}
+    del prices["B"]
+    clock.now += 301
+    # B's old payload is not served in place of the failed refetch
+    assert cache.get_many("stock", ["A", "B"], fetch).keys() == {"A"}
+
+    def broken(symbols):
+        raise RuntimeError("upstream down")
+
+    clock.now += 301
+    with pytest.raises(RuntimeError):
+        cache.get_many("stock", ["A"], broken)
+    assert cache.get_many("stock", ["A"], lambda symbols: {}) == {}
@@ -0,0 +1,42 @@
+"""Tests for the shared per-cycle market snapshot."""
+
+import numpy as np
+import pytest
+
+from live_trade_bench.accounts import MarketSnapshot, create_stock_account
+
+
+def test_snapshot_is_a_read_only_mapping() -> None:
+    snapshot = MarketSnapshot.from_market_data(
+        {
+            "AAPL": {"current_price": 100.0},
+            "MSFT": {"current_price": 200.0},
+            "BAD": {"current_price": None},
+        }
+    )
+    assert dict(snapshot) == {"AAPL": 100.0, "MSFT": 200.0}
+    assert "BAD" not in snapshot
+    assert snapshot.get("BAD") is None
+    with pytest.raises(ValueError):
+        snapshot.prices[0] = 1.0
+
+    prices = snapshot.prices_for(["MSFT", "XOM"], fallback=np.array([0.0, 5.0]))
+    assert list(prices) == [200.0, 5.0]
+
+
+def test_accounts_value_and_rebalance_against_snapshot() -> None:
+    """Accounts price positions from the snapshot and accept it as price_map."""
+    account = create_stock_account(1000.0)
+    start = MarketSnapshot(["AAPL", "MSFT"], [100.0, 50.0])
+    account.apply_allocation({"AAPL": 0.5, "MSFT": 0.3, "CASH": 0.2}, price_map=start)
+
+    moved = MarketSnapshot(["AAPL", "MSFT"], [110.0, 40.0])
+    expected = 200.0 + 5 * 110.0 + 6 * 40.0
+    assert account.value_at(moved) == pytest.approx(expected)
+    assert account.get_total_value() == pytest.approx(1000.0)
+
+    account.mark_to_market(moved)
+    assert account.get_total_value() == pytest.approx(expected)
+    allocations = account.get_allocations()
+    assert allocations["AAPL"] == pytest.approx(550.0 / expected)
+    assert allocations["CASH"] == pytest.approx(200.0 / expected)
@@ -0,0 +1,56 @@
+"""Tests for the append-only per-model history log."""
+
+import json
+
+from backend.app.model_history import ModelHistoryLog
+
+
+def _model(model_id: str, n: int, category: str = "stock") -> dict:
+    history = [
+        {"timestamp": f"2024-01-{i + 1:02d}T00:00:00", "profit": i, "total_value": i}
+        for i in range(n)
+    ]
+    return {
+        "id": model_id,
+        "name": model_id,
+        "category": category,
+        "profitHistory": [{"timestamp": "x", "profit": 0}],
+        "allocationHistory": history,
+    }
+
+
+def test_history_log_appends_only_new_snapshots(tmp_path) -> None:
+    log = ModelHistoryLog(str(tmp_path))
+    assert not log.exists()
+    benchmark = _model("qqq-benchmark", 1, "benchmark")
+    # two agent snapshots, plus the benchmark's snapshot and profit point
+    assert log.save([_model("gpt-stock", 2), benchmark]) == 4
+    assert log.load(["qqq-benchmark"])[0]["profitHistory"] == benchmark["profitHistory"]
+    assert log.save([_model("gpt-stock", 3)]) == 1
+    # a partial save keeps the other models' headers
+    assert [m["id"] for m in log.load()] == ["gpt-stock", "qqq-benchmark"]
+
+    benchmark["profitHistory"].append({"timestamp": "y", "profit": 1})
+    assert log.save([benchmark]) == 1
+    assert "profitHistory" not in json.loads((tmp_path / "models.json").read_text())[1]
+    assert log.load(["qqq-benchmark"])[0]["profitHistory"][-1]["timestamp"] == "y"
+
+    segment = tmp_path / "gpt-stock.jsonl"
+    assert len(segment.read_text().splitlines()) == 3
+    with open(segment, "a") as f:
+        f.write('{"timestamp": "torn')
+
+    fresh = ModelHistoryLog(str(tmp_path))
+    (model,) = fresh.load(["gpt-stock"])
+    assert len(model["allocationHistory"]) == 3
+    assert model["profitHistory"][-1] == {
+        "timestamp": "2024-01-03T00:00:00",
+        "profit": 2,
+        "totalValue": 2,
+        "performance": 0,
+    }
+    assert fresh.save([_model("gpt-stock", 4)]) == 1
+    assert len(segment.read_text().splitlines()) == 4
+    assert fresh.save([_model("gpt-stock", 1)]) == 1
+    (model,) = ModelHistoryLog(str(tmp_path)).load(["gpt-stock"])
+    assert len(model["allocationHistory"]) == 1
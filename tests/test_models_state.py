@@ -0,0 +1,58 @@
+"""Tests for the in-memory models view and its price tick log."""
+
+import json
+import os
+
+from backend.app.data_store import JSONDataStore
+from backend.app.models_state import ModelsState, mark_model, replace_category
+
+
+def test_price_ticks_are_appended_and_replayed(tmp_path) -> None:
+    path = str(tmp_path / "models_data.json")
+    ticks = str(tmp_path / "ticks.jsonl")
+    model = {
+        "id": "m1",
+        "category": "stock",
+        "portfolio": {
+            "cash": 100.0,
+            "positions": {"AAPL": {"quantity": 2.0, "current_price": 10.0}},
+        },
+        "profitHistory": [],
+    }
+    JSONDataStore().write_json(path, [model])
+    on_disk = os.path.getmtime(path)
+
+    store = JSONDataStore()
+    state = ModelsState(path, ticks, store=store)
+    original = state.models()
+    state.commit(
+        [
+            mark_model(original[0], {"AAPL": 20.0}, 100.0, "2025-09-01T10:00:00"),
+            mark_model(original[0], {"AAPL": 25.0}, 100.0, "2025-09-01T10:10:00"),
+            replace_category("benchmark", [{"id": "qqq-benchmark"}]),
+        ]
+    )
+    # the file is untouched; the API cache and memory see the update
+    assert os.path.getmtime(path) == on_disk
+    assert original[0]["portfolio"]["positions"]["AAPL"]["current_price"] == 10.0
+    served = store.get(path).data
+    assert served[0]["portfolio"]["total_value"] == 150.0
+    assert served[0]["profitHistory"] == [
+        {"timestamp": "2025-09-01T10:10:00", "profit": 50.0, "totalValue": 150.0}
+    ]
+    assert state.has_model(["qqq-benchmark"])
+
+    # a restart replays the ticks on top of the file they were recorded against
+    restarted = ModelsState(path, ticks, store=JSONDataStore())
+    assert restarted.models() == served
+    restarted.checkpoint()
+    assert not os.path.exists(ticks)
+    with open(path) as f:
+        assert json.load(f) == served
+
+    # a rewrite by the trading cycle supersedes pending ticks
+    state = ModelsState(path, ticks, store=store)
+    state.commit([mark_model(served[0], {"AAPL": 30.0}, 100.0)])
+    store.write_json(path, [model])
+    assert state.models() == [model]
+    assert ModelsState(path, ticks, store=JSONDataStore()).models() == [model]
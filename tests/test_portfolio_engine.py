@@ -0,0 +1,123 @@
+"""Tests for the shared portfolio engine behind the accounts."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from live_trade_bench.accounts import (
+    MarketSnapshot,
+    PortfolioEngine,
+    Position,
+    create_stock_account,
+)
+from live_trade_bench.accounts.stock_account import StockAccount
+from live_trade_bench.systems.stock_system import StockPortfolioSystem
+
+
+def test_accounts_share_engine_rows() -> None:
+    engine = PortfolioEngine()
+    a = create_stock_account(1000.0, engine=engine)
+    b = create_stock_account(500.0, engine=engine)
+    a.apply_allocation({"AAPL": 0.5, "CASH": 0.5}, price_map={"AAPL": 100.0})
+    b.apply_allocation({"MSFT": 1.0}, price_map={"MSFT": 50.0})
+
+    assert engine.n_rows == 2
+    assert a.positions["AAPL"].quantity == pytest.approx(5.0)
+    assert "AAPL" not in b.positions
+    assert b.cash_balance == pytest.approx(0.0)
+
+    engine.mark_to_market(MarketSnapshot.from_price_map({"AAPL": 120.0, "MSFT": 40.0}))
+    np.testing.assert_allclose(engine.total_values(), [1100.0, 400.0])
+    assert a.get_total_value() == pytest.approx(1100.0)
+    assert b.get_allocations() == {"MSFT": pytest.approx(1.0), "CASH": 0.0}
+
+
+def test_cash_balance_is_a_constructor_argument_kept_in_the_engine() -> None:
+    account = StockAccount(initial_cash=100.0, cash_balance=80.0)
+    engine, row = account._book()
+    assert engine.cash[row] == 80.0
+    account.cash_balance = 60.0
+    assert engine.cash[row] == 60.0 and account.get_total_value() == 60.0
+
+
+def test_engine_compact_drops_unheld_columns() -> None:
+    engine = PortfolioEngine(col_capacity=2)
+    a = create_stock_account(1000.0, engine=engine)
+    b = create_stock_account(1000.0, engine=engine)
+    for day in range(10):
+        # rotating markets: every refresh brings new symbols
+        prices = {f"M{day}": 1.0, "KEEP": 2.0}
+        a.apply_allocation(
+            {f"M{day}": 1.0},
+            price_map=prices,
+            metadata_map={f"M{day}": {"url": f"https://m/{day}"}},
+        )
+        b.apply_allocation({"KEEP": 1.0}, price_map=prices)
+        engine.compact()
+
+    assert sorted(engine.symbols) == ["KEEP", "M9"]
+    assert engine._quantity.shape[1] <= 4
+    assert a.positions["M9"].quantity == pytest.approx(1000.0)
+    assert a.positions["M9"].url == "https://m/9"
+    assert b.positions["KEEP"].quantity == pytest.approx(500.0)
+    np.testing.assert_allclose(engine.total_values(), [1000.0, 1000.0])
+
+
+def test_positions_view_accepts_position_objects() -> None:
+    account = create_stock_account(1000.0)
+    account.cash_balance = 200.0
+    account.positions["AAPL"] = Position("AAPL", 4.0, 150.0, 200.0, url="u")
+
+    assert account.get_total_value() == pytest.approx(1000.0)
+    assert account.serialize_positions()["AAPL"]["url"] == "u"
+
+    engine = PortfolioEngine()
+    account.attach(engine)
+    assert engine.cash[0] == pytest.approx(200.0)
+    assert account.positions["AAPL"].average_price == pytest.approx(150.0)
+    del account.positions["AAPL"]
+    assert account.get_positions() == {}
+
+
+def test_system_rebalances_every_account_in_one_engine_call() -> None:
+    system = StockPortfolioSystem()
+    for name in ("a", "b", "c"):
+        system.add_agent(name, initial_cash=1000.0, model_name=f"model-{name}")
+    market_data = {
+        "AAPL": {"current_price": 100.0},
+        "MSFT": {"current_price": 50.0},
+    }
+    allocations = {
+        "a": {"AAPL": 1.0},
+        "b": {"AAPL": 0.5, "MSFT": 0.5},
+        "c": {"CASH": 1.0},
+    }
+
+    with patch.object(
+        PortfolioEngine,
+        "rebalance",
+        autospec=True,
+        side_effect=PortfolioEngine.rebalance,
+    ) as rebalance:
+        system._update_accounts(allocations, market_data)
+
+    assert rebalance.call_count == 1
+    assert system.accounts["a"].positions["AAPL"].quantity == pytest.approx(10.0)
+    assert system.accounts["b"].positions["MSFT"].quantity == pytest.approx(10.0)
+    assert system.accounts["c"].cash_balance == pytest.approx(1000.0)
+    assert all(len(a.allocation_history) == 1 for a in system.accounts.values())
+
+
+def test_rebalance_values_only_its_rows() -> None:
+    """Rows outside the rebalance keep their stale marks and holdings."""
+    engine = PortfolioEngine()
+    a = create_stock_account(1000.0, engine=engine)
+    b = create_stock_account(1000.0, engine=engine)
+    a.apply_allocation({"AAPL": 1.0}, price_map={"AAPL": 100.0})
+    b.apply_allocation({"AAPL": 1.0}, price_map={"AAPL": 100.0})
+
+    engine.rebalance([1], [{"CASH": 1.0}], {"AAPL": 80.0})
+    assert b.cash_balance == pytest.approx(800.0)
+    assert a.positions["AAPL"].current_price == pytest.approx(100.0)
+    assert a.get_total_value() == pytest.approx(1000.0)
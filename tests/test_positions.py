@@ -0,0 +1,52 @@
+"""Tests for the slotted position records and the struct-of-arrays PositionBook."""
+
+import pickle
+import uuid
+from dataclasses import FrozenInstanceError, asdict
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from live_trade_bench.accounts import Position, Transaction, create_stock_account
+
+
+def test_slotted_position_and_frozen_transaction() -> None:
+    position = Position("AAPL", 2.0, 10.0, 12.0)
+    assert not hasattr(position, "__dict__")
+    assert position.url is None
+    position.current_price = 15.0
+    assert position.unrealized_pnl == pytest.approx(10.0)
+    assert asdict(position)["current_price"] == 15.0
+
+    txn = Transaction(uuid.uuid4(), "AAPL", 2.0, 10.0, "buy", datetime(2024, 1, 2))
+    with pytest.raises(FrozenInstanceError):
+        txn.price = 11.0  # type: ignore[misc]
+    assert pickle.loads(pickle.dumps(txn)) == txn
+
+
+def test_position_book_serializes_from_arrays() -> None:
+    account = create_stock_account(1000.0)
+    account.apply_allocation(
+        {"AAPL": 0.4, "MSFT": 0.6},
+        price_map={"AAPL": 100.0, "MSFT": 200.0},
+        metadata_map={"MSFT": {"url": "m"}},
+    )
+    book = account.position_book()
+    assert book.symbol_ids.dtype == np.int32
+    assert book.total_value() == pytest.approx(1000.0)
+    assert account.serialize_positions() == {
+        "AAPL": {
+            "symbol": "AAPL",
+            "quantity": 4.0,
+            "average_price": 100.0,
+            "current_price": 100.0,
+        },
+        "MSFT": {
+            "symbol": "MSFT",
+            "quantity": 3.0,
+            "average_price": 200.0,
+            "current_price": 200.0,
+            "url": "m",
+        },
+    }
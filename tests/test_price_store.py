@@ -0,0 +1,74 @@
+"""Tests for the on-disk daily price store."""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+from live_trade_bench.fetchers.price_store import (
+    PriceStore,
+    disable_price_store,
+    enable_price_store,
+)
+
+
+def test_missing_ranges_and_round_trip(tmp_path) -> None:
+    """Only uncovered days are reported missing and bars survive a reload."""
+    store = PriceStore(str(tmp_path))
+    assert [
+        (str(a), str(b))
+        for a, b in store.missing_ranges("yfinance", "AAPL", "2024-01-01", "2024-01-10")
+    ] == [("2024-01-01", "2024-01-10")]
+
+    store.write(
+        "yfinance",
+        "AAPL",
+        ["2024-01-03", "2024-01-04"],
+        {"close": [100.0, 101.0]},
+        covered=("2024-01-03", "2024-01-05"),
+    )
+    gaps = store.missing_ranges("yfinance", "AAPL", "2024-01-01", "2024-01-10")
+    assert [(str(a), str(b)) for a, b in gaps] == [
+        ("2024-01-01", "2024-01-02"),
+        ("2024-01-06", "2024-01-10"),
+    ]
+
+    reloaded = PriceStore(str(tmp_path))
+    bars = reloaded.read("yfinance", "AAPL", "2024-01-01", "2024-01-10")
+    assert [str(d) for d in bars["date"]] == ["2024-01-03", "2024-01-04"]
+    assert list(bars["close"]) == [100.0, 101.0]
+
+
+def test_today_is_never_marked_covered(tmp_path) -> None:
+    """The current day's bar is still moving, so it stays a gap."""
+    store = PriceStore(str(tmp_path))
+    today = pd.Timestamp.now("UTC").strftime("%Y-%m-%d")
+    store.write("bitmex", "XBTUSD", [today], {"close": [1.0]}, covered=(today, today))
+    assert store.missing_ranges("bitmex", "XBTUSD", today, today)
+
+
+@patch("live_trade_bench.fetchers.stock_fetcher.yf.download")
+def test_stock_history_is_read_through(mock_download: Mock, tmp_path) -> None:
+    """A second overlapping window only downloads the day it is missing."""
+    index = pd.to_datetime(["2024-01-08", "2024-01-09", "2024-01-10"])
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], ["AAPL"]])
+    mock_download.return_value = pd.DataFrame(
+        [[100.0, 10], [101.0, 11], [102.0, 12]], index=index, columns=columns
+    )
+
+    from live_trade_bench.fetchers.stock_fetcher import StockFetcher
+
+    enable_price_store(str(tmp_path))
+    try:
+        fetcher = StockFetcher()
+        first = fetcher.get_prices_with_history(["AAPL"], "2024-01-10")
+        second = fetcher.get_prices_with_history(["AAPL"], "2024-01-09")
+    finally:
+        disable_price_store()
+
+    assert mock_download.call_count == 2
+    second_call = mock_download.call_args.kwargs
+    assert second_call["start"] == "2023-12-29"
+    assert second_call["end"] == "2023-12-30"
+    assert first["AAPL"]["current_price"] == 102.0
+    assert second["AAPL"]["current_price"] == 101.0
+    assert [p["price"] for p in second["AAPL"]["price_history"]] == [100.0]
@@ -0,0 +1,27 @@
+"""Tests for the short-TTL stock quote cache."""
+
+from live_trade_bench.fetchers.quote_cache import QuoteCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_quote_cache_fetches_only_stale_symbols() -> None:
+    clock = FakeClock()
+    cache = QuoteCache(ttl=60, clock=clock)
+    calls = []
+
+    def fetch(symbols):
+        calls.append(list(symbols))
+        return {s: 1.0 + len(calls) for s in symbols if s != "BAD"}
+
+    assert cache.get_many(["A", "B", "BAD"], fetch) == {"A": 2.0, "B": 2.0}
+    assert cache.get_many(["A", "C"], fetch) == {"A": 2.0, "C": 3.0}
+    clock.now += 61
+    assert cache.get_many(["A", "C"], fetch) == {"A": 4.0, "C": 4.0}
+    assert calls == [["A", "B", "BAD"], ["C"], ["A", "C"]]
@@ -0,0 +1,19 @@
+"""Tests for the lazy startup readiness state."""
+
+from backend.app.startup import StartupState
+
+
+def test_startup_state_reports_phases() -> None:
+    state = StartupState()
+    assert state.report()["status"] == "pending"
+    with state.phase_timer("load_history"):
+        assert state.report() == {
+            "status": "initializing",
+            "phase": "load_history",
+            "error": None,
+            "timings": {},
+        }
+    assert not state.wait(timeout=0)
+    state.mark_ready()
+    assert state.wait(timeout=0)
+    assert set(state.report()["timings"]) == {"load_history", "total"}
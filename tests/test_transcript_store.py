@@ -0,0 +1,41 @@
+"""Tests for the out-of-line LLM transcript store."""
+
+import os
+
+from backend.app import models_data
+from live_trade_bench.accounts import (
+    configure_transcript_store,
+    create_stock_account,
+    load_transcript,
+)
+
+
+def test_transcripts_are_stored_out_of_line(tmp_path) -> None:
+    store = configure_transcript_store(str(tmp_path / "transcripts"))
+    try:
+        account = create_stock_account(1000.0)
+        account.record_allocation(
+            llm_input={"prompt": "p" * 5000}, llm_output={"content": "ok"}
+        )
+        account.record_allocation()
+        first, second = account.allocation_history
+        assert "llm_input" not in first and second["transcript_id"] is None
+        assert load_transcript(first)["llm_input"]["prompt"] == "p" * 5000
+        assert first["transcript_id"] in store
+
+        legacy = {"timestamp": "t", "llm_input": {"prompt": "old"}, "llm_output": None}
+        history = models_data._externalize_transcripts([legacy, dict(first)])
+        assert "llm_input" not in history[0]
+        view = models_data._strip_llm_data_except_last(history)
+        assert "llm_input" not in view[0]
+        assert view[1]["llm_output"] == {"content": "ok"}
+        assert load_transcript(history[0])["llm_input"] == {"prompt": "old"}
+
+        # externalizing the same legacy snapshot again reuses its blob
+        again = models_data._externalize_transcripts(
+            [{"timestamp": "t", "llm_input": {"prompt": "old"}, "llm_output": None}]
+        )
+        assert again[0]["transcript_id"] == history[0]["transcript_id"]
+        assert sum(len(files) for _, _, files in os.walk(store.root)) == 2
+    finally:
+        configure_transcript_store(None)